@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+Benchmarks voor de FLL Tournament Scheduler
+Vergelijkt model formuleringen op aantal variabelen, constraints en bouwtijd.
+
+Gebruik:
+    python benchmark.py opponents --num-teams 40 --num-timeslots 50
+    python benchmark.py symmetry --num-teams 12 --num-tables 4 --num-jury-rooms 4
+    python benchmark.py objective --num-teams 6 --num-tables 4 --num-jury-rooms 2 --num-timeslots 40
+    python benchmark.py workers --max-workers 16
+    python benchmark.py output schedule-complete-2025-01-01T10-00-00.json
+    python benchmark.py scaling --num-teams 10:80:10 --num-tables 6,8 --time 60 --output scaling.json
+    python benchmark.py scaling --num-teams 10:40:10 --compare scaling.json
+"""
+import argparse
+import io
+import itertools
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from cpus import available_cpus
+from run_scheduler_with_params import add_config_arguments, config_overrides
+from scheduler import Scheduler, SchedulerConfig
+
+
+def model_size(model):
+    """Aantal variabelen en constraints in een CP-SAT model"""
+    proto = model.proto
+    return len(proto.variables), len(proto.constraints)
+
+
+def variant(scheduler_config, **settings):
+    """Stille Scheduler voor de basis configuratie met {CONFIG_NAAM: waarde} (bijv. OPPONENT_MODEL)"""
+    changes = {name.lower(): value for name, value in settings.items()}
+    return Scheduler(scheduler_config.replace(**changes), quiet=True)
+
+
+def measure_build(scheduler_config, **settings):
+    """Bouwt het model met de gegeven instellingen en meet bouwtijd en grootte"""
+    scheduler = variant(scheduler_config, **settings)
+    start = time.perf_counter()
+    built = scheduler.build()
+    build_time = time.perf_counter() - start
+
+    if built is None:
+        return None
+
+    num_variables, num_constraints = model_size(built['model'])
+    return {
+        'settings': settings,
+        'variables': num_variables,
+        'constraints': num_constraints,
+        'buildTime': round(build_time, 3),
+    }
+
+
+def measure_solve(scheduler_config, **settings):
+    """Lost het model op met de gegeven instellingen en meet tijd tot eerste en optimale oplossing"""
+    from ortools.sat.python import cp_model
+
+    result = variant(scheduler_config, **settings).solve()
+
+    if result is None:
+        return {'settings': settings, 'status': 'GEEN OPLOSSING'}
+
+    solver = result['solver']
+    return {
+        'settings': settings,
+        'status': solver.status_name(result['status']),
+        'objective': result['objective_value'],
+        'firstSolutionTime': round(result['first_solution_time'], 3),
+        'solveTime': round(result['solve_time'], 3),
+        'optimalTime': round(result['solve_time'], 3) if result['status'] == cp_model.OPTIMAL else None,
+    }
+
+
+def print_rows(title, rows):
+    """Print benchmark resultaten als tabel"""
+    print(f"\n📏 {title}")
+    print("=" * 70)
+    print(f"{'Variant':<24} {'Variabelen':>12} {'Constraints':>12} {'Bouwtijd':>12}")
+    print("-" * 70)
+    for row in rows:
+        label = ", ".join(str(value) for value in row['settings'].values())
+        print(f"{label:<24} {row['variables']:>12,} {row['constraints']:>12,} {row['buildTime']:>11.2f}s")
+    print("=" * 70)
+
+
+def benchmark_opponents(args, scheduler_config):
+    """Vergelijkt de 'reified' en 'compact' formulering van unieke tegenstanders"""
+    rows = []
+    for opponent_model in ("reified", "compact"):
+        row = measure_build(scheduler_config, OPPONENT_MODEL=opponent_model)
+        if row is None:
+            print("❌ Model kon niet gebouwd worden (capaciteit)")
+            sys.exit(1)
+        rows.append(row)
+
+    print_rows("Unieke tegenstanders: reified vs compact", rows)
+    return rows
+
+
+def benchmark_symmetry(args, scheduler_config):
+    """Vergelijkt oplostijden met en zonder symmetry breaking"""
+    rows = [measure_solve(scheduler_config, SYMMETRY_BREAKING=enabled) for enabled in (False, True)]
+
+    print("\n⏱️  Symmetry breaking: uit vs aan")
+    print("=" * 70)
+    print(f"{'Symmetry breaking':<20} {'Status':<12} {'Doel':>12} {'Eerste opl.':>12} {'Optimaal':>10}")
+    print("-" * 70)
+    for row in rows:
+        label = 'aan' if row['settings']['SYMMETRY_BREAKING'] else 'uit'
+        if 'objective' not in row:
+            print(f"{label:<20} {row['status']:<12}")
+            continue
+        optimal = f"{row['optimalTime']:.2f}s" if row['optimalTime'] is not None else '-'
+        print(f"{label:<20} {row['status']:<12} {row['objective']:>12,.0f} "
+              f"{row['firstSolutionTime']:>11.2f}s {optimal:>10}")
+    print("=" * 70)
+    return rows
+
+
+def benchmark_objective(args, scheduler_config):
+    """Regressie check: 'linear' en 'reified' doel moeten dezelfde optimale doelwaarde geven"""
+    rows = []
+    for objective_model in ("reified", "linear"):
+        row = measure_build(scheduler_config, OBJECTIVE_MODEL=objective_model)
+        if row is None:
+            print("❌ Model kon niet gebouwd worden (capaciteit)")
+            sys.exit(1)
+        row.update(measure_solve(scheduler_config, OBJECTIVE_MODEL=objective_model))
+        rows.append(row)
+
+    print_rows("Doel formulering: reified vs linear", rows)
+    print(f"\n{'Variant':<24} {'Status':<12} {'Doel':>12} {'Oplostijd':>12}")
+    print("-" * 70)
+    for row in rows:
+        if 'objective' not in row:
+            print(f"{row['settings']['OBJECTIVE_MODEL']:<24} {row['status']:<12}")
+            continue
+        print(f"{row['settings']['OBJECTIVE_MODEL']:<24} {row['status']:<12} "
+              f"{row['objective']:>12,.0f} {row['solveTime']:>11.2f}s")
+    print("=" * 70)
+
+    reified, linear = rows
+    print(f"Variabelen: -{1 - linear['variables'] / reified['variables']:.0%}, "
+          f"constraints: -{1 - linear['constraints'] / reified['constraints']:.0%}")
+    if reified['status'] == 'OPTIMAL' and linear['status'] == 'OPTIMAL':
+        if reified['objective'] != linear['objective']:
+            print(f"❌ Optimale doelwaarden verschillen: {reified['objective']:,.0f} vs {linear['objective']:,.0f}")
+            sys.exit(1)
+        print(f"✅ Zelfde optimale doelwaarde: {linear['objective']:,.0f}")
+    else:
+        print("⚠️  Niet beide varianten optimaal opgelost, doelwaarden niet vergeleken "
+              "(verhoog MAX_SOLVE_TIME of kies een kleiner toernooi)")
+    return rows
+
+
+def worker_counts(max_workers):
+    """1, 2, 4, 8, ... tot en met max_workers"""
+    counts = []
+    workers = 1
+    while workers < max_workers:
+        counts.append(workers)
+        workers *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def benchmark_workers(args, scheduler_config):
+    """Schaalcurve: oplostijd en doelwaarde bij 1 tot N CP-SAT workers"""
+    max_workers = args.max_workers or available_cpus()
+    rows = [measure_solve(scheduler_config, NUM_SEARCH_WORKERS=workers)
+            for workers in worker_counts(max_workers)]
+
+    print(f"\n🧵 Schaalcurve CP-SAT workers ({available_cpus()} CPUs beschikbaar)")
+    print("=" * 70)
+    print(f"{'Workers':>8} {'Status':<12} {'Doel':>12} {'Eerste opl.':>12} {'Oplostijd':>10} {'Versnelling':>12}")
+    print("-" * 70)
+    # Versnelling alleen t.o.v. een optimale run met 1 worker (anders meten we de tijdslimiet)
+    baseline = rows[0].get('optimalTime')
+    for row in rows:
+        workers = row['settings']['NUM_SEARCH_WORKERS']
+        if 'objective' not in row:
+            print(f"{workers:>8} {row['status']:<12}")
+            continue
+        speedup = f"{baseline / row['optimalTime']:.2f}x" if baseline and row['optimalTime'] else '-'
+        print(f"{workers:>8} {row['status']:<12} {row['objective']:>12,.0f} "
+              f"{row['firstSolutionTime']:>11.2f}s {row['solveTime']:>9.2f}s {speedup:>12}")
+    print("=" * 70)
+    if not baseline:
+        print("⚠️  1 worker niet optimaal opgelost: vergelijk de doelwaarden bij dezelfde tijdslimiet")
+    return rows
+
+
+def benchmark_output(args, scheduler_config):
+    """Bestandsgrootte en schrijf/lees tijd van de opslagformaten voor een bestaand schema"""
+    from schedule_format import dump_schedule, expand_schedule, load_schedule
+
+    output = load_schedule(args.schedule)
+    variants = [
+        ('verbose', False, False),
+        ('verbose minified', False, True),
+        ('compact', True, False),
+        ('compact minified', True, True),
+    ]
+
+    rows = []
+    for label, compact, minify in variants:
+        buffer = io.StringIO()
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            buffer = io.StringIO()
+            dump_schedule(output, buffer, compact=compact, minify=minify)
+        write_time = (time.perf_counter() - start) / args.repeat
+        text = buffer.getvalue()
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            parsed = json.loads(text)
+            if compact:
+                parsed = expand_schedule(parsed)
+        read_time = (time.perf_counter() - start) / args.repeat
+
+        if parsed != output:
+            print(f"❌ {label}: ingelezen schema verschilt van het origineel")
+            sys.exit(1)
+        rows.append({
+            'format': label,
+            'bytes': len(text.encode('utf-8')),
+            'writeMs': round(write_time * 1000, 3),
+            'readMs': round(read_time * 1000, 3),
+        })
+
+    print(f"\n💾 Opslagformaten ({len(output['teamTableAllocationList'])} matches, "
+          f"{len(output['tableTimeslotList'])} tafel tijdsloten)")
+    print("=" * 70)
+    print(f"{'Formaat':<20} {'Grootte':>12} {'Relatief':>10} {'Schrijven':>12} {'Lezen':>12}")
+    print("-" * 70)
+    for row in rows:
+        print(f"{row['format']:<20} {row['bytes']:>12,} {row['bytes'] / rows[0]['bytes']:>9.1%} "
+              f"{row['writeMs']:>10.2f}ms {row['readMs']:>10.2f}ms")
+    print("=" * 70)
+    print("✅ Alle formaten lezen terug naar hetzelfde schema")
+    return rows
+
+
+def run_scaling_job(scheduler_config, settings, max_time, num_workers):
+    """Bouwt en lost 1 toernooi grootte op in een eigen proces (zodat het piek geheugen klopt)"""
+    from ortools.sat.python import cp_model
+    from profiler import BuildProfiler, peak_memory_mb
+
+    scheduler = variant(scheduler_config, **settings, MAX_SOLVE_TIME=max_time,
+                        NUM_SEARCH_WORKERS=num_workers, PROFILE_BUILD=True)
+
+    start = time.perf_counter()
+    result = scheduler.solve()
+    total_time = time.perf_counter() - start
+
+    if result is not None:
+        report = result['profiler'].report()
+    else:
+        # Geen oplossing: het model alsnog bouwen voor de bouwtijd en modelgrootte
+        profiler = BuildProfiler(enabled=True)
+        report = profiler.report() if scheduler.build(profiler) is not None else None
+
+    row = dict(settings)
+    row.update({
+        'buildTime': report['buildTime'] if report else None,
+        'variables': report['variables'] if report else None,
+        'constraints': report['constraints'] if report else None,
+        'peakRssMb': peak_memory_mb(),
+        'status': 'GEEN OPLOSSING',
+        'objective': None,
+        'firstSolutionTime': None,
+        'solveTime': None,
+        'totalTime': round(total_time, 3),
+    })
+    if result is not None:
+        row.update({
+            'status': 'OPTIMAL' if result['status'] == cp_model.OPTIMAL else 'FEASIBLE',
+            'objective': result['objective_value'],
+            'firstSolutionTime': round(result['first_solution_time'], 3)
+            if result['first_solution_time'] is not None else None,
+            'solveTime': round(result['solve_time'], 3),
+        })
+    return row
+
+
+SCALING_GRID = {
+    'num_teams': 'NUM_TEAMS',
+    'num_tables': 'NUM_TABLES',
+    'num_jury_rooms': 'NUM_JURY_ROOMS',
+}
+
+
+def print_scaling_rows(rows, previous=None):
+    """Print de schaal resultaten; met een vorige run ook het verschil in bouwtijd en doelwaarde"""
+    print("\n📈 Schaal benchmark")
+    print("=" * 112)
+    print(f"{'Teams':>5} {'Tafels':>6} {'Jury':>4} {'Bouwtijd':>9} {'Geheugen':>9} {'Variabelen':>11} "
+          f"{'Constraints':>12} {'Eerste opl.':>11} {'Status':>15} {'Doel':>12}")
+    print("-" * 112)
+    for row in rows:
+        build = f"{row['buildTime']:.2f}s" if row['buildTime'] is not None else '-'
+        variables = f"{row['variables']:,}" if row['variables'] is not None else '-'
+        constraints = f"{row['constraints']:,}" if row['constraints'] is not None else '-'
+        first = f"{row['firstSolutionTime']:.2f}s" if row['firstSolutionTime'] is not None else '-'
+        objective = f"{row['objective']:,}" if row['objective'] is not None else '-'
+        memory = f"{row['peakRssMb']:.0f}MB" if row['peakRssMb'] is not None else '-'
+        print(f"{row['NUM_TEAMS']:>5} {row['NUM_TABLES']:>6} {row['NUM_JURY_ROOMS']:>4} {build:>9} "
+              f"{memory:>9} {variables:>11} {constraints:>12} {first:>11} "
+              f"{row['status']:>15} {objective:>12}")
+
+        before = (previous or {}).get(scaling_row_key(row))
+        if before is not None:
+            changes = []
+            if before['buildTime'] and row['buildTime'] is not None:
+                changes.append(f"bouwtijd {row['buildTime'] / before['buildTime'] - 1:+.0%}")
+            if before['variables'] and row['variables'] is not None:
+                changes.append(f"variabelen {row['variables'] - before['variables']:+,}")
+            if before['objective'] is not None and row['objective'] is not None:
+                changes.append(f"doel {row['objective'] - before['objective']:+,}")
+            if before['status'] != row['status']:
+                changes.append(f"status {before['status']} -> {row['status']}")
+            print(f"{'':>17} t.o.v. vorige run: {', '.join(changes) or 'geen verschil'}")
+    print("=" * 112)
+
+
+def scaling_row_key(row):
+    return tuple(row[name] for name in SCALING_GRID.values())
+
+
+def benchmark_scaling(args, scheduler_config):
+    """Bouwtijd, geheugen, modelgrootte en oplos resultaat over een grid van toernooi groottes"""
+    import ortools
+    from result_cache import code_version
+    from sweep import parse_values
+
+    grid = {}
+    for option, name in SCALING_GRID.items():
+        text = getattr(args, option)
+        grid[name] = parse_values(text) if text is not None else [getattr(scheduler_config, name.lower())]
+    fixed = {}
+    if args.num_timeslots is not None:
+        fixed['NUM_TIMESLOTS'] = args.num_timeslots
+    if args.end_time is not None:
+        fixed['END_TIME'] = None if args.end_time.lower() == 'none' else int(args.end_time)
+    if args.mode is not None:
+        fixed['SCHEDULER_MODE'] = args.mode
+
+    combinations = [dict(zip(grid, values), **fixed) for values in itertools.product(*grid.values())]
+    num_workers = args.workers or available_cpus()
+    print(f"📈 Schaal benchmark: {len(combinations)} toernooi groottes, max {args.time:g}s per grootte, "
+          f"{num_workers} workers")
+
+    # Elke grootte in een vers proces: piek geheugen (ru_maxrss) is per proces
+    context = multiprocessing.get_context('spawn')
+    rows = []
+    with ProcessPoolExecutor(max_workers=1, mp_context=context, max_tasks_per_child=1) as executor:
+        for settings in combinations:
+            row = executor.submit(run_scaling_job, scheduler_config, settings, args.time, num_workers).result()
+            rows.append(row)
+            print(f"   [{len(rows)}/{len(combinations)}] {row['NUM_TEAMS']} teams, {row['NUM_TABLES']} tafels, "
+                  f"{row['NUM_JURY_ROOMS']} jury rooms: {row['status']} na {row['totalTime']:.1f}s")
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = {scaling_row_key(row): row for row in json.load(f)['rows']}
+    print_scaling_rows(rows, previous)
+
+    return {
+        'meta': {
+            'codeVersion': code_version(),
+            'ortools': ortools.__version__,
+            'python': sys.version.split()[0],
+            'cpus': available_cpus(),
+            'workers': num_workers,
+            'maxSolveTime': args.time,
+            'settings': fixed,
+            'created': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        'rows': rows,
+    }
+
+
+BENCHMARKS = {
+    'opponents': benchmark_opponents,
+    'symmetry': benchmark_symmetry,
+    'objective': benchmark_objective,
+    'workers': benchmark_workers,
+    'output': benchmark_output,
+    'scaling': benchmark_scaling,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks voor de FLL Tournament Scheduler')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    opponents_parser = subparsers.add_parser(
+        'opponents', help='Modelgrootte en bouwtijd van de tegenstander formuleringen')
+    add_config_arguments(opponents_parser)
+    opponents_parser.add_argument('--output', type=str, help='Schrijf de resultaten naar dit JSON bestand')
+
+    symmetry_parser = subparsers.add_parser(
+        'symmetry', help='Tijd tot eerste en optimale oplossing met en zonder symmetry breaking')
+    add_config_arguments(symmetry_parser)
+    symmetry_parser.add_argument('--output', type=str, help='Schrijf de resultaten naar dit JSON bestand')
+
+    objective_parser = subparsers.add_parser(
+        'objective', help='Modelgrootte, oplostijd en optimale doelwaarde van de doel formuleringen')
+    add_config_arguments(objective_parser)
+    objective_parser.add_argument('--output', type=str, help='Schrijf de resultaten naar dit JSON bestand')
+
+    workers_parser = subparsers.add_parser(
+        'workers', help='Schaalcurve van oplostijd en doelwaarde bij 1 tot N CP-SAT workers')
+    add_config_arguments(workers_parser)
+    workers_parser.add_argument('--max-workers', type=int,
+                                help='Hoogste aantal workers (standaard: beschikbare CPUs)')
+    workers_parser.add_argument('--output', type=str, help='Schrijf de resultaten naar dit JSON bestand')
+
+    output_parser = subparsers.add_parser(
+        'output', help='Bestandsgrootte en schrijf/lees tijd van gewoon vs compact schema formaat')
+    add_config_arguments(output_parser)
+    output_parser.add_argument('schedule', type=str, help='Gegenereerd schema (JSON)')
+    output_parser.add_argument('--repeat', type=int, default=20, help='Aantal herhalingen per meting')
+    output_parser.add_argument('--output', type=str, help='Schrijf de resultaten naar dit JSON bestand')
+
+    scaling_parser = subparsers.add_parser(
+        'scaling', help='Bouwtijd, geheugen, modelgrootte en oplos resultaat over een grid van toernooi groottes')
+    scaling_parser.add_argument('--num-teams', type=str, default='10:80:10',
+                                help='Aantal teams, bijv. 10:80:10 (standaard) of 20,40')
+    scaling_parser.add_argument('--num-tables', type=str, help='Aantal tafels, bijv. 6,8')
+    scaling_parser.add_argument('--num-jury-rooms', type=str, help='Aantal jury rooms, bijv. 5:8')
+    scaling_parser.add_argument('--num-timeslots', type=int, help='Aantal tijdsloten voor alle groottes')
+    scaling_parser.add_argument('--end-time', type=str, help='Eind tijd in minuten vanaf start, of none')
+    scaling_parser.add_argument('--mode', choices=['monolithic', 'decomposed', 'rolling', 'greedy'], help='Planning methode')
+    scaling_parser.add_argument('--time', type=float, default=60, help='Maximale oplostijd per grootte (seconden)')
+    scaling_parser.add_argument('--workers', type=int, help='CP-SAT workers (standaard: beschikbare CPUs)')
+    scaling_parser.add_argument('--compare', type=str, help='Vorige resultaten (JSON) om mee te vergelijken')
+    scaling_parser.add_argument('--output', type=str, default='benchmark-scaling.json',
+                                help='Schrijf de resultaten naar dit JSON bestand')
+
+    args = parser.parse_args()
+    # config.py waarden met de parameters als overrides; elke variant krijgt een eigen kopie.
+    # De schaal benchmark heeft eigen grid opties in plaats van de config parameters.
+    overrides = config_overrides(args) if args.benchmark != 'scaling' else {}
+    scheduler_config = SchedulerConfig.from_config(overrides)
+
+    rows = BENCHMARKS[args.benchmark](args, scheduler_config)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2)
+        print(f"💾 Resultaten opgeslagen als: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,41 @@
 """
 Complete FLL Tournament Scheduler
 Plant zowel matches (tafels) als jury sessies voor teams
+
+Alle functies krijgen hun instellingen mee als SchedulerConfig (parameter config, velden
+zijn de config.py namen in kleine letters); het config module wordt niet gelezen of aangepast.
 """
 from ortools.sat.python import cp_model
-from config import *
 import json
+import math
+import numpy as np
+import os
+import random
+import sys
+import threading
+import time
 from datetime import datetime, timedelta
+from cpus import available_cpus, resolve_num_workers
+from profiler import BuildProfiler
+from schedule_format import dump_schedule, load_schedule
+from schedule_stats import analyze_schedule, print_schedule_stats
+from scheduler import SchedulerConfig
+
+
+# Gewichten van de doel termen, van hoogste naar laagste prioriteit
+OBJECTIVE_WEIGHTS = {
+    'pair_violations': 100000,      # Tafel paren beide bezet of beide leeg
+    'empty_slots': 10000,           # Lege tafel/tijdslot combinaties
+    'latest_match_timeslot': 50,    # Laatste match zo vroeg mogelijk
+    'timeslot_penalty': 1,          # Matches zo vroeg mogelijk
+    'tables_used': -1,              # Beloning: verschillende tafels per team
+}
+
+
+def say(config, *args, **kwargs):
+    """print(), behalve bij een stille configuratie (config.quiet)"""
+    if not config.quiet:
+        print(*args, **kwargs)
 
 
 def calculate_timeslot_from_minutes(minutes, duration):
@@ -13,192 +43,541 @@ def calculate_timeslot_from_minutes(minutes, duration):
     return minutes // duration
 
 
-def create_complete_schedule():
-    """Maakt een compleet FLL schema met matches en jury sessies"""
-    
-    all_teams = range(NUM_TEAMS)
-    all_tables = range(NUM_TABLES)
-    all_jury_rooms = range(NUM_JURY_ROOMS)
-    
-    # Bereken hoeveel tijdsloten we nodig hebben
-    # Voor matches: tijdslot duur = MATCH_DURATION
-    # Voor jury: tijdslot duur = JURY_DURATION
-    all_match_timeslots = range(NUM_TIMESLOTS)
-    all_jury_timeslots = range(NUM_TIMESLOTS)
-    
-    print(f"\n🏆 FLL COMPLETE TOURNAMENT SCHEDULER")
-    print(f"=" * 70)
-    print(f"📋 Configuratie:")
-    print(f"   Teams: {NUM_TEAMS}")
-    print(f"   Tafels: {NUM_TABLES}")
-    print(f"   Jury Rooms: {NUM_JURY_ROOMS}")
-    print(f"   Tijdsloten: {NUM_TIMESLOTS}")
-    print(f"   Wedstrijden per team: {MATCHES_PER_TEAM}")
-    print(f"   Jury sessies per team: {JURY_SESSIONS_PER_TEAM}")
-    print(f"   Min. buffer tijd: {MINIMUM_BUFFER_TIME} min")
-    if END_TIME is not None:
-        end_hours = END_TIME // 60
-        end_minutes = END_TIME % 60
-        print(f"   Eind tijd: {END_TIME} min ({end_hours}u{end_minutes:02d})")
-    print(f"=" * 70 + "\n")
+class SolutionTracker(cp_model.CpSolverSolutionCallback):
+    """Houdt bij wanneer de solver (verbeterde) oplossingen vindt"""
 
-    # Capacity check
-    total_matches = NUM_TEAMS * MATCHES_PER_TEAM
-    max_match_capacity = NUM_TIMESLOTS * NUM_TABLES
-    total_jury_sessions = NUM_TEAMS * JURY_SESSIONS_PER_TEAM
-    max_jury_capacity = NUM_TIMESLOTS * NUM_JURY_ROOMS
-    
-    print(f"📊 Capaciteit check:")
-    print(f"   Matches: {total_matches} nodig, {max_match_capacity} beschikbaar")
-    print(f"   Jury sessies: {total_jury_sessions} nodig, {max_jury_capacity} beschikbaar")
-    
-    if total_matches > max_match_capacity:
-        print(f"   ⚠️  Onvoldoende match capaciteit!")
-        return None
-    if total_jury_sessions > max_jury_capacity:
-        print(f"   ⚠️  Onvoldoende jury capaciteit!")
+    def __init__(self):
+        super().__init__()
+        self.solutions = []
+
+    def on_solution_callback(self):
+        self.solutions.append((self.wall_time, self.objective_value))
+
+    @property
+    def first_solution_time(self):
+        return self.solutions[0][0] if self.solutions else None
+
+
+class ProgressMonitor(SolutionTracker):
+    """Volgt de zoektocht live: JSON regels, tussentijds opslaan en vroegtijdig stoppen
+
+    Per verbeterde oplossing (en per verbeterde bound) wordt een JSON regel geschreven met
+    doelwaarde, bound, gap en verstreken tijd. Het beste schema tot nu toe wordt in de
+    callback omgezet naar de JSON output en door een achtergrond thread hooguit elke
+    PROGRESS_SAVE_INTERVAL seconden atomair weggeschreven. Dezelfde thread stopt de solver
+    als er STOP_AFTER_NO_IMPROVEMENT seconden geen betere oplossing is gevonden.
+    """
+
+    def __init__(self, config, solver, index):
+        super().__init__()
+        self.config = config
+        self.solver = solver
+        self.index = index
+        self.stream = None
+        self.best_output = None
+        self.saved_output = None
+        self.last_save = 0.0
+        self.last_improvement = 0.0
+        self.stop_reason = None
+        self._start = None
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def elapsed(self):
+        return time.perf_counter() - self._start
+
+    def emit(self, event, **fields):
+        """Schrijf 1 JSON regel naar PROGRESS_STREAM"""
+        if self.stream is None:
+            return
+        line = json.dumps({'event': event, 'time': round(self.elapsed(), 3), **fields})
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def on_solution_callback(self):
+        super().on_solution_callback()
+        self.last_improvement = self.elapsed()
+        objective = self.objective_value
+        bound = self.best_objective_bound
+        gap = abs(objective - bound) / max(1.0, abs(objective))
+        self.emit('solution', solution=len(self.solutions), objective=objective, bound=bound,
+                  gap=round(gap, 6))
+
+        if self.config.progress_save_file is not None:
+            # Waarden zijn alleen binnen de callback geldig: output nu bouwen, later opslaan
+            output = build_json_output(self.config, {'solver': self, 'index': self.index, 'status': cp_model.FEASIBLE})
+            with self._lock:
+                self.best_output = output
+
+        if self.config.stop_at_gap is not None and gap <= self.config.stop_at_gap:
+            self.stop_reason = f"gap {gap:.2%} <= {self.config.stop_at_gap:.2%}"
+            self.emit('stop', reason='gap', gap=round(gap, 6))
+            self.stop_search()
+
+    def on_bound(self, bound):
+        self.emit('bound', bound=bound)
+
+    def _save_best(self):
+        with self._lock:
+            output = self.best_output
+        if output is None or output is self.saved_output:
+            return
+        save_json(self.config, output, self.config.progress_save_file, quiet=True)
+        self.saved_output = output
+        self.last_save = self.elapsed()
+        self.emit('saved', file=self.config.progress_save_file, solution=len(self.solutions))
+
+    def _watch(self):
+        while not self._done.wait(0.5):
+            if (self.config.progress_save_file is not None
+                    and self.elapsed() - self.last_save >= self.config.progress_save_interval):
+                self._save_best()
+            if (self.config.stop_after_no_improvement is not None and self.solutions
+                    and self.elapsed() - self.last_improvement >= self.config.stop_after_no_improvement):
+                self.stop_reason = f"{self.config.stop_after_no_improvement}s geen verbetering"
+                self.emit('stop', reason='no_improvement')
+                self.solver.stop_search()
+                return
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        if self.config.progress_stream == "-":
+            self.stream = sys.stdout
+        elif self.config.progress_stream is not None:
+            self.stream = open(self.config.progress_stream, 'w', encoding='utf-8')
+        if self.config.progress_stream is not None:
+            self.solver.best_bound_callback = self.on_bound
+        if self.config.progress_save_file is not None or self.config.stop_after_no_improvement is not None:
+            self._thread = threading.Thread(target=self._watch, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._done.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self.config.progress_save_file is not None:
+            self._save_best()
+        if self.stream is not None and self.stream is not sys.stdout:
+            self.stream.close()
+        return False
+
+
+class ModelIndex:
+    """Sparse index over de match en jury variabelen van een gebouwd model
+
+    Groepeert de variabelen eenmalig per (team, tijdslot), (tijdslot, tafel), (team, tafel),
+    (tijdslot, jury room) enz. zodat constraints, het doel en de output stappen niet steeds
+    opnieuw over alle combinaties hoeven te lopen. Gedeelde lineaire expressies zoals
+    "team speelt op ts" worden 1 keer gebouwd en hergebruikt.
+    """
+
+    def __init__(self, config, domains, matches, jury_sessions):
+        self.config = config
+        self.matches = matches
+        self.jury_sessions = jury_sessions
+        self.match_slots = domains['match_slots']
+        self.jury_slots = domains['jury_slots']
+        self.match_teams = domains['match_teams']
+        self.jury_teams = domains['jury_teams']
+        self._match_keys = None  # NumPy index voor solution_matrix, bij eerste gebruik gebouwd
+
+        # Match variabelen: matches[(team, timeslot, table)]
+        self.team_matches = {team: [] for team in range(config.num_teams)}
+        self.team_slot_matches = {}
+        self.slot_table_matches = {(ts, table): [] for ts in range(config.num_timeslots)
+                                   for table in range(config.num_tables)}
+        self.team_table_matches = {(team, table): [] for team in range(config.num_teams)
+                                   for table in range(config.num_tables)}
+        for (team, ts, table), var in matches.items():
+            self.team_matches[team].append(var)
+            self.team_slot_matches.setdefault((team, ts), []).append(var)
+            self.slot_table_matches[(ts, table)].append(var)
+            self.team_table_matches[(team, table)].append(var)
+
+        # Jury variabelen: jury_sessions[(team, timeslot, jury_room)]
+        self.team_jury = {team: [] for team in range(config.num_teams)}
+        self.team_slot_jury = {}
+        self.slot_room_jury = {}
+        for (team, ts, jury_room), var in jury_sessions.items():
+            self.team_jury[team].append(var)
+            self.team_slot_jury.setdefault((team, ts), []).append(var)
+            self.slot_room_jury.setdefault((ts, jury_room), []).append(var)
+
+        self._plays = {}
+        self._table_used = {}
+        self._has_jury = {}
+
+    def plays(self, team, ts):
+        """Lineaire expressie: 1 als het team op tijdslot ts een match speelt"""
+        expr = self._plays.get((team, ts))
+        if expr is None:
+            expr = cp_model.LinearExpr.sum(self.team_slot_matches.get((team, ts), []))
+            self._plays[(team, ts)] = expr
+        return expr
+
+    def table_used(self, ts, table):
+        """Lineaire expressie: 1 als er op tijdslot ts een match op deze tafel is"""
+        expr = self._table_used.get((ts, table))
+        if expr is None:
+            expr = cp_model.LinearExpr.sum(self.slot_table_matches[(ts, table)])
+            self._table_used[(ts, table)] = expr
+        return expr
+
+    def has_jury(self, team, ts):
+        """Lineaire expressie: 1 als het team op tijdslot ts een jury sessie start"""
+        expr = self._has_jury.get((team, ts))
+        if expr is None:
+            expr = cp_model.LinearExpr.sum(self.team_slot_jury.get((team, ts), []))
+            self._has_jury[(team, ts)] = expr
+        return expr
+
+    def solution_matrix(self, solver):
+        """Alle match en jury waarden in 1 keer als dichte NumPy matrices
+
+        Leest de oplossing 1 keer uit response_proto.solution en verdeelt die met NumPy
+        indexering over de (team, tijdslot, tafel) en (team, tijdslot, jury room) matrices,
+        in plaats van een solver.value() aanroep per variabele. Werkt met een CpSolver na
+        het oplossen en met een solution callback tijdens het zoeken.
+        """
+        if self._match_keys is None:
+            self._match_keys = np.array(list(self.matches), dtype=np.int64).reshape(-1, 3)
+            self._match_vars = np.array([var.index for var in self.matches.values()], dtype=np.int64)
+            self._jury_keys = np.array(list(self.jury_sessions), dtype=np.int64).reshape(-1, 3)
+            self._jury_vars = np.array([var.index for var in self.jury_sessions.values()], dtype=np.int64)
+
+        values = np.array(solver.response_proto.solution, dtype=np.int64)
+        shape = (self.config.num_teams, self.config.num_timeslots)
+        return SolutionMatrix(
+            dense_matrix(shape + (self.config.num_tables,), self._match_keys, values[self._match_vars]),
+            dense_matrix(shape + (self.config.num_jury_rooms,), self._jury_keys, values[self._jury_vars]),
+        )
+
+    def scheduled_matches(self, solver):
+        """Geplande matches als (team, tijdslot, tafel), in (team, tijdslot, tafel) volgorde"""
+        return self.solution_matrix(solver).scheduled_matches()
+
+    def scheduled_jury_sessions(self, solver):
+        """Geplande jury sessies als (team, tijdslot, jury_room)"""
+        return self.solution_matrix(solver).scheduled_jury_sessions()
+
+
+def dense_matrix(shape, keys, values):
+    """Dichte 0/1 matrix met de waarden op de (sparse) sleutels, 0 elders"""
+    matrix = np.zeros(shape, dtype=np.int8)
+    matrix[keys[:, 0], keys[:, 1], keys[:, 2]] = values
+    return matrix
+
+
+class SolutionMatrix:
+    """Een oplossing als dichte matrices: matches[team, tijdslot, tafel] en jury[team, tijdslot, room]
+
+    Output, samenvatting en controles werken op deze matrices in plaats van op de solver.
+    """
+
+    def __init__(self, matches, jury):
+        self.matches = matches
+        self.jury = jury
+
+    def scheduled_matches(self):
+        """Geplande matches als (team, tijdslot, tafel), in (team, tijdslot, tafel) volgorde"""
+        return [tuple(key) for key in np.argwhere(self.matches).tolist()]
+
+    def scheduled_jury_sessions(self):
+        """Geplande jury sessies als (team, tijdslot, jury_room)"""
+        return [tuple(key) for key in np.argwhere(self.jury).tolist()]
+
+    def matches_per_team(self):
+        return self.matches.sum(axis=(1, 2))
+
+    def tables_per_team(self):
+        """Aantal verschillende tafels per team"""
+        return self.matches.any(axis=1).sum(axis=1)
+
+    def teams_per_table_slot(self):
+        """Aantal teams per (tijdslot, tafel): hoogstens 1 in een geldig schema"""
+        return self.matches.sum(axis=0)
+
+    def objective_terms(self, config):
+        """Waarden van de doel termen (zie OBJECTIVE_WEIGHTS), direct uit de matrices"""
+        table_used = self.matches.any(axis=0).astype(np.int64)  # [tijdslot, tafel]
+        pair_violations = sum(int(np.abs(table_used[:, table1] - table_used[:, table2]).sum())
+                              for table1, table2 in config.table_pairs
+                              if table1 < config.num_tables and table2 < config.num_tables)
+        _, slots, _ = np.nonzero(self.matches)
+        return {
+            'pair_violations': pair_violations,
+            'empty_slots': config.num_timeslots * config.num_tables - config.num_teams * config.matches_per_team,
+            'latest_match_timeslot': int(slots.max()) if len(slots) else 0,
+            'timeslot_penalty': int(slots.sum()),
+            'tables_used': int(self.tables_per_team().sum()),
+        }
+
+
+class ConstraintFamilies:
+    """Enforcement literal per constraint familie, voor de infeasibility diagnose
+
+    Uitgeschakeld voegt add() en add_at_most_one() de constraints gewoon toe. Ingeschakeld
+    krijgt elke familie een eigen literal en hangen al haar constraints daarvan af; met die
+    literals als assumptions kan CP-SAT aangeven welke families samen onhaalbaar zijn.
+    """
+
+    def __init__(self, model, enabled=False):
+        self.model = model
+        self.enabled = enabled
+        self.literals = {}
+
+    def literal(self, family):
+        """Enforcement literals voor een familie (leeg als de diagnose uit staat)"""
+        if not self.enabled:
+            return []
+        if family not in self.literals:
+            self.literals[family] = self.model.new_bool_var(f'family_{len(self.literals)}')
+        return [self.literals[family]]
+
+    def add(self, family, constraint):
+        """model.add(constraint), afhankelijk van de familie literal"""
+        return self.model.add(constraint).only_enforce_if(self.literal(family))
+
+    def add_at_most_one(self, family, literals):
+        """at_most_one ondersteunt geen enforcement: bij de diagnose als lineaire som <= 1"""
+        if not self.enabled:
+            return self.model.add_at_most_one(literals)
+        return self.add(family, cp_model.LinearExpr.sum(list(literals)) <= 1)
+
+    def family_of(self, literal_index):
+        """Naam van de familie bij de proto index van een literal"""
+        for family, literal in self.literals.items():
+            if literal.index == literal_index:
+                return family
         return None
-    print(f"   ✅ Capaciteit OK\n")
 
-    model = cp_model.CpModel()
 
-    # ===== VARIABELEN =====
+def add_symmetry_breaking(config, model, index, allowed_jury_start_slots, profiler, families, fixed_jury=False):
+    """Voegt symmetry breaking toe voor verwisselbare teams, jury rooms en tafels binnen een paar
     
-    # Matches: matches[(team, timeslot, table)]
-    matches = {}
-    for team in all_teams:
-        for ts in all_match_timeslots:
-            for table in all_tables:
-                matches[(team, ts, table)] = model.new_bool_var(
-                    f"match_t{team}_ts{ts}_tb{table}"
-                )
+    Met fixed_jury=True (vaste jury planning uit fase 1) zijn teams en rooms niet meer
+    verwisselbaar en worden alleen de tafels binnen een paar geordend.
+    """
+    all_teams = range(config.num_teams)
+    all_jury_rooms = range(config.num_jury_rooms)
+    jury_sessions = index.jury_sessions
 
-    # Jury sessies: jury_sessions[(team, timeslot, jury_room)]
-    jury_sessions = {}
-    for team in all_teams:
-        for ts in all_jury_timeslots:
-            for jury_room in all_jury_rooms:
-                jury_sessions[(team, ts, jury_room)] = model.new_bool_var(
-                    f"jury_t{team}_ts{ts}_jr{jury_room}"
-                )
+    profiler.start("Symmetry: teams")
+    # Teams: sorteer teams op het tijdslot van hun eerste match
+    # first_match = min over ts van (ts als het team speelt, anders NUM_TIMESLOTS)
+    if not fixed_jury:
+        first_match = []
+        for team in all_teams:
+            first = model.new_int_var(0, config.num_timeslots, f'first_match_t{team}')
+            model.add_min_equality(first, [config.num_timeslots] + [
+                config.num_timeslots - (config.num_timeslots - ts) * index.plays(team, ts)
+                for ts in index.match_slots[team]
+            ])
+            first_match.append(first)
+        for team in range(config.num_teams - 1):
+            families.add("Symmetry breaking", first_match[team] <= first_match[team + 1])
 
-    # ===== CONSTRAINTS VOOR MATCHES =====
-    
-    print("🔧 Toevoegen van constraints...")
-    
-    # 1. Elk team speelt precies MATCHES_PER_TEAM wedstrijden
-    for team in all_teams:
-        model.add(sum(matches[(team, ts, tb)] 
-                     for ts in all_match_timeslots 
-                     for tb in all_tables) == MATCHES_PER_TEAM)
+    profiler.start("Symmetry: jury rooms")
+    # Jury rooms: binnen een ronde worden rooms op volgorde gevuld, met oplopend team nummer.
+    # Rondes overlappen niet, dus de rooms zijn per ronde onafhankelijk te verwisselen.
+    if config.jury_sessions_per_team == 1 and not fixed_jury:
+        for ts in allowed_jury_start_slots:
+            round_teams = index.jury_teams[ts]
+            occupied = [cp_model.LinearExpr.sum(index.slot_room_jury.get((ts, jr), [])) for jr in all_jury_rooms]
+            team_index = [sum((team + 1) * jury_sessions[(team, ts, jr)] for team in round_teams)
+                          for jr in all_jury_rooms]
+            for jr in range(config.num_jury_rooms - 1):
+                families.add("Symmetry breaking", occupied[jr] >= occupied[jr + 1])
+                # Als room jr+1 bezet is: team_index[jr] < team_index[jr+1]
+                families.add("Symmetry breaking", team_index[jr] + occupied[jr + 1] <=
+                             team_index[jr + 1] + (config.num_teams + 1) * (1 - occupied[jr + 1]))
 
-    # 2. Maximaal 1 team per tafel per tijdslot
-    for ts in all_match_timeslots:
-        for table in all_tables:
-            model.add_at_most_one(matches[(team, ts, table)] for team in all_teams)
+    profiler.start("Symmetry: tafels")
+    # Tafels binnen een paar: de eerste tafel wordt minstens zo vaak gebruikt als de tweede
+    for table1, table2 in config.table_pairs:
+        if table1 < config.num_tables and table2 < config.num_tables:
+            families.add("Symmetry breaking",
+                         sum(index.table_used(ts, table1) for ts in range(config.num_timeslots)) >=
+                         sum(index.table_used(ts, table2) for ts in range(config.num_timeslots)))
 
-    # 3. Een team kan maar op 1 tafel per tijdslot spelen
-    for team in all_teams:
-        for ts in all_match_timeslots:
-            model.add_at_most_one(matches[(team, ts, table)] for table in all_tables)
+
+def jury_round_start_slots(config):
+    """Tijdsloten waarop een synchrone jury ronde start (0, 6, 12, ... bij 42 min jury)"""
+    # Jury sessies mogen alleen starten op tijdslot 0, 6, 12, 18, etc. (elke 6 slots = 42 min)
+    # Dit zorgt ervoor dat jury sessies direct na elkaar aansluiten zonder pauze
+    # Een jury sessie duurt 6 tijdsloten (42 min), dus de volgende kan direct starten op +6
+    jury_duration_in_slots = (config.jury_duration + config.match_duration - 1) // config.match_duration
+    num_jury_rounds = math.ceil(config.num_teams / config.num_jury_rooms)
+    return list(range(0, config.num_timeslots, jury_duration_in_slots))[:num_jury_rounds]
+
+
+def jury_blocked_match_slots(config, jury_ts):
+    """Match tijdsloten die een team niet mag gebruiken door een jury sessie op jury_ts (overlap + buffer)"""
+    jury_duration_in_slots = (config.jury_duration + config.match_duration - 1) // config.match_duration
+    buffer_in_slots = (config.minimum_buffer_time + config.match_duration - 1) // config.match_duration
+    first_blocked = max(0, jury_ts - buffer_in_slots)
+    last_blocked = min(config.num_timeslots - 1, jury_ts + jury_duration_in_slots - 1 + buffer_in_slots)
+    return range(first_blocked, last_blocked + 1)
+
+
+def compute_domains(config, jury_assignment=None):
+    """Domein pre-pass: bepaal per team op welke tijdsloten een match of jury sessie mogelijk is
     
-    # 4. Twee teams mogen maximaal 1 keer tegen elkaar spelen
-    # Teams spelen tegen elkaar als ze op hetzelfde tijdslot op een tafel paar spelen
-    print("   └─ Unique opponents...")
-    
-    # Maak variabelen voor welke team paren tegen elkaar hebben gespeeld
-    team_matchups = {}
-    for team1 in all_teams:
-        for team2 in all_teams:
-            if team1 < team2:  # Voorkom duplicaten (team1, team2) == (team2, team1)
-                team_matchups[(team1, team2)] = model.new_int_var(0, MATCHES_PER_TEAM, 
-                    f'matchup_t{team1}_t{team2}')
-    
-    # Bereken hoe vaak elk team paar tegen elkaar speelt
-    if 'TABLE_PAIRS' in globals() and TABLE_PAIRS:
-        for team1 in all_teams:
-            for team2 in all_teams:
-                if team1 < team2:
-                    matchup_count = []
-                    # Voor elk tafel paar, check of beide teams daar tegelijk spelen
-                    for table1, table2 in TABLE_PAIRS:
-                        if table1 < NUM_TABLES and table2 < NUM_TABLES:
-                            for ts in all_match_timeslots:
-                                # Beide teams spelen op dit paar op dit tijdslot
-                                both_play = model.new_bool_var(f'both_t{team1}_t{team2}_ts{ts}_pair{table1}_{table2}')
-                                
-                                # team1 op table1 EN team2 op table2
-                                option1 = model.new_bool_var(f'opt1_t{team1}_t{team2}_ts{ts}_p{table1}_{table2}')
-                                model.add_bool_and([matches[(team1, ts, table1)], 
-                                                   matches[(team2, ts, table2)]]).only_enforce_if(option1)
-                                model.add_bool_or([matches[(team1, ts, table1)].Not(), 
-                                                  matches[(team2, ts, table2)].Not()]).only_enforce_if(option1.Not())
-                                
-                                # team1 op table2 EN team2 op table1
-                                option2 = model.new_bool_var(f'opt2_t{team1}_t{team2}_ts{ts}_p{table1}_{table2}')
-                                model.add_bool_and([matches[(team1, ts, table2)], 
-                                                   matches[(team2, ts, table1)]]).only_enforce_if(option2)
-                                model.add_bool_or([matches[(team1, ts, table2)].Not(), 
-                                                  matches[(team2, ts, table1)].Not()]).only_enforce_if(option2.Not())
-                                
-                                # both_play = option1 OR option2
-                                model.add_bool_or([option1, option2]).only_enforce_if(both_play)
-                                model.add_bool_and([option1.Not(), option2.Not()]).only_enforce_if(both_play.Not())
-                                
-                                matchup_count.append(both_play)
-                    
-                    # Totaal aantal keer dat team1 en team2 tegen elkaar spelen
-                    if matchup_count:
-                        model.add(sum(matchup_count) == team_matchups[(team1, team2)])
-                        # Maximaal 1 keer tegen elkaar spelen
-                        model.add(team_matchups[(team1, team2)] <= 1)
+    Alleen voor deze tijdsloten worden variabelen aangemaakt. Uitgesloten zijn:
+    - match tijdsloten na END_TIME en rond een vaste jury sessie (fase 2)
+    - jury starts na END_TIME en, bij 1 jury sessie per team, buiten de synchrone rondes
+    """
+    max_match_timeslot = config.num_timeslots - 1
+    max_jury_timeslot = config.num_timeslots - 1
+    if config.end_time is not None:
+        max_match_timeslot = min(max_match_timeslot, (config.end_time - config.match_duration) // config.match_duration)
+        max_jury_timeslot = min(max_jury_timeslot, (config.end_time - config.jury_duration) // config.match_duration)
+
+    if config.jury_sessions_per_team == 1:
+        # Constraint 7b: de enige jury sessie start altijd op een ronde start
+        jury_candidates = [ts for ts in jury_round_start_slots(config) if ts <= max_jury_timeslot]
+    else:
+        jury_candidates = list(range(max_jury_timeslot + 1))
+
+    match_slots = {}
+    jury_slots = {}
+    for team in range(config.num_teams):
+        if jury_assignment is not None:
+            jury_ts = jury_assignment[team][0]
+            blocked = set(jury_blocked_match_slots(config, jury_ts))
+            jury_slots[team] = [jury_ts]
+        else:
+            blocked = set()
+            jury_slots[team] = jury_candidates
+        match_slots[team] = [ts for ts in range(max_match_timeslot + 1) if ts not in blocked]
+
+    # Omgekeerde index: welke teams kunnen op tijdslot ts spelen / jury hebben
+    match_teams = {ts: [] for ts in range(config.num_timeslots)}
+    jury_teams = {ts: [] for ts in range(config.num_timeslots)}
+    for team in range(config.num_teams):
+        for ts in match_slots[team]:
+            match_teams[ts].append(team)
+        for ts in jury_slots[team]:
+            jury_teams[ts].append(team)
 
-    # ===== CONSTRAINTS VOOR JURY SESSIES =====
+    return {
+        'match_slots': match_slots,
+        'jury_slots': jury_slots,
+        'match_teams': match_teams,
+        'jury_teams': jury_teams,
+    }
+
+
+def assign_jury_rounds(config):
+    """Fase 1 van de gedecomponeerde planning: verdeel teams over jury rondes en rooms
     
+    Teams en rooms zijn verwisselbaar, dus een gebalanceerde verdeling (rondes verschillen
+    maximaal 1 team in grootte) is altijd optimaal en er is geen solver nodig.
+    Geeft {team: (tijdslot, jury_room)} terug, of None als de rondes niet passen.
+    """
+    round_slots = jury_round_start_slots(config)
+    if config.end_time is not None:
+        max_jury_timeslot = (config.end_time - config.jury_duration) // config.match_duration
+        round_slots = [ts for ts in round_slots if ts <= max_jury_timeslot]
+
+    say(config, f"🧩 Fase 1: jury rondes toewijzen...")
+    if len(round_slots) * config.num_jury_rooms < config.num_teams:
+        say(config, f"   ⚠️  {len(round_slots)} jury rondes × {config.num_jury_rooms} rooms is te weinig "
+                    f"voor {config.num_teams} teams!")
+        return None
+
+    num_rounds = math.ceil(config.num_teams / config.num_jury_rooms)
+    assignment = {}
+    team = 0
+    for round_idx, ts in enumerate(round_slots[:num_rounds]):
+        round_size = config.num_teams // num_rounds + (1 if round_idx < config.num_teams % num_rounds else 0)
+        for jury_room in range(round_size):
+            assignment[team] = (ts, jury_room)
+            team += 1
+        say(config, f"   Ronde @ tijdslot {ts}: {round_size} teams")
+    say(config)
+
+    return assignment
+
+
+def add_jury_constraints(config, model, index, allowed_jury_start_slots, profiler, families):
+    """Constraints 5-7b en 10: aantal jury sessies, room bezetting en synchrone rondes"""
+    all_teams = range(config.num_teams)
+    all_jury_rooms = range(config.num_jury_rooms)
+    all_jury_timeslots = range(config.num_timeslots)
+    jury_sessions = index.jury_sessions
+    jury_slots = index.jury_slots
+    jury_teams = index.jury_teams
+
+    profiler.start("5. Jury sessies per team")
     # 5. Elk team heeft precies JURY_SESSIONS_PER_TEAM jury sessies
     for team in all_teams:
-        model.add(sum(jury_sessions[(team, ts, jr)] 
-                     for ts in all_jury_timeslots 
-                     for jr in all_jury_rooms) == JURY_SESSIONS_PER_TEAM)
+        families.add("5. Jury sessies per team",
+                     cp_model.LinearExpr.sum(index.team_jury[team]) == config.jury_sessions_per_team)
 
+    profiler.start("6. Jury room bezetting")
     # 6. Maximaal 1 team per jury room per tijdslot
-    for ts in all_jury_timeslots:
-        for jury_room in all_jury_rooms:
-            model.add_at_most_one(jury_sessions[(team, ts, jury_room)] for team in all_teams)
+    for room_vars in index.slot_room_jury.values():
+        families.add_at_most_one("6. Jury room bezetting", room_vars)
     
+    profiler.start("6b. Jury room overlap")
     # 6b. BELANGRIJK: Voorkom overlappende jury sessies in dezelfde room
     # Een jury op tijdslot J beslaat tijdsloten J t/m J+5 (42 min = 6 tijdsloten van 7 min)
-    jury_duration_in_slots = (JURY_DURATION + MATCH_DURATION - 1) // MATCH_DURATION
-    
-    for jury_room in all_jury_rooms:
-        for ts1 in all_jury_timeslots:
-            for ts2 in range(ts1 + 1, min(ts1 + jury_duration_in_slots, NUM_TIMESLOTS)):
-                # Als er een jury sessie start op ts1, mag er geen sessie starten op ts2
-                # omdat deze zou overlappen (ts1 loopt tot ts1+6, ts2 start voor die tijd)
-                for team1 in all_teams:
-                    for team2 in all_teams:
-                        if team1 != team2:  # Verschillende teams
-                            model.add(
-                                jury_sessions[(team1, ts1, jury_room)] + 
-                                jury_sessions[(team2, ts2, jury_room)] <= 1
-                            )
+    jury_duration_in_slots = (config.jury_duration + config.match_duration - 1) // config.match_duration
+    say(config, f"   └─ Jury room overlap ({config.jury_overlap_model})...")
+
+    if config.jury_overlap_model == "interval" and families.enabled:
+        # NoOverlap ondersteunt geen enforcement: bij de diagnose per room en tijdslot
+        # maximaal 1 sessie die in de afgelopen jury_duration_in_slots tijdsloten startte
+        for jury_room in all_jury_rooms:
+            for ts in all_jury_timeslots:
+                window = [jury_sessions[(team, start, jury_room)]
+                          for start in range(max(0, ts - jury_duration_in_slots + 1), ts + 1)
+                          for team in jury_teams[start]]
+                if len(window) > 1:
+                    families.add("6b. Jury room overlap", cp_model.LinearExpr.sum(window) <= 1)
+    elif config.jury_overlap_model == "interval":
+        # Elke mogelijke sessie is een optioneel interval [ts, ts + duur) dat alleen
+        # aanwezig is als de jury variabele 1 is. Per room mogen de aanwezige
+        # intervallen niet overlappen: 1 NoOverlap per room, lineair in teams × tijdsloten.
+        for jury_room in all_jury_rooms:
+            room_intervals = []
+            for team in all_teams:
+                for ts in jury_slots[team]:
+                    room_intervals.append(model.new_optional_fixed_size_interval_var(
+                        ts, jury_duration_in_slots,
+                        jury_sessions[(team, ts, jury_room)],
+                        f"jury_iv_t{team}_ts{ts}_jr{jury_room}"
+                    ))
+            model.add_no_overlap(room_intervals)
+    else:
+        for jury_room in all_jury_rooms:
+            for ts1 in all_jury_timeslots:
+                for ts2 in range(ts1 + 1, min(ts1 + jury_duration_in_slots, config.num_timeslots)):
+                    # Als er een jury sessie start op ts1, mag er geen sessie starten op ts2
+                    # omdat deze zou overlappen (ts1 loopt tot ts1+6, ts2 start voor die tijd)
+                    for team1 in jury_teams[ts1]:
+                        for team2 in jury_teams[ts2]:
+                            if team1 != team2:  # Verschillende teams
+                                families.add(
+                                    "6b. Jury room overlap",
+                                    jury_sessions[(team1, ts1, jury_room)] +
+                                    jury_sessions[(team2, ts2, jury_room)] <= 1
+                                )
 
+    profiler.start("7. 1 jury room per team")
     # 7. Een team kan maar in 1 jury room per tijdslot zijn
-    for team in all_teams:
-        for ts in all_jury_timeslots:
-            model.add_at_most_one(jury_sessions[(team, ts, jr)] for jr in all_jury_rooms)
+    for team_vars in index.team_slot_jury.values():
+        families.add_at_most_one("7. 1 jury room per team", team_vars)
     
+    profiler.start("7b. Synchrone jury rondes")
     # 7b. NIEUWE CONSTRAINT: Jury sessies beginnen in synchrone rondes
     # Bereken hoeveel rondes nodig zijn (40 teams / 7 rooms = 6 rondes)
-    import math
-    num_jury_rounds = math.ceil(NUM_TEAMS / NUM_JURY_ROOMS)
-    print(f"   └─ Jury rondes: {num_jury_rounds} (max {NUM_JURY_ROOMS} teams per ronde)")
-    
-    # Definieer welke tijdsloten gebruikt mogen worden voor jury start (beperkt aantal)
-    # Jury sessies mogen alleen starten op tijdslot 0, 6, 12, 18, etc. (elke 6 slots = 42 min)
-    # Dit zorgt ervoor dat jury sessies direct na elkaar aansluiten zonder pauze
-    # Een jury sessie duurt 6 tijdsloten (42 min), dus de volgende kan direct starten op +6
-    allowed_jury_start_slots = list(range(0, NUM_TIMESLOTS, jury_duration_in_slots))[:num_jury_rounds]
+    num_jury_rounds = math.ceil(config.num_teams / config.num_jury_rooms)
+    say(config, f"   └─ Jury rondes: {num_jury_rounds} (max {config.num_jury_rooms} teams per ronde)")
     
     # Elk team mag alleen een jury sessie starten op deze specifieke tijdsloten
     for team in all_teams:
@@ -211,127 +590,88 @@ def create_complete_schedule():
         
         # Team moet precies 1 jury sessie hebben op een toegestaan tijdslot
         if valid_jury_sessions:
-            model.add(sum(valid_jury_sessions) == 1)
+            families.add("7b. Synchrone jury rondes", sum(valid_jury_sessions) == 1)
 
-    # ===== CONSTRAINTS VOOR OVERLAP EN BUFFER =====
-    
+    profiler.start("10. Jury spacing")
+    # 10. Buffer tijd tussen opeenvolgende jury sessies (als team meer dan 1 heeft)
+    if config.jury_sessions_per_team > 1:
+        say(config, "   └─ Jury spacing...")
+        # Rond naar boven
+        min_jury_gap = (config.minimum_buffer_time + config.jury_duration - 1) // config.jury_duration
+        for team in all_teams:
+            team_jury_slots = set(jury_slots[team])
+            for ts in range(config.num_timeslots - min_jury_gap):
+                for next_ts in range(ts + 1, min(ts + 1 + min_jury_gap, config.num_timeslots)):
+                    if ts not in team_jury_slots or next_ts not in team_jury_slots:
+                        continue
+                    families.add("10. Jury spacing", index.has_jury(team, ts) + index.has_jury(team, next_ts) <= 1)
+
+
+def add_jury_match_overlap_constraints(config, model, index, profiler, families):
+    """Constraint 8: geen matches tijdens (of binnen de buffer rond) een jury sessie"""
+    all_teams = range(config.num_teams)
+
+    profiler.start("8. Jury/match overlap")
     # 8. Voorkom overlap tussen matches en jury sessies
     # BEIDE gebruiken nu dezelfde tijdschaal: tijdslot * MATCH_DURATION
     # Match op tijdslot M: start = M*7, eind = M*7+7 (7 min)
     # Jury op tijdslot J: start = J*7, eind = J*7+42 (42 min, dus 6 tijdsloten lang)
     
-    print("   └─ Overlap preventie...")
+    say(config, "   └─ Overlap preventie...")
     
     # Een jury sessie op tijdslot J beslaat tijdsloten J t/m J+5 (6 tijdsloten)
-    jury_duration_in_slots = (JURY_DURATION + MATCH_DURATION - 1) // MATCH_DURATION  # 6 tijdsloten
+    jury_duration_in_slots = (config.jury_duration + config.match_duration - 1) // config.match_duration  # 6 tijdsloten
     
     for team in all_teams:
-        for jury_ts in all_jury_timeslots:
+        for jury_ts in index.jury_slots[team]:
             # Als team jury heeft op tijdslot jury_ts, dan beslaat dit tijdsloten jury_ts t/m jury_ts+5
             jury_start_slot = jury_ts
             jury_end_slot = jury_ts + jury_duration_in_slots - 1
             
             # Team mag geen matches hebben in deze range + buffer
-            buffer_in_slots = (MINIMUM_BUFFER_TIME + MATCH_DURATION - 1) // MATCH_DURATION
+            buffer_in_slots = (config.minimum_buffer_time + config.match_duration - 1) // config.match_duration
             
-            for match_ts in all_match_timeslots:
+            for match_ts in index.match_slots[team]:
                 # Check of match overlapt met jury + buffer
                 # Match overlapt als: match_ts is tussen (jury_start_slot - buffer) en (jury_end_slot + buffer)
                 if (jury_start_slot - buffer_in_slots <= match_ts <= jury_end_slot + buffer_in_slots):
-                    has_jury = sum(jury_sessions[(team, jury_ts, jr)] for jr in all_jury_rooms)
-                    has_match = sum(matches[(team, match_ts, tb)] for tb in all_tables)
-                    model.add(has_jury + has_match <= 1)
-    
-    # 9. Buffer tijd tussen opeenvolgende matches
-    print("   └─ Match spacing...")
-    # We hebben minstens MINIMUM_BUFFER_TIME nodig TUSSEN twee matches
-    # Als match 1 eindigt op tijd T, dan moet match 2 starten op T + MINIMUM_BUFFER_TIME
-    # In termen van tijdsloten: als match op ts1, dan match 2 op ts2
-    # waarbij (ts2 * MATCH_DURATION) >= (ts1 * MATCH_DURATION + MATCH_DURATION + MINIMUM_BUFFER_TIME)
-    # ts2 >= ts1 + 1 + (MINIMUM_BUFFER_TIME / MATCH_DURATION)
-    min_match_gap = 1 + ((MINIMUM_BUFFER_TIME + MATCH_DURATION - 1) // MATCH_DURATION)
-    
-    print(f"      Min. gap tussen matches: {min_match_gap} tijdsloten ({min_match_gap * MATCH_DURATION} min)")
-    
-    for team in all_teams:
-        for ts in range(NUM_TIMESLOTS):
-            for gap in range(1, min_match_gap):
-                next_ts = ts + gap
-                if next_ts < NUM_TIMESLOTS:
-                    has_match_at_ts = sum(matches[(team, ts, tb)] for tb in all_tables)
-                    has_match_at_next = sum(matches[(team, next_ts, tb)] for tb in all_tables)
-                    model.add(has_match_at_ts + has_match_at_next <= 1)
-    
-    # 10. Buffer tijd tussen opeenvolgende jury sessies (als team meer dan 1 heeft)
-    if JURY_SESSIONS_PER_TEAM > 1:
-        print("   └─ Jury spacing...")
-        # Rond naar boven
-        min_jury_gap = (MINIMUM_BUFFER_TIME + JURY_DURATION - 1) // JURY_DURATION
-        for team in all_teams:
-            for ts in range(NUM_TIMESLOTS - min_jury_gap):
-                for next_ts in range(ts + 1, min(ts + 1 + min_jury_gap, NUM_TIMESLOTS)):
-                    has_jury_at_ts = sum(jury_sessions[(team, ts, jr)] for jr in all_jury_rooms)
-                    has_jury_at_next = sum(jury_sessions[(team, next_ts, jr)] for jr in all_jury_rooms)
-                    model.add(has_jury_at_ts + has_jury_at_next <= 1)
+                    families.add("8. Jury/match overlap",
+                                 index.has_jury(team, jury_ts) + index.plays(team, match_ts) <= 1)
 
-    # 11. END TIME CONSTRAINT: Alle events moeten voor END_TIME afgelopen zijn
-    if END_TIME is not None:
-        print(f"   └─ End time constraint: {END_TIME} minuten ({END_TIME // 60}u{END_TIME % 60:02d})")
-        
-        # Bereken de laatste toegestane timeslot voor matches
-        # Match op timeslot ts eindigt op: ts * MATCH_DURATION + MATCH_DURATION
-        # Dit moet <= END_TIME zijn, dus: ts * MATCH_DURATION + MATCH_DURATION <= END_TIME
-        # ts <= (END_TIME - MATCH_DURATION) / MATCH_DURATION
-        max_match_timeslot = (END_TIME - MATCH_DURATION) // MATCH_DURATION
-        
-        # Bereken de laatste toegestane timeslot voor jury sessies
-        # Jury op timeslot ts eindigt op: ts * MATCH_DURATION + JURY_DURATION
-        # Dit moet <= END_TIME zijn, dus: ts * MATCH_DURATION + JURY_DURATION <= END_TIME
-        # ts <= (END_TIME - JURY_DURATION) / MATCH_DURATION
-        max_jury_timeslot = (END_TIME - JURY_DURATION) // MATCH_DURATION
-        
-        print(f"      Max match timeslot: {max_match_timeslot} (eindt op {max_match_timeslot * MATCH_DURATION + MATCH_DURATION} min)")
-        print(f"      Max jury timeslot: {max_jury_timeslot} (eindt op {max_jury_timeslot * MATCH_DURATION + JURY_DURATION} min)")
-        
-        # Constraint: Geen matches na max_match_timeslot
-        for team in all_teams:
-            for ts in range(max_match_timeslot + 1, NUM_TIMESLOTS):
-                for table in all_tables:
-                    model.add(matches[(team, ts, table)] == 0)
-        
-        # Constraint: Geen jury sessies na max_jury_timeslot
-        for team in all_teams:
-            for ts in range(max_jury_timeslot + 1, NUM_TIMESLOTS):
-                for jury_room in all_jury_rooms:
-                    model.add(jury_sessions[(team, ts, jury_room)] == 0)
-        
-        # Waarschuwing als de constraint te restrictief is
-        if max_match_timeslot < 0:
-            print(f"      ⚠️  WARNING: END_TIME ({END_TIME} min) is te vroeg voor matches!")
-        if max_jury_timeslot < 0:
-            print(f"      ⚠️  WARNING: END_TIME ({END_TIME} min) is te vroeg voor jury sessies!")
 
-    # ===== OPTIMALISATIE =====
-    
+def add_objective_reified(config, model, index, profiler):
+    """Oude doel formulering: hulp variabelen met reified constraints per term
+
+    Geeft (doel termen, tables_used) terug, zie OBJECTIVE_WEIGHTS.
+    """
+    all_teams = range(config.num_teams)
+    all_tables = range(config.num_tables)
+    all_match_timeslots = range(config.num_timeslots)
+    matches = index.matches
+    match_teams = index.match_teams
+
+    profiler.start("Doel: tafel paren")
     # Soft constraint: tafel paren zo vaak mogelijk beide bezet of beide leeg
-    if 'TABLE_PAIRS' in globals() and TABLE_PAIRS:
-        print("   └─ Tafel paren optimalisatie...")
-        pair_violations = []
+    pair_violations = []
+    if config.table_pairs:
+        say(config, "   └─ Tafel paren optimalisatie...")
         
-        for table1, table2 in TABLE_PAIRS:
-            if table1 < NUM_TABLES and table2 < NUM_TABLES:
+        for table1, table2 in config.table_pairs:
+            if table1 < config.num_tables and table2 < config.num_tables:
                 for ts in all_match_timeslots:
+                    if not match_teams[ts]:
+                        continue  # Niemand kan hier spelen: beide tafels leeg, geen violation
                     # Check of tafel1 en tafel2 beide bezet zijn of beide leeg
                     table1_used = model.new_bool_var(f'ts{ts}_tb{table1}_used')
                     table2_used = model.new_bool_var(f'ts{ts}_tb{table2}_used')
                     
                     # table1_used = 1 als er een team op tafel1 speelt op tijdslot ts
-                    model.add(sum(matches[(team, ts, table1)] for team in all_teams) >= 1).only_enforce_if(table1_used)
-                    model.add(sum(matches[(team, ts, table1)] for team in all_teams) == 0).only_enforce_if(table1_used.Not())
+                    model.add(index.table_used(ts, table1) >= 1).only_enforce_if(table1_used)
+                    model.add(index.table_used(ts, table1) == 0).only_enforce_if(table1_used.Not())
                     
                     # table2_used = 1 als er een team op tafel2 speelt op tijdslot ts
-                    model.add(sum(matches[(team, ts, table2)] for team in all_teams) >= 1).only_enforce_if(table2_used)
-                    model.add(sum(matches[(team, ts, table2)] for team in all_teams) == 0).only_enforce_if(table2_used.Not())
+                    model.add(index.table_used(ts, table2) >= 1).only_enforce_if(table2_used)
+                    model.add(index.table_used(ts, table2) == 0).only_enforce_if(table2_used.Not())
                     
                     # Violation: XOR van table1_used en table2_used (1 als ze verschillend zijn)
                     pair_mismatch = model.new_bool_var(f'ts{ts}_pair{table1}_{table2}_mismatch')
@@ -341,27 +681,29 @@ def create_complete_schedule():
                     
                     pair_violations.append(pair_mismatch)
     
+    profiler.start("Doel: tafels per team")
     # Preferentie: teams spelen op zo VEEL mogelijk verschillende tafels
     # Dit zorgt voor maximale variatie in tegenstanders
     tables_used = {}
     for team in all_teams:
         for table in all_tables:
             tables_used[(team, table)] = model.new_bool_var(f"t{team}_uses_tb{table}")
-            team_matches_on_table = [matches[(team, ts, table)] for ts in all_match_timeslots]
-            model.add(sum(team_matches_on_table) >= 1).only_enforce_if(tables_used[(team, table)])
-            model.add(sum(team_matches_on_table) == 0).only_enforce_if(tables_used[(team, table)].Not())
+            team_matches_on_table = cp_model.LinearExpr.sum(index.team_table_matches[(team, table)])
+            model.add(team_matches_on_table >= 1).only_enforce_if(tables_used[(team, table)])
+            model.add(team_matches_on_table == 0).only_enforce_if(tables_used[(team, table)].Not())
 
+    profiler.start("Doel: lege tijdsloten en laatste match")
     # Optimalisatie: Minimaliseer lege tijdsloten (maximaliseer tafel gebruik)
-    print("   └─ Minimaliseer lege tijdsloten en pack matches vroeg...")
+    say(config, "   └─ Minimaliseer lege tijdsloten en pack matches vroeg...")
     empty_slots = []
-    latest_match_timeslot = model.new_int_var(0, NUM_TIMESLOTS - 1, 'latest_match_ts')
+    latest_match_timeslot = model.new_int_var(0, config.num_timeslots - 1, 'latest_match_ts')
     
     for ts in all_match_timeslots:
         for table in all_tables:
             # empty_slot = 1 als deze tafel leeg is op dit tijdslot
             empty_slot = model.new_bool_var(f'empty_ts{ts}_tb{table}')
             # Er is een match op deze tafel/tijdslot
-            match_sum = sum(matches[(team, ts, table)] for team in all_teams)
+            match_sum = index.table_used(ts, table)
             # match_sum is 0 of 1 (door at_most_one constraint)
             # empty_slot = 1 - match_sum
             # We gebruiken: als match_sum == 0, dan empty_slot = 1
@@ -377,17 +719,18 @@ def create_complete_schedule():
             empty_slots.append(empty_slot)
             
             # Track latest timeslot: als er een match is, dan latest_match_timeslot >= ts
-            for team in all_teams:
+            for match_var in index.slot_table_matches[(ts, table)]:
                 # Als match[(team, ts, table)] = 1, dan latest_match_timeslot >= ts
-                model.add(latest_match_timeslot >= ts).only_enforce_if(matches[(team, ts, table)])
+                model.add(latest_match_timeslot >= ts).only_enforce_if(match_var)
     
     total_empty_slots = sum(empty_slots)
     
+    profiler.start("Doel: vroege tijdsloten")
     # Extra optimalisatie: Prefer earlier timeslots (kleine penalty per timeslot)
     # Dit helpt matches vroeg te packen en gaps te vullen
     timeslot_penalties = []
     for ts in all_match_timeslots:
-        for team in all_teams:
+        for team in match_teams[ts]:
             for table in all_tables:
                 # Penalty = ts als match gescheduled is, anders 0
                 # We maken een variable die ts is als match = 1, anders 0
@@ -403,114 +746,1445 @@ def create_complete_schedule():
     # NIEUWE optimalisatie: Bestraf lege slots die tussen matches vallen
     # Dit voorkomt dat er grote gaten ontstaan tussen matches
     # We bestraffen lege slots die tussen twee matches vallen (compactheid)
-    print("   └─ Compactheid optimalisatie...")
+    say(config, "   └─ Compactheid optimalisatie...")
     # De penalty voor lege slots is al verhoogd, maar we voegen een extra penalty toe
     # voor lege slots die tussen matches vallen (dit wordt al gedekt door total_empty_slots)
     # We verhogen gewoon de penalty voor lege slots verder
 
-    # Gecombineerde optimalisatie doelen:
-    # 1. HOOGSTE PRIORITEIT: Minimaliseer tafel paar violations (cost 100000)
-    # 2. TWEEDE PRIORITEIT: Minimaliseer lege tijdsloten (cost 10000) - ZEER VERHOOGD voor betere packing
-    # 3. DERDE PRIORITEIT: Minimaliseer laatste match timeslot (cost 50) - pack matches vroeg
-    # 4. VIERDE PRIORITEIT: Prefer earlier timeslots (cost 1 per timeslot) - pack vroeg
-    # 5. VIJFDE PRIORITEIT: MAXIMALISEER aantal verschillende tafels per team (negatieve cost = beloning)
-    total_tables_used = sum(tables_used[(team, table)] for team in all_teams for table in all_tables)
-    
-    if 'pair_violations' in locals() and pair_violations:
-        # Tafel paren zijn VEEL belangrijker (cost 100000)
-        # Lege slots zijn zeer belangrijk (cost 10000) - ZEER sterk verhoogd om gaten te voorkomen
-        # Pack matches vroeg (cost 50 per timeslot voor laatste match) - verhoogd
-        # Prefer earlier timeslots (cost 1 per timeslot per match)
-        # Meer tafels per team = beloning (negatieve cost -1 per extra tafel)
-        model.minimize(
-            sum(pair_violations) * 100000 + 
-            total_empty_slots * 10000 + 
-            latest_match_timeslot * 50 +
-            total_timeslot_penalty * 1 - 
-            total_tables_used
-        )
-    else:
-        # Minimaliseer lege slots (cost 10000) - ZEER sterk verhoogd om gaten te voorkomen
-        # Pack matches vroeg (cost 50 per timeslot voor laatste match) - verhoogd
-        # Prefer earlier timeslots (cost 1 per timeslot per match)
-        # Maximaliseer tafel spreiding (negatieve cost -1)
-        model.minimize(
-            total_empty_slots * 10000 + 
-            latest_match_timeslot * 50 + 
-            total_timeslot_penalty * 1 - 
-            total_tables_used
-        )
+    terms = {
+        'pair_violations': sum(pair_violations),
+        'empty_slots': total_empty_slots,
+        'latest_match_timeslot': latest_match_timeslot,
+        'timeslot_penalty': total_timeslot_penalty,
+        'tables_used': sum(tables_used[(team, table)] for team in all_teams for table in all_tables),
+    }
+    return terms, tables_used
 
-    # ===== OPLOSSEN =====
-    
-    solver = cp_model.CpSolver()
-    solver.parameters.max_time_in_seconds = MAX_SOLVE_TIME
-    solver.parameters.num_search_workers = 8  # Parallel zoeken
-    
-    print("🔍 Bezig met zoeken naar optimale oplossing...")
-    print(f"   (max {MAX_SOLVE_TIME} seconden)\n")
-    
-    status = solver.solve(model)
 
-    if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-        print("✅ Oplossing gevonden!\n")
-        return {
-            'solver': solver,
-            'matches': matches,
-            'jury_sessions': jury_sessions,
-            'status': status,
-            'tables_used': tables_used
-        }
-    else:
-        print("❌ Geen oplossing gevonden!\n")
-        return None
+def add_objective_linear(config, model, index, profiler):
+    """Lichte doel formulering: gewogen lineaire expressies over de match variabelen
 
+    Alle termen zijn lineair in de bestaande booleans; er zijn alleen hulp variabelen
+    nodig waar een term niet lineair is (paar mismatch, tafels per team, laatste match),
+    en die worden alleen van de goede kant begrensd omdat het doel ze al in de juiste
+    richting drukt. De optimale doelwaarde is gelijk aan die van add_objective_reified.
+    Geeft (doel termen, tables_used) terug, zie OBJECTIVE_WEIGHTS.
+    """
+    all_teams = range(config.num_teams)
+    all_tables = range(config.num_tables)
+    all_match_timeslots = range(config.num_timeslots)
 
-def build_json_output(result):
-    """Bouwt de JSON output"""
-    if result is None:
-        return None
+    profiler.start("Doel: tafel paren")
+    # Tafel paren: mismatch >= |tafel1 bezet - tafel2 bezet|, het doel drukt mismatch naar 0
+    pair_violations = []
+    if config.table_pairs:
+        say(config, "   └─ Tafel paren optimalisatie...")
+        for table1, table2 in config.table_pairs:
+            if table1 < config.num_tables and table2 < config.num_tables:
+                for ts in all_match_timeslots:
+                    if not index.match_teams[ts]:
+                        continue  # Niemand kan hier spelen: beide tafels leeg, geen violation
+                    pair_mismatch = model.new_bool_var(f'ts{ts}_pair{table1}_{table2}_mismatch')
+                    model.add(pair_mismatch >= index.table_used(ts, table1) - index.table_used(ts, table2))
+                    model.add(pair_mismatch >= index.table_used(ts, table2) - index.table_used(ts, table1))
+                    pair_violations.append(pair_mismatch)
+
+    profiler.start("Doel: tafels per team")
+    # Tafels per team: tables_used mag alleen 1 zijn als het team er echt speelt (beloning)
+    tables_used = {}
+    for team in all_teams:
+        for table in all_tables:
+            tables_used[(team, table)] = model.new_bool_var(f"t{team}_uses_tb{table}")
+            model.add(tables_used[(team, table)] <=
+                      cp_model.LinearExpr.sum(index.team_table_matches[(team, table)]))
+
+    profiler.start("Doel: lege tijdsloten en laatste match")
+    say(config, "   └─ Minimaliseer lege tijdsloten en pack matches vroeg...")
+    # Lege tafel/tijdslot combinaties: alle slots min het aantal geplande matches. Door
+    # constraint 1 ligt het aantal matches vast, dus deze term is een constante
+    total_empty_slots = config.num_timeslots * config.num_tables - config.num_teams * config.matches_per_team
+
+    # Laatste match: latest >= ts * (tafel bezet), 1 constraint per tafel/tijdslot in plaats van per match
+    latest_match_timeslot = model.new_int_var(0, config.num_timeslots - 1, 'latest_match_ts')
+    for ts in all_match_timeslots:
+        if index.match_teams[ts]:
+            for table in all_tables:
+                model.add(latest_match_timeslot >= ts * index.table_used(ts, table))
+
+    profiler.start("Doel: vroege tijdsloten")
+    # Vroege tijdsloten: penalty ts per geplande match, direct als gewogen som
+    total_timeslot_penalty = cp_model.LinearExpr.weighted_sum(
+        list(index.matches.values()), [ts for (team, ts, table) in index.matches])
+
+    terms = {
+        'pair_violations': cp_model.LinearExpr.sum(pair_violations),
+        'empty_slots': total_empty_slots,
+        'latest_match_timeslot': latest_match_timeslot,
+        'timeslot_penalty': total_timeslot_penalty,
+        'tables_used': cp_model.LinearExpr.sum(list(tables_used.values())),
+    }
+    return terms, tables_used
+
+
+def build_complete_model(config, jury_assignment=None, profiler=None, diagnose=False):
+    """Bouwt het CP-SAT model met alle variabelen, constraints en het optimalisatie doel
     
-    solver = result['solver']
-    matches = result['matches']
-    jury_sessions = result['jury_sessions']
+    Met een jury_assignment ({team: (tijdslot, jury_room)} uit fase 1) wordt alleen het
+    match model gebouwd: jury sessies en de geblokkeerde match tijdsloten rond elke jury
+    sessie zijn dan constanten en de overlap constraints (8) vervallen.
+    Met een actieve profiler wordt elk onderdeel (constraint familie, doel term) gemeten.
+    Met diagnose=True hangt elke constraint familie af van een eigen literal (zie
+    ConstraintFamilies) voor diagnose_infeasibility.
+    """
+    if profiler is None:
+        profiler = BuildProfiler(enabled=False)
     
-    # Hulp functie: voeg pauze toe aan tijden na BREAK_START_TIME
-    def adjust_time_for_break(time_minutes):
-        """Voegt BREAK_DURATION toe aan tijden die na de pauze vallen"""
-        if BREAK_ENABLED and time_minutes >= BREAK_START_TIME:
-            return time_minutes + BREAK_DURATION
-        return time_minutes
+    all_teams = range(config.num_teams)
+    all_tables = range(config.num_tables)
+    all_jury_rooms = range(config.num_jury_rooms)
     
-    output = {
-        "constraintConfiguration": {
-            "constraintWeight": "1hard/0medium/0soft",
-            "minimumBreakDuration": MINIMUM_BUFFER_TIME,
-            "startTime": START_TIME,
-            "endTime": END_TIME,
-            "breakStartTime": BREAK_START_TIME,
-            "breakDuration": BREAK_DURATION,
-            "matchDuration": MATCH_DURATION,
-            "juryDuration": JURY_DURATION
-        },
-        "tableList": [],
-        "tablePairList": [],
-        "juryList": [],
-        "teamList": [],
-        "tableTimeslotList": [],
-        "juryTimeslotList": [],
-        "teamTableAllocationList": [],
-        "teamJuryAllocationList": [],
-        "score": "0hard/0medium/0soft" if result['status'] == cp_model.OPTIMAL else "1hard/0medium/0soft"
-    }
+    # Bereken hoeveel tijdsloten we nodig hebben
+    # Voor matches: tijdslot duur = MATCH_DURATION
+    # Voor jury: tijdslot duur = JURY_DURATION
+    all_match_timeslots = range(config.num_timeslots)
+    
+    say(config, f"\n🏆 FLL COMPLETE TOURNAMENT SCHEDULER")
+    say(config, f"=" * 70)
+    say(config, f"📋 Configuratie:")
+    say(config, f"   Teams: {config.num_teams}")
+    say(config, f"   Tafels: {config.num_tables}")
+    say(config, f"   Jury Rooms: {config.num_jury_rooms}")
+    say(config, f"   Tijdsloten: {config.num_timeslots}")
+    say(config, f"   Wedstrijden per team: {config.matches_per_team}")
+    say(config, f"   Jury sessies per team: {config.jury_sessions_per_team}")
+    say(config, f"   Min. buffer tijd: {config.minimum_buffer_time} min")
+    if config.end_time is not None:
+        end_hours = config.end_time // 60
+        end_minutes = config.end_time % 60
+        say(config, f"   Eind tijd: {config.end_time} min ({end_hours}u{end_minutes:02d})")
+    say(config, f"=" * 70 + "\n")
+
+    # Capacity check
+    total_matches = config.num_teams * config.matches_per_team
+    max_match_capacity = config.num_timeslots * config.num_tables
+    total_jury_sessions = config.num_teams * config.jury_sessions_per_team
+    max_jury_capacity = config.num_timeslots * config.num_jury_rooms
+    
+    say(config, f"📊 Capaciteit check:")
+    say(config, f"   Matches: {total_matches} nodig, {max_match_capacity} beschikbaar")
+    say(config, f"   Jury sessies: {total_jury_sessions} nodig, {max_jury_capacity} beschikbaar")
+    
+    if total_matches > max_match_capacity:
+        say(config, f"   ⚠️  Onvoldoende match capaciteit!")
+        return None
+    if total_jury_sessions > max_jury_capacity:
+        say(config, f"   ⚠️  Onvoldoende jury capaciteit!")
+        return None
+    say(config, f"   ✅ Capaciteit OK\n")
+
+    model = cp_model.CpModel()
+    profiler.attach(model)
+
+    # ===== DOMEINEN =====
+
+    profiler.start("Domeinen")
+    # Alleen (team, tijdslot) combinaties die ooit gebruikt kunnen worden krijgen variabelen;
+    # alle loops hieronder lopen over deze lijsten in plaats van over alle tijdsloten
+    domains = compute_domains(config, jury_assignment)
+    match_slots = domains['match_slots']
+    match_teams = domains['match_teams']
+    num_match_vars = sum(len(slots) for slots in match_slots.values()) * config.num_tables
+    all_match_vars = config.num_teams * config.num_timeslots * config.num_tables
+    say(config, f"🧮 Domein: {num_match_vars:,} van {all_match_vars:,} match variabelen nodig\n")
+
+    # ===== VARIABELEN =====
+
+    profiler.start("Variabelen")
+    # Matches: matches[(team, timeslot, table)]
+    matches = {}
+    for team in all_teams:
+        for ts in match_slots[team]:
+            for table in all_tables:
+                matches[(team, ts, table)] = model.new_bool_var(
+                    f"match_t{team}_ts{ts}_tb{table}"
+                )
+
+    # Jury sessies: jury_sessions[(team, timeslot, jury_room)]
+    # Bij een vaste jury planning (fase 2) is er per team 1 constante sessie
+    jury_sessions = {}
+    for team in all_teams:
+        if jury_assignment is not None:
+            jury_sessions[(team, *jury_assignment[team])] = model.new_constant(1)
+            continue
+        for ts in domains['jury_slots'][team]:
+            for jury_room in all_jury_rooms:
+                jury_sessions[(team, ts, jury_room)] = model.new_bool_var(
+                    f"jury_t{team}_ts{ts}_jr{jury_room}"
+                )
+
+    # Variabelen per team/tijdslot/tafel/room groeperen: 1 keer, voor alle constraints hieronder
+    index = ModelIndex(config, domains, matches, jury_sessions)
+    families = ConstraintFamilies(model, enabled=diagnose)
+
+    # ===== CONSTRAINTS VOOR MATCHES =====
+    
+    say(config, "🔧 Toevoegen van constraints...")
+    
+    profiler.start("1. Matches per team")
+    # 1. Elk team speelt precies MATCHES_PER_TEAM wedstrijden
+    for team in all_teams:
+        families.add("1. Matches per team",
+                     cp_model.LinearExpr.sum(index.team_matches[team]) == config.matches_per_team)
+
+    profiler.start("2. 1 team per tafel")
+    # 2. Maximaal 1 team per tafel per tijdslot
+    for table_vars in index.slot_table_matches.values():
+        families.add_at_most_one("2. 1 team per tafel", table_vars)
+
+    profiler.start("3. 1 tafel per team")
+    # 3. Een team kan maar op 1 tafel per tijdslot spelen
+    for team_vars in index.team_slot_matches.values():
+        families.add_at_most_one("3. 1 tafel per team", team_vars)
+    
+    profiler.start("4. Unieke tegenstanders")
+    # 4. Twee teams mogen maximaal 1 keer tegen elkaar spelen
+    # Teams spelen tegen elkaar als ze op hetzelfde tijdslot op een tafel paar spelen
+    say(config, "   └─ Unique opponents...")
+    
+    valid_table_pairs = [(table1, table2) for table1, table2 in config.table_pairs
+                         if table1 < config.num_tables and table2 < config.num_tables]
+
+    if config.opponent_model == "compact" and valid_table_pairs:
+        # on_pair[(team, ts, pair)] = 1 als het team op dit tijdslot op een tafel van dit paar speelt
+        on_pair = {}
+        for team in all_teams:
+            for ts in match_slots[team]:
+                for pair_idx, (table1, table2) in enumerate(valid_table_pairs):
+                    on_pair[(team, ts, pair_idx)] = model.new_bool_var(f'onpair_t{team}_ts{ts}_p{pair_idx}')
+                    model.add(on_pair[(team, ts, pair_idx)] ==
+                              matches[(team, ts, table1)] + matches[(team, ts, table2)])
+
+        # meet[ts] = 1 als team1 en team2 op tijdslot ts op hetzelfde tafel paar staan.
+        # Een clause per paar (geen reificatie) en 1 at_most_one per team paar.
+        match_slot_sets = {team: set(match_slots[team]) for team in all_teams}
+        for team1 in all_teams:
+            for team2 in all_teams:
+                if team1 < team2:
+                    meets = []
+                    for ts in match_slots[team1]:
+                        if ts not in match_slot_sets[team2]:
+                            continue
+                        meet = model.new_bool_var(f'meet_t{team1}_t{team2}_ts{ts}')
+                        for pair_idx in range(len(valid_table_pairs)):
+                            model.add_bool_or([on_pair[(team1, ts, pair_idx)].Not(),
+                                               on_pair[(team2, ts, pair_idx)].Not(),
+                                               meet])
+                        meets.append(meet)
+                    families.add_at_most_one("4. Unieke tegenstanders", meets)
+    else:
+        # Maak variabelen voor welke team paren tegen elkaar hebben gespeeld
+        team_matchups = {}
+        for team1 in all_teams:
+            for team2 in all_teams:
+                if team1 < team2:  # Voorkom duplicaten (team1, team2) == (team2, team1)
+                    team_matchups[(team1, team2)] = model.new_int_var(0, config.matches_per_team, 
+                        f'matchup_t{team1}_t{team2}')
+    
+        # Bereken hoe vaak elk team paar tegen elkaar speelt
+        if config.table_pairs:
+            match_slot_sets = {team: set(match_slots[team]) for team in all_teams}
+            for team1 in all_teams:
+                for team2 in all_teams:
+                    if team1 < team2:
+                        matchup_count = []
+                        # Voor elk tafel paar, check of beide teams daar tegelijk spelen
+                        for table1, table2 in config.table_pairs:
+                            if table1 < config.num_tables and table2 < config.num_tables:
+                                for ts in match_slots[team1]:
+                                    if ts not in match_slot_sets[team2]:
+                                        continue
+                                    # Beide teams spelen op dit paar op dit tijdslot
+                                    both_play = model.new_bool_var(f'both_t{team1}_t{team2}_ts{ts}_pair{table1}_{table2}')
+                                
+                                    # team1 op table1 EN team2 op table2
+                                    option1 = model.new_bool_var(f'opt1_t{team1}_t{team2}_ts{ts}_p{table1}_{table2}')
+                                    model.add_bool_and([matches[(team1, ts, table1)], 
+                                                       matches[(team2, ts, table2)]]).only_enforce_if(option1)
+                                    model.add_bool_or([matches[(team1, ts, table1)].Not(), 
+                                                      matches[(team2, ts, table2)].Not()]).only_enforce_if(option1.Not())
+                                
+                                    # team1 op table2 EN team2 op table1
+                                    option2 = model.new_bool_var(f'opt2_t{team1}_t{team2}_ts{ts}_p{table1}_{table2}')
+                                    model.add_bool_and([matches[(team1, ts, table2)], 
+                                                       matches[(team2, ts, table1)]]).only_enforce_if(option2)
+                                    model.add_bool_or([matches[(team1, ts, table2)].Not(), 
+                                                      matches[(team2, ts, table1)].Not()]).only_enforce_if(option2.Not())
+                                
+                                    # both_play = option1 OR option2
+                                    model.add_bool_or([option1, option2]).only_enforce_if(both_play)
+                                    model.add_bool_and([option1.Not(), option2.Not()]).only_enforce_if(both_play.Not())
+                                
+                                    matchup_count.append(both_play)
+                    
+                        # Totaal aantal keer dat team1 en team2 tegen elkaar spelen
+                        if matchup_count:
+                            model.add(sum(matchup_count) == team_matchups[(team1, team2)])
+                            # Maximaal 1 keer tegen elkaar spelen
+                            families.add("4. Unieke tegenstanders", team_matchups[(team1, team2)] <= 1)
+
+    allowed_jury_start_slots = jury_round_start_slots(config)
+
+    if jury_assignment is None:
+        add_jury_constraints(config, model, index, allowed_jury_start_slots, profiler, families)
+        add_jury_match_overlap_constraints(config, model, index, profiler, families)
+
+    profiler.start("9. Match spacing")
+    # 9. Buffer tijd tussen opeenvolgende matches
+    say(config, "   └─ Match spacing...")
+    # We hebben minstens MINIMUM_BUFFER_TIME nodig TUSSEN twee matches
+    # Als match 1 eindigt op tijd T, dan moet match 2 starten op T + MINIMUM_BUFFER_TIME
+    # In termen van tijdsloten: als match op ts1, dan match 2 op ts2
+    # waarbij (ts2 * MATCH_DURATION) >= (ts1 * MATCH_DURATION + MATCH_DURATION + MINIMUM_BUFFER_TIME)
+    # ts2 >= ts1 + 1 + (MINIMUM_BUFFER_TIME / MATCH_DURATION)
+    min_match_gap = 1 + ((config.minimum_buffer_time + config.match_duration - 1) // config.match_duration)
+    
+    say(config, f"      Min. gap tussen matches: {min_match_gap} tijdsloten ({min_match_gap * config.match_duration} min)")
+    
+    for team in all_teams:
+        team_match_slots = set(match_slots[team])
+        for ts in match_slots[team]:
+            for gap in range(1, min_match_gap):
+                next_ts = ts + gap
+                if next_ts in team_match_slots:
+                    families.add("9. Match spacing", index.plays(team, ts) + index.plays(team, next_ts) <= 1)
+    
+    profiler.start("11. Eind tijd")
+    # 11. END TIME CONSTRAINT: Alle events moeten voor END_TIME afgelopen zijn
+    if config.end_time is not None:
+        say(config, f"   └─ End time constraint: {config.end_time} minuten "
+                    f"({config.end_time // 60}u{config.end_time % 60:02d})")
+        
+        # Bereken de laatste toegestane timeslot voor matches
+        # Match op timeslot ts eindigt op: ts * MATCH_DURATION + MATCH_DURATION
+        # Dit moet <= END_TIME zijn, dus: ts * MATCH_DURATION + MATCH_DURATION <= END_TIME
+        # ts <= (END_TIME - MATCH_DURATION) / MATCH_DURATION
+        max_match_timeslot = (config.end_time - config.match_duration) // config.match_duration
+        
+        # Bereken de laatste toegestane timeslot voor jury sessies
+        # Jury op timeslot ts eindigt op: ts * MATCH_DURATION + JURY_DURATION
+        # Dit moet <= END_TIME zijn, dus: ts * MATCH_DURATION + JURY_DURATION <= END_TIME
+        # ts <= (END_TIME - JURY_DURATION) / MATCH_DURATION
+        max_jury_timeslot = (config.end_time - config.jury_duration) // config.match_duration
+        
+        say(config, f"      Max match timeslot: {max_match_timeslot} "
+                    f"(eindt op {max_match_timeslot * config.match_duration + config.match_duration} min)")
+        say(config, f"      Max jury timeslot: {max_jury_timeslot} "
+                    f"(eindt op {max_jury_timeslot * config.match_duration + config.jury_duration} min)")
+        
+        # Geen matches na max_match_timeslot en geen jury sessies na max_jury_timeslot:
+        # deze tijdsloten zijn al uit de domeinen weggelaten (compute_domains)
+        
+        # Waarschuwing als de constraint te restrictief is
+        if max_match_timeslot < 0:
+            say(config, f"      ⚠️  WARNING: END_TIME ({config.end_time} min) is te vroeg voor matches!")
+        if max_jury_timeslot < 0:
+            say(config, f"      ⚠️  WARNING: END_TIME ({config.end_time} min) is te vroeg voor jury sessies!")
+
+    if config.symmetry_breaking:
+        say(config, "   └─ Symmetry breaking...")
+        add_symmetry_breaking(config, model, index, allowed_jury_start_slots, profiler, families,
+                              fixed_jury=jury_assignment is not None)
+
+    # ===== OPTIMALISATIE =====
+
+    if config.objective_model == "linear":
+        terms, tables_used = add_objective_linear(config, model, index, profiler)
+    else:
+        terms, tables_used = add_objective_reified(config, model, index, profiler)
+
+    profiler.start("Doel: minimize")
+    # Gecombineerde optimalisatie doelen:
+    # 1. HOOGSTE PRIORITEIT: Minimaliseer tafel paar violations (cost 100000)
+    # 2. TWEEDE PRIORITEIT: Minimaliseer lege tijdsloten (cost 10000) - ZEER VERHOOGD voor betere packing
+    # 3. DERDE PRIORITEIT: Minimaliseer laatste match timeslot (cost 50) - pack matches vroeg
+    # 4. VIERDE PRIORITEIT: Prefer earlier timeslots (cost 1 per timeslot) - pack vroeg
+    # 5. VIJFDE PRIORITEIT: MAXIMALISEER aantal verschillende tafels per team (negatieve cost = beloning)
+    # Bij OBJECTIVE_STRATEGY = "hierarchical" vervangt solve_hierarchical dit doel per niveau
+    model.minimize(sum(weight * terms[name] for name, weight in OBJECTIVE_WEIGHTS.items()))
+    profiler.stop()
+
+    return {
+        'model': model,
+        'matches': matches,
+        'jury_sessions': jury_sessions,
+        'tables_used': tables_used,
+        'index': index,
+        'families': families,
+        'objective_terms': terms
+    }
+
+
+def load_schedule_hint(config, filename):
+    """Leest een eerder schema (JSON) terug als (team, tijdslot, tafel/room) tuples
+
+    Tijdslot ids zijn ts * aantal tafels (of rooms) + tafel, met de aantallen uit het oude
+    schema. De tijdsloten worden via de minuten omgerekend naar de huidige MATCH_DURATION,
+    zodat ook een schema met een andere wedstrijd duur als hint bruikbaar is.
+    """
+    data = load_schedule(filename)
+
+    num_tables = len(data['tableList'])
+    num_jury_rooms = len(data['juryList'])
+    match_duration = data['constraintConfiguration'].get('matchDuration', config.match_duration)
+
+    def to_timeslot(old_ts):
+        return calculate_timeslot_from_minutes(old_ts * match_duration, config.match_duration)
+
+    matches = set()
+    for allocation in data['teamTableAllocationList']:
+        old_ts, table = divmod(allocation['timeslot']['id'], num_tables)
+        matches.add((allocation['team']['id'], to_timeslot(old_ts), table))
+
+    jury_sessions = set()
+    for allocation in data['teamJuryAllocationList']:
+        old_ts, jury_room = divmod(allocation['timeslot']['id'], num_jury_rooms)
+        jury_sessions.add((allocation['team']['id'], to_timeslot(old_ts), jury_room))
+
+    return {'matches': matches, 'jury_sessions': jury_sessions}
+
+
+def add_schedule_hint(config, model, index, hint):
+    """Zet een eerder schema als solution hint op de match en jury variabelen
+
+    Matches en jury sessies die in het huidige model niet bestaan (team, tafel of tijdslot
+    valt buiten de nieuwe configuratie) worden overgeslagen; alle andere variabelen krijgen
+    hint 0, zodat de solver direct een (bijna) complete start oplossing heeft.
+    """
+    used = 0
+    for key, var in index.matches.items():
+        in_hint = key in hint['matches']
+        used += in_hint
+        model.add_hint(var, in_hint)
+    hinted = set()
+    for key, var in index.jury_sessions.items():
+        in_hint = key in hint['jury_sessions']
+        used += in_hint
+        # Vaste jury sessies (fase 2) zijn allemaal dezelfde constante: die maar 1 keer hinten
+        if var.index not in hinted:
+            hinted.add(var.index)
+            model.add_hint(var, in_hint)
+
+    total = len(hint['matches']) + len(hint['jury_sessions'])
+    say(config, f"💡 Hint: {used} van {total} activiteiten uit het vorige schema overgenomen")
+    if used < total:
+        say(config, f"   ({total - used} vallen buiten de huidige configuratie en worden opnieuw gepland)")
+    say(config)
+    return used
+
+
+def complete_schedule_hint(config, model, max_time=10):
+    """Vult een hint op de match en jury variabelen aan tot een hint op alle variabelen
+
+    CP-SAT maakt van een gedeeltelijke hint (zonder hulp variabelen en doel termen) niet
+    direct een eerste oplossing. Met de gehinte variabelen vast is het model snel opgelost;
+    die volledige oplossing wordt de nieuwe hint. Geeft False als de hint niet haalbaar is.
+    """
+    solver = new_solver(config, max_time)
+    solver.parameters.fix_variables_to_their_hinted_value = True
+    status = solver.solve(model)
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return False
+
+    model.clear_hints()
+    for var_index, var_value in enumerate(solver.response_proto.solution):
+        model.add_hint(model.get_int_var_from_proto_index(var_index), var_value)
+    return True
+
+
+def new_solver(config, max_time):
+    """CP-SAT solver met de standaard zoek instellingen"""
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = max_time
+    solver.parameters.num_search_workers = resolve_num_workers(config.num_search_workers)  # Parallel zoeken
+    solver.parameters.log_search_progress = config.log_search_progress
+    if config.deterministic_search:
+        solver.parameters.interleave_search = True
+    if config.hint_from is not None:
+        # Een hint uit een gewijzigde configuratie is vaak net niet haalbaar: laat de solver hem repareren
+        solver.parameters.repair_hint = True
+    elif config.greedy_hint:
+        # Symmetrie detectie in presolve zet variabelen vast en gooit zo de constructieve hint weg
+        solver.parameters.symmetry_level = 0
+    return solver
+
+
+def solve_hierarchical(config, model, terms, profiler):
+    """Lost het doel lexicografisch op: 1 niveau per doel term, in volgorde van OBJECTIVE_WEIGHTS
+
+    Na elk niveau wordt de bereikte waarde als constraint vastgelegd en start het volgende
+    niveau vanuit de vorige oplossing (solution hint). Zo zijn geen grote gewichten nodig.
+    Geeft (solver, status, niveaus) terug; solver is die van het laatste geslaagde niveau.
+    """
+    best_solver = None
+    best_status = cp_model.UNKNOWN
+    levels = []
+
+    for name, weight in OBJECTIVE_WEIGHTS.items():
+        term = terms[name]
+        if isinstance(term, int):
+            continue  # Constante term (bijv. geen tafel paren): niets te optimaliseren
+        # Negatief gewicht = maximaliseren
+        level_objective = term if weight > 0 else -term
+        time_limit = config.hierarchical_time_limits.get(name, config.max_solve_time)
+
+        model.minimize(level_objective)
+        solver = new_solver(config, time_limit)
+        if best_solver is None:
+            profiler.attach_solver(solver)
+        tracker = SolutionTracker()
+        say(config, f"   Niveau {len(levels) + 1}: {name} (max {time_limit} seconden)...")
+        status = solver.solve(model, tracker)
+
+        level = {
+            'name': name,
+            'status': solver.status_name(status),
+            'value': None,
+            'time': solver.wall_time,
+            'first_solution_time': tracker.first_solution_time,
+            'num_solutions': len(tracker.solutions),
+        }
+        levels.append(level)
+
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            # Niveau overslaan: de vorige oplossing (en hint) blijft geldig voor de volgende niveaus
+            say(config, f"   ⚠️  Geen oplossing voor {name} binnen {time_limit} seconden, niveau overgeslagen")
+            if best_solver is None:
+                break
+            best_status = cp_model.FEASIBLE
+            continue
+
+        value = int(solver.objective_value)
+        level['value'] = value if weight > 0 else -value
+
+        # Bereikte waarde vastleggen en volgende niveau starten vanuit deze oplossing
+        model.add(level_objective <= value)
+        model.clear_hints()
+        for var_index, var_value in enumerate(solver.response_proto.solution):
+            model.add_hint(model.get_int_var_from_proto_index(var_index), var_value)
+
+        if best_solver is None or best_status == cp_model.OPTIMAL:
+            best_status = status
+        best_solver = solver
+
+    return best_solver, best_status, levels
+
+
+# Gewicht van een match die een team in een venster achterloopt (rolling horizon): hoger dan
+# alle doel termen, want een team dat te ver achter raakt kan later niet meer ingehaald worden
+ROLLING_BEHIND_WEIGHT = 1000000
+
+
+class WindowSolvers:
+    """De solvers van alle vensters van een rolling horizon solve, opgeteld als 1 solver"""
+
+    def __init__(self):
+        self.solvers = []
+        self.trackers = []
+
+    def add(self, solver, tracker):
+        self.solvers.append(solver)
+        self.trackers.append(tracker)
+
+    @property
+    def wall_time(self):
+        return sum(solver.wall_time for solver in self.solvers)
+
+    @property
+    def num_conflicts(self):
+        return sum(solver.num_conflicts for solver in self.solvers)
+
+    @property
+    def num_branches(self):
+        return sum(solver.num_branches for solver in self.solvers)
+
+    @property
+    def num_solutions(self):
+        return sum(len(tracker.solutions) for tracker in self.trackers)
+
+    @property
+    def first_solution_time(self):
+        """Tijd tot er voor elk venster een eerste oplossing was"""
+        if not self.solvers:
+            return None
+        previous = sum(solver.wall_time for solver in self.solvers[:-1])
+        return previous + (self.trackers[-1].first_solution_time or self.solvers[-1].wall_time)
+
+    def status_name(self, status):
+        return self.solvers[-1].status_name(status)
+
+
+def later_match_capacity(free_slots, start, min_match_gap, max_match_timeslot):
+    """Maximaal aantal matches van 1 team vanaf tijdslot start (vroegst mogelijke plaatsing)"""
+    count = 0
+    ts = start
+    while ts <= max_match_timeslot:
+        if ts in free_slots:
+            count += 1
+            ts += min_match_gap
+        else:
+            ts += 1
+    return count
+
+
+def build_window_model(config, window, state, profiler, last_window):
+    """Match model voor 1 venster van de rolling horizon, met de vorige vensters als randvoorwaarden
+
+    De jury sessies liggen vast (fase 1), dus alleen matches in de tijdsloten van het venster
+    krijgen variabelen. Uit de vorige vensters komen per team het aantal resterende matches,
+    de laatste match (buffer naar het eerste tijdslot van dit venster), de gebruikte tafels en
+    de tegenstanders die al gespeeld zijn. Elk team speelt minstens zoveel matches als nodig om
+    daarna nog rond te komen; in het laatste venster precies de resterende matches.
+    """
+    all_teams = range(config.num_teams)
+    all_tables = range(config.num_tables)
+    min_match_gap = 1 + ((config.minimum_buffer_time + config.match_duration - 1) // config.match_duration)
+    remaining = state['remaining']
+
+    model = cp_model.CpModel()
+    profiler.attach(model)
+
+    profiler.start(f"Venster {window.start}-{window.stop - 1}: variabelen")
+    match_slots = {}
+    for team in all_teams:
+        first = window.start
+        if state['last_slot'][team] is not None:
+            first = max(first, state['last_slot'][team] + min_match_gap)
+        match_slots[team] = ([ts for ts in range(first, window.stop) if ts in state['free_slots'][team]]
+                             if remaining[team] > 0 else [])
+    match_teams = {ts: [] for ts in range(config.num_timeslots)}
+    for team in all_teams:
+        for ts in match_slots[team]:
+            match_teams[ts].append(team)
+    domains = {
+        'match_slots': match_slots,
+        'jury_slots': {team: [] for team in all_teams},
+        'match_teams': match_teams,
+        'jury_teams': {ts: [] for ts in range(config.num_timeslots)},
+    }
+
+    matches = {}
+    for team in all_teams:
+        for ts in match_slots[team]:
+            for table in all_tables:
+                matches[(team, ts, table)] = model.new_bool_var(f"match_t{team}_ts{ts}_tb{table}")
+    index = ModelIndex(config, domains, matches, {})
+
+    profiler.start(f"Venster {window.start}-{window.stop - 1}: constraints")
+    # 2 en 3: 1 team per tafel, 1 tafel per team
+    for table_vars in index.slot_table_matches.values():
+        if len(table_vars) > 1:
+            model.add_at_most_one(table_vars)
+    for team_vars in index.team_slot_matches.values():
+        model.add_at_most_one(team_vars)
+
+    # 9: match spacing binnen het venster (naar vorige vensters zit al in de domeinen)
+    for team in all_teams:
+        team_match_slots = set(match_slots[team])
+        for ts in match_slots[team]:
+            for gap in range(1, min_match_gap):
+                if ts + gap in team_match_slots:
+                    model.add(index.plays(team, ts) + index.plays(team, ts + gap) <= 1)
+
+    # 1: matches per team, met de ruimte na dit venster als ondergrens
+    behind = []
+    for team in all_teams:
+        played = cp_model.LinearExpr.sum(index.team_matches[team])
+        if last_window:
+            model.add(played == remaining[team])
+            continue
+        model.add(played <= remaining[team])
+        # Hard: nodig als het team direct na het venster weer kan spelen
+        optimistic = later_match_capacity(state['free_slots'][team], window.stop, min_match_gap,
+                                          state['max_match_timeslot'])
+        if remaining[team] > optimistic:
+            model.add(played >= remaining[team] - optimistic)
+        # Zacht: nodig als het team op het laatste tijdslot van het venster speelt
+        pessimistic = later_match_capacity(state['free_slots'][team], window.stop + min_match_gap - 1,
+                                           min_match_gap, state['max_match_timeslot'])
+        if remaining[team] > pessimistic:
+            shortfall = model.new_int_var(0, remaining[team], f"behind_t{team}")
+            model.add(shortfall >= remaining[team] - pessimistic - played)
+            behind.append(shortfall)
+
+    # 4: unieke tegenstanders over alle vensters
+    valid_table_pairs = [(table1, table2) for table1, table2 in config.table_pairs
+                         if table1 < config.num_tables and table2 < config.num_tables]
+    for team1, team2 in state['met']:
+        # Al tegen elkaar gespeeld: nooit meer samen op een tafel paar
+        for ts in set(match_slots[team1]) & set(match_slots[team2]):
+            for table1, table2 in valid_table_pairs:
+                model.add(matches[(team1, ts, table1)] + matches[(team1, ts, table2)] +
+                          matches[(team2, ts, table1)] + matches[(team2, ts, table2)] <= 1)
+    if len(window) > min_match_gap and valid_table_pairs:
+        # Een team kan meer dan 1 keer spelen in dit venster: ook binnen het venster uniek
+        on_pair = {}
+        for team in all_teams:
+            for ts in match_slots[team]:
+                for pair_idx, (table1, table2) in enumerate(valid_table_pairs):
+                    on_pair[(team, ts, pair_idx)] = model.new_bool_var(f'onpair_t{team}_ts{ts}_p{pair_idx}')
+                    model.add(on_pair[(team, ts, pair_idx)] ==
+                              matches[(team, ts, table1)] + matches[(team, ts, table2)])
+        match_slot_sets = {team: set(match_slots[team]) for team in all_teams}
+        for team1 in all_teams:
+            for team2 in range(team1 + 1, config.num_teams):
+                if (team1, team2) in state['met']:
+                    continue
+                meets = []
+                for ts in match_slots[team1]:
+                    if ts not in match_slot_sets[team2]:
+                        continue
+                    meet = model.new_bool_var(f'meet_t{team1}_t{team2}_ts{ts}')
+                    for pair_idx in range(len(valid_table_pairs)):
+                        model.add_bool_or([on_pair[(team1, ts, pair_idx)].Not(),
+                                           on_pair[(team2, ts, pair_idx)].Not(), meet])
+                    meets.append(meet)
+                if len(meets) > 1:
+                    model.add_at_most_one(meets)
+
+    profiler.start(f"Venster {window.start}-{window.stop - 1}: doel")
+    # Doel: zelfde termen als add_objective_linear, maar het aantal matches ligt niet vast,
+    # dus lege tafel/tijdslot combinaties tellen echt mee (vensters zo vol mogelijk)
+    pair_violations = []
+    for table1, table2 in valid_table_pairs:
+        for ts in window:
+            if not match_teams[ts]:
+                continue
+            pair_mismatch = model.new_bool_var(f'ts{ts}_pair{table1}_{table2}_mismatch')
+            model.add(pair_mismatch >= index.table_used(ts, table1) - index.table_used(ts, table2))
+            model.add(pair_mismatch >= index.table_used(ts, table2) - index.table_used(ts, table1))
+            pair_violations.append(pair_mismatch)
+
+    # Beloning voor een tafel waar het team nog niet op gespeeld heeft
+    new_tables = []
+    for team in all_teams:
+        for table in all_tables:
+            if table in state['tables'][team] or not index.team_table_matches[(team, table)]:
+                continue
+            uses = model.new_bool_var(f"t{team}_uses_tb{table}")
+            model.add(uses <= cp_model.LinearExpr.sum(index.team_table_matches[(team, table)]))
+            new_tables.append(uses)
+
+    window_capacity = sum(1 for ts in window if match_teams[ts]) * config.num_tables
+    terms = {
+        'pair_violations': cp_model.LinearExpr.sum(pair_violations),
+        'empty_slots': window_capacity - cp_model.LinearExpr.sum(list(matches.values())),
+        'timeslot_penalty': cp_model.LinearExpr.weighted_sum(list(matches.values()),
+                                                             [ts for (team, ts, table) in matches]),
+        'tables_used': cp_model.LinearExpr.sum(new_tables),
+    }
+    model.minimize(ROLLING_BEHIND_WEIGHT * cp_model.LinearExpr.sum(behind) +
+                   sum(OBJECTIVE_WEIGHTS[name] * term for name, term in terms.items()))
+    profiler.stop()
+
+    return {'model': model, 'index': index}
+
+
+def update_rolling_state(config, state, window_matches):
+    """Verwerk de matches van een opgelost venster in de randvoorwaarden voor het volgende"""
+    for team, ts, table in np.argwhere(window_matches).tolist():
+        state['remaining'][team] -= 1
+        state['last_slot'][team] = max(ts, state['last_slot'][team] if state['last_slot'][team] is not None else ts)
+        state['tables'][team].add(table)
+    for table1, table2 in config.table_pairs:
+        if table1 >= config.num_tables or table2 >= config.num_tables:
+            continue
+        for ts in np.flatnonzero(window_matches[:, :, [table1, table2]].any(axis=(0, 2))).tolist():
+            teams = np.flatnonzero(window_matches[:, ts, [table1, table2]].any(axis=1)).tolist()
+            if len(teams) == 2:
+                state['met'].add((min(teams), max(teams)))
+
+
+def solve_rolling_horizon(config, profiler):
+    """Rolling horizon voor grote toernooien: de dag in vensters van ROLLING_WINDOW_SLOTS tijdsloten
+
+    Fase 1 legt de jury rondes vast (zoals "decomposed"). Daarna wordt elk venster als eigen,
+    klein CP-SAT model opgelost met de vorige vensters als randvoorwaarden (resterende matches,
+    buffer na de laatste match, gespeelde tegenstanders). Het kwadratische tegenstander model
+    beslaat zo alleen de tijdsloten van 1 venster. De vensters samen vormen 1 oplossing die
+    net als een gewone solve door build_json_output gaat.
+    """
+    jury_assignment = assign_jury_rounds(config)
+    if jury_assignment is None:
+        return None
+
+    min_match_gap = 1 + ((config.minimum_buffer_time + config.match_duration - 1) // config.match_duration)
+    max_match_timeslot = config.num_timeslots - 1
+    if config.end_time is not None:
+        max_match_timeslot = min(max_match_timeslot, (config.end_time - config.match_duration) // config.match_duration)
+
+    # Standaard 1 match per team per venster: unieke tegenstanders dan alleen tussen vensters
+    window_size = config.rolling_window_slots or min_match_gap
+    windows = [range(start, min(start + window_size, max_match_timeslot + 1))
+               for start in range(0, max_match_timeslot + 1, window_size)]
+
+    free_slots = {}
+    for team in range(config.num_teams):
+        blocked = set(jury_blocked_match_slots(config, jury_assignment[team][0]))
+        free_slots[team] = {ts for ts in range(max_match_timeslot + 1) if ts not in blocked}
+    state = {
+        'remaining': {team: config.matches_per_team for team in range(config.num_teams)},
+        'last_slot': {team: None for team in range(config.num_teams)},
+        'tables': {team: set() for team in range(config.num_teams)},
+        'met': set(),
+        'free_slots': free_slots,
+        'max_match_timeslot': max_match_timeslot,
+    }
+
+    say(config, f"🪟 Rolling horizon: {len(windows)} vensters van {window_size} tijdsloten "
+                f"(max {config.max_solve_time} seconden samen)")
+    matches = np.zeros((config.num_teams, config.num_timeslots, config.num_tables), dtype=np.int8)
+    solvers = WindowSolvers()
+    for number, window in enumerate(windows, 1):
+        built = build_window_model(config, window, state, profiler, last_window=number == len(windows))
+        # Tijd die vorige vensters niet nodig hadden gaat naar de volgende vensters
+        window_time = max(0.1, (config.max_solve_time - solvers.wall_time) / (len(windows) - number + 1))
+        solver = new_solver(config, window_time)
+        if number == 1:
+            profiler.attach_solver(solver)
+        tracker = SolutionTracker()
+        status = solver.solve(built['model'], tracker)
+        solvers.add(solver, tracker)
+
+        label = f"Venster {number}/{len(windows)} (tijdslot {window.start}-{window.stop - 1})"
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            say(config, f"   ❌ {label}: {solver.status_name(status)}")
+            say(config, "❌ Geen oplossing gevonden! Probeer meer tijdsloten, tafels of een groter venster\n")
+            return None
+        window_matches = built['index'].solution_matrix(solver).matches
+        matches += window_matches
+        update_rolling_state(config, state, window_matches)
+        say(config, f"   {label}: {int(window_matches.sum())} matches, "
+                    f"{solver.status_name(status)} in {solver.wall_time:.2f}s")
+
+    jury = np.zeros((config.num_teams, config.num_timeslots, config.num_jury_rooms), dtype=np.int8)
+    for team, (ts, jury_room) in jury_assignment.items():
+        jury[team, ts, jury_room] = 1
+    solution = SolutionMatrix(matches, jury)
+
+    missing = [team for team, count in state['remaining'].items() if count > 0]
+    if missing:
+        say(config, f"❌ {len(missing)} teams komen matches tekort na het laatste venster\n")
+        return None
+
+    say(config, "✅ Oplossing gevonden!\n")
+    terms = solution.objective_terms(config)
+    return {
+        'solver': solvers,
+        'matches': None,
+        'jury_sessions': None,
+        'status': cp_model.FEASIBLE,
+        'tables_used': None,
+        'index': None,
+        'solution': solution,
+        'profiler': profiler,
+        'objective_value': sum(weight * terms[name] for name, weight in OBJECTIVE_WEIGHTS.items()),
+        'solve_time': solvers.wall_time,
+        'levels': None,
+        'first_solution_time': solvers.first_solution_time,
+        'num_solutions': solvers.num_solutions,
+        'num_timeslots': config.num_timeslots,
+    }
+
+
+class GreedySolver:
+    """Stand-in voor de CP-SAT solver bij een constructief schema (geen zoekwerk)"""
+    num_conflicts = 0
+    num_branches = 0
+
+    def __init__(self, wall_time):
+        self.wall_time = wall_time
+
+    def status_name(self, status):
+        return cp_model.CpSolver().status_name(status)
+
+
+# Aantal pogingen van het constructieve schema; elke poging na de eerste breekt gelijke
+# speling tussen teams in een andere (vaste, reproduceerbare) volgorde
+GREEDY_ATTEMPTS = 50
+
+
+def place_greedy_matches(config, free_slots, tie_break):
+    """1 poging van het constructieve schema: matches tijdslot voor tijdslot zo vroeg mogelijk
+
+    Per tijdslot worden de teams die kunnen spelen op volgorde van speling gezet: het aantal
+    matches dat een team nog extra kwijt kan als het dit tijdslot overslaat (negatief = nu
+    spelen). Op volgorde krijgt elk team een tegenstander waar het nog niet tegen gespeeld
+    heeft (round robin), op het vrije tafel paar met de meeste nieuwe tafels. Een team zonder
+    tegenstander speelt alleen als het niet meer kan wachten.
+    Geeft (matches, teams met te weinig matches).
+    """
+    min_match_gap = 1 + ((config.minimum_buffer_time + config.match_duration - 1) // config.match_duration)
+    max_match_timeslot = max(max(slots, default=0) for slots in free_slots.values())
+    valid_table_pairs = [(table1, table2) for table1, table2 in config.table_pairs
+                         if table1 < config.num_tables and table2 < config.num_tables]
+    paired_tables = {table for pair in valid_table_pairs for table in pair}
+    single_tables = [table for table in range(config.num_tables) if table not in paired_tables]
+
+    remaining = {team: config.matches_per_team for team in range(config.num_teams)}
+    last_slot = {team: None for team in range(config.num_teams)}
+    tables = {team: set() for team in range(config.num_teams)}
+    met = set()
+    matches = set()
+
+    def place(team, ts, table):
+        matches.add((team, ts, table))
+        remaining[team] -= 1
+        last_slot[team] = ts
+        tables[team].add(table)
+
+    for ts in range(max_match_timeslot + 1):
+        available = [team for team in range(config.num_teams)
+                     if remaining[team] > 0 and ts in free_slots[team]
+                     and (last_slot[team] is None or ts >= last_slot[team] + min_match_gap)]
+        if not available:
+            continue
+        slack = {team: later_match_capacity(free_slots[team], ts + 1, min_match_gap, max_match_timeslot)
+                 - remaining[team] for team in available}
+
+        def priority(team):
+            return slack[team], -remaining[team], tie_break[team]
+
+        def shared_later(team1, team2):
+            return sum(1 for later in free_slots[team1] if later > ts and later in free_slots[team2])
+
+        # Tegenstanders koppelen in volgorde van speling. Uit de teams die dit tijdslot toch al
+        # spelen krijgt elk team de nog niet gespeelde tegenstander met de minste gezamenlijke
+        # vrije tijdsloten hierna: teams met dezelfde jury ronde kunnen elkaar later nog treffen.
+        waiting = sorted(available, key=priority)
+        couples = []
+        alone = []
+        while waiting and len(couples) < len(valid_table_pairs):
+            team1 = waiting.pop(0)
+            seats = 2 * (len(valid_table_pairs) - len(couples)) - 1
+            candidates = [team2 for team2 in waiting if (min(team1, team2), max(team1, team2)) not in met]
+            if not candidates:
+                alone.append(team1)
+                continue
+            seated = [team2 for team2 in candidates if waiting.index(team2) < seats] or candidates[:1]
+            partner = min(seated, key=lambda team2: shared_later(team1, team2))
+            waiting.remove(partner)
+            couples.append((team1, partner))
+
+        # Elk koppel op het vrije tafel paar (en de kant) met de meeste nieuwe tafels
+        free_pairs = list(valid_table_pairs)
+        for team1, team2 in couples:
+            options = [(pair, sides) for pair in free_pairs for sides in (pair, pair[::-1])]
+            pair, (table1, table2) = max(options, key=lambda option: (option[1][0] not in tables[team1]) +
+                                         (option[1][1] not in tables[team2]))
+            free_pairs.remove(pair)
+            place(team1, ts, table1)
+            place(team2, ts, table2)
+            met.add((min(team1, team2), max(team1, team2)))
+
+        # Tafels zonder paar voor de rest; een team dat niet kan wachten desnoods alleen op een paar
+        leftover = sorted(alone + waiting, key=priority)
+        for table in single_tables:
+            if not leftover:
+                break
+            place(leftover.pop(0), ts, table)
+        for team in leftover:
+            if slack[team] >= 0 or not free_pairs:
+                continue
+            table = max(free_pairs.pop(0), key=lambda table_: table_ not in tables[team])
+            place(team, ts, table)
+
+    missing = [team for team, count in remaining.items() if count > 0]
+    return matches, missing
+
+
+def build_greedy_schedule(config):
+    """Constructief schema zonder solver: jury rondes vast, daarna matches zo vroeg mogelijk
+
+    De jury rondes komen uit assign_jury_rounds (dus op de synchrone ronde starts), de matches
+    uit place_greedy_matches. Lukt een poging niet (teams met dezelfde beschikbaarheid hebben
+    elkaar bijv. al allemaal gehad), dan volgt een poging met een andere volgorde bij gelijke
+    speling, tot GREEDY_ATTEMPTS pogingen.
+    Geeft {'matches': {(team, tijdslot, tafel)}, 'jury_sessions': {(team, tijdslot, room)}}
+    terug (zelfde vorm als load_schedule_hint), of None als niet alle matches passen.
+    """
+    if config.jury_sessions_per_team != 1:
+        say(config, f"⚠️  Het constructieve schema ondersteunt alleen 1 jury sessie per team\n")
+        return None
+    jury_assignment = assign_jury_rounds(config)
+    if jury_assignment is None:
+        return None
+
+    max_match_timeslot = config.num_timeslots - 1
+    if config.end_time is not None:
+        max_match_timeslot = min(max_match_timeslot, (config.end_time - config.match_duration) // config.match_duration)
+    free_slots = {}
+    for team in range(config.num_teams):
+        blocked = set(jury_blocked_match_slots(config, jury_assignment[team][0]))
+        free_slots[team] = {ts for ts in range(max_match_timeslot + 1) if ts not in blocked}
+
+    tie_break = list(range(config.num_teams))
+    shuffler = random.Random(0)
+    for attempt in range(GREEDY_ATTEMPTS):
+        matches, missing = place_greedy_matches(config, free_slots, tie_break)
+        if not missing:
+            break
+        shuffler.shuffle(tie_break)
+    else:
+        say(config, f"❌ Constructief schema: {len(missing)} teams komen matches tekort (bijv. team {missing[0]}) "
+                    f"na {GREEDY_ATTEMPTS} pogingen. Probeer meer tijdsloten of tafels\n")
+        return None
+
+    jury_sessions = {(team, ts, jury_room) for team, (ts, jury_room) in jury_assignment.items()}
+    return {'matches': matches, 'jury_sessions': jury_sessions}
+
+
+def solve_greedy(config, profiler):
+    """SCHEDULER_MODE = "greedy": het constructieve schema als resultaat, zonder CP-SAT solve"""
+    start = time.perf_counter()
+    profiler.start("Constructief schema")
+    schedule = build_greedy_schedule(config)
+    profiler.stop()
+    if schedule is None:
+        return None
+    elapsed = time.perf_counter() - start
+
+    shape = (config.num_teams, config.num_timeslots)
+    matches = np.zeros(shape + (config.num_tables,), dtype=np.int8)
+    for key in schedule['matches']:
+        matches[key] = 1
+    jury = np.zeros(shape + (config.num_jury_rooms,), dtype=np.int8)
+    for key in schedule['jury_sessions']:
+        jury[key] = 1
+    solution = SolutionMatrix(matches, jury)
+
+    say(config, f"✅ Constructief schema in {elapsed * 1000:.1f} ms\n")
+    terms = solution.objective_terms(config)
+    return {
+        'solver': GreedySolver(elapsed),
+        'matches': None,
+        'jury_sessions': None,
+        'status': cp_model.FEASIBLE,
+        'tables_used': None,
+        'index': None,
+        'solution': solution,
+        'profiler': profiler,
+        'objective_value': sum(weight * terms[name] for name, weight in OBJECTIVE_WEIGHTS.items()),
+        'solve_time': elapsed,
+        'levels': None,
+        'first_solution_time': elapsed,
+        'num_solutions': 1,
+        'num_timeslots': config.num_timeslots,
+    }
+
+
+def build_model_for_mode(config, profiler, diagnose=False):
+    """Bouwt het model volgens SCHEDULER_MODE (bij "decomposed" en "rolling" eerst fase 1)
+
+    Bij "rolling" is dit het volledige match model rond de vaste jury rondes; de rolling
+    horizon solve zelf (solve_rolling_horizon) bouwt per venster een eigen model.
+    """
+    jury_assignment = None
+    if config.scheduler_mode in ("decomposed", "rolling"):
+        # Fase 1: jury rondes vast leggen, fase 2: match model rond de vaste jury blokken
+        profiler.start("Fase 1: jury rondes")
+        jury_assignment = assign_jury_rounds(config)
+        profiler.stop()
+        if jury_assignment is None:
+            return None
+
+    return build_complete_model(config, jury_assignment, profiler, diagnose)
+
+
+def timeslot_lower_bound(config):
+    """Ondergrens voor het aantal tijdsloten uit noodzakelijke voorwaarden
+
+    - alle matches moeten op de tafels passen: total_matches / NUM_TABLES
+    - elk team heeft MATCHES_PER_TEAM matches met min_match_gap tijdsloten ertussen
+    - alle synchrone jury rondes moeten kunnen starten
+    """
+    min_match_gap = 1 + ((config.minimum_buffer_time + config.match_duration - 1) // config.match_duration)
+    jury_duration_in_slots = (config.jury_duration + config.match_duration - 1) // config.match_duration
+    num_jury_rounds = math.ceil(config.num_teams * config.jury_sessions_per_team / config.num_jury_rooms)
+
+    table_bound = math.ceil(config.num_teams * config.matches_per_team / config.num_tables)
+    team_span = (config.matches_per_team - 1) * min_match_gap + 1
+    jury_bound = (num_jury_rounds - 1) * jury_duration_in_slots + 1
+    return max(table_bound, team_span, jury_bound)
+
+
+def probe_timeslots(config, num_timeslots):
+    """Korte haalbaarheids-solve (zonder doel) met num_timeslots tijdsloten
+
+    Geeft True (haalbaar), False (onhaalbaar) of None (onbekend binnen de tijdslimiet) terug.
+    """
+    probe_config = config.replace(num_timeslots=num_timeslots, quiet=True)
+    built = build_model_for_mode(probe_config, BuildProfiler(enabled=False))
+    if built is None:
+        return False
+    model = built['model']
+    model.clear_objective()
+    solver = new_solver(probe_config, config.auto_timeslots_probe_time)
+    status = solver.solve(model)
+
+    if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return True
+    if status == cp_model.INFEASIBLE:
+        return False
+    return None
+
+
+def find_minimal_timeslots(config):
+    """Zoekt het kleinste haalbare aantal tijdsloten tussen de ondergrens en NUM_TIMESLOTS
+
+    Galopperend zoeken vanaf de ondergrens (+1, +2, +4, ...) tot een haalbare waarde, daarna
+    binair zoeken in het laatste interval. Een probe zonder antwoord binnen
+    AUTO_TIMESLOTS_PROBE_TIME telt als niet haalbaar, zodat de gevonden waarde altijd
+    met een echte oplossing bevestigd is.
+    """
+    lower = timeslot_lower_bound(config)
+    upper = config.num_timeslots
+    say(config, f"🔎 Automatisch aantal tijdsloten zoeken (ondergrens {lower}, max {upper})...")
+    if lower > upper:
+        say(config, f"   ⚠️  Ondergrens {lower} is groter dan NUM_TIMESLOTS ({upper})!")
+        return None
+
+    def probe(num_timeslots):
+        feasible = probe_timeslots(config, num_timeslots)
+        label = {True: '✅ haalbaar', False: '❌ onhaalbaar', None: '⏱️  onbekend'}[feasible]
+        say(config, f"   {num_timeslots} tijdsloten: {label}")
+        return feasible is True
+
+    # Galopperen: last_failed < gevonden <= found
+    last_failed = lower - 1
+    step = 1
+    candidate = lower
+    found = None
+    while True:
+        if probe(candidate):
+            found = candidate
+            break
+        last_failed = candidate
+        if candidate == upper:
+            break
+        candidate = min(candidate + step, upper)
+        step *= 2
+
+    if found is None:
+        say(config, f"   ⚠️  Geen haalbaar aantal tijdsloten gevonden tot {upper}")
+        return None
+
+    # Binair zoeken tussen last_failed (niet haalbaar) en found (haalbaar)
+    while found - last_failed > 1:
+        middle = (last_failed + found) // 2
+        if probe(middle):
+            found = middle
+        else:
+            last_failed = middle
+
+    say(config, f"   ➡️  Kleinste haalbare aantal tijdsloten: {found}\n")
+    return found
+
+
+# Mogelijke oplossingen per constraint familie, voor de diagnose van een onhaalbaar model
+FAMILY_SUGGESTIONS = {
+    "1. Matches per team": "meer tijdsloten (NUM_TIMESLOTS / END_TIME) of minder MATCHES_PER_TEAM",
+    "2. 1 team per tafel": "meer tafels (NUM_TABLES) of tijdsloten",
+    "3. 1 tafel per team": "meer tijdsloten",
+    "4. Unieke tegenstanders": "meer teams, meer tafel paren of minder MATCHES_PER_TEAM",
+    "5. Jury sessies per team": "meer jury rooms of een later END_TIME",
+    "6. Jury room bezetting": "meer jury rooms (NUM_JURY_ROOMS)",
+    "6b. Jury room overlap": "meer jury rooms of een kortere JURY_DURATION",
+    "7. 1 jury room per team": "meer tijdsloten voor jury sessies",
+    "7b. Synchrone jury rondes": "meer jury rooms of een later END_TIME (meer rondes)",
+    "8. Jury/match overlap": "een kortere MINIMUM_BUFFER_TIME of meer tijdsloten",
+    "9. Match spacing": "een kortere MINIMUM_BUFFER_TIME of meer tijdsloten",
+    "10. Jury spacing": "een kortere MINIMUM_BUFFER_TIME of minder JURY_SESSIONS_PER_TEAM",
+    "Symmetry breaking": "SYMMETRY_BREAKING = False (dit zou niet mogen gebeuren)",
+}
+
+
+def check_necessary_conditions(config):
+    """Snelle noodzakelijke voorwaarden, zonder model: geeft een lijst met problemen terug
+
+    Elke voorwaarde geldt voor iedere oplossing; als er 1 faalt is het model zeker
+    onhaalbaar en hoeft de solver niet te starten.
+    """
+    problems = []
+    min_match_gap = 1 + ((config.minimum_buffer_time + config.match_duration - 1) // config.match_duration)
+    buffer_in_slots = (config.minimum_buffer_time + config.match_duration - 1) // config.match_duration
+    jury_duration_in_slots = (config.jury_duration + config.match_duration - 1) // config.match_duration
+
+    max_match_timeslot = config.num_timeslots - 1
+    max_jury_timeslot = config.num_timeslots - 1
+    if config.end_time is not None:
+        max_match_timeslot = min(max_match_timeslot, (config.end_time - config.match_duration) // config.match_duration)
+        max_jury_timeslot = min(max_jury_timeslot, (config.end_time - config.jury_duration) // config.match_duration)
+    match_slots = max_match_timeslot + 1
+    # Laatste tijdslot dat een team bezig kan zijn (jury sessies lopen door na hun start)
+    horizon = max(max_match_timeslot + 1, max_jury_timeslot + jury_duration_in_slots)
+
+    if match_slots <= 0:
+        problems.append(f"END_TIME ({config.end_time} min) is te vroeg voor matches")
+        return problems
+    if max_jury_timeslot < 0:
+        problems.append(f"END_TIME ({config.end_time} min) is te vroeg voor jury sessies")
+        return problems
+
+    total_matches = config.num_teams * config.matches_per_team
+    if total_matches > match_slots * config.num_tables:
+        problems.append(f"{total_matches} matches passen niet op {config.num_tables} tafels × {match_slots} tijdsloten")
+
+    team_span = (config.matches_per_team - 1) * min_match_gap + 1
+    if team_span > match_slots:
+        problems.append(f"{config.matches_per_team} matches per team met {min_match_gap} tijdsloten ertussen "
+                        f"beslaan {team_span} tijdsloten, er zijn er {match_slots}")
+
+    # Matches en jury sessie van 1 team: de jury sessie plus buffer komt bij de match span
+    if config.matches_per_team > 0 and config.jury_sessions_per_team > 0:
+        team_span_with_jury = team_span + jury_duration_in_slots + buffer_in_slots
+        if team_span_with_jury > horizon:
+            problems.append(f"matches + jury sessie (met buffers) beslaan per team {team_span_with_jury} "
+                            f"tijdsloten, er zijn er {horizon}")
+
+    if config.jury_sessions_per_team == 1:
+        round_slots = [ts for ts in jury_round_start_slots(config) if ts <= max_jury_timeslot]
+        if len(round_slots) * config.num_jury_rooms < config.num_teams:
+            num_jury_rounds = math.ceil(config.num_teams / config.num_jury_rooms)
+            problems.append(f"{num_jury_rounds} jury rondes nodig, maar maar {len(round_slots)} "
+                            f"passen voor het laatste jury tijdslot ({max_jury_timeslot})")
+    else:
+        sessions_per_room = max_jury_timeslot // jury_duration_in_slots + 1
+        if config.num_teams * config.jury_sessions_per_team > sessions_per_room * config.num_jury_rooms:
+            problems.append(f"{config.num_teams * config.jury_sessions_per_team} jury sessies passen niet in "
+                            f"{config.num_jury_rooms} rooms × {sessions_per_room} sessies")
+
+    valid_table_pairs = [(table1, table2) for table1, table2 in config.table_pairs
+                         if table1 < config.num_tables and table2 < config.num_tables]
+    if (valid_table_pairs and 2 * len(valid_table_pairs) == config.num_tables
+            and config.num_teams - 1 < config.matches_per_team):
+        # Alle tafels zijn gepaard, maar niet elke match kan een nieuwe tegenstander hebben
+        problems.append(f"{config.matches_per_team} matches per team op tafel paren vraagt meer dan "
+                        f"{config.num_teams - 1} verschillende tegenstanders")
+
+    return problems
+
+
+def diagnose_infeasibility(config):
+    """Korte haalbaarheids-solve met een assumption per constraint familie
+
+    Geeft de families terug die samen onhaalbaar zijn (via CP-SAT's sufficient assumptions,
+    in volgorde van het model), of None als het model niet binnen DIAGNOSIS_TIME onhaalbaar
+    bewezen is.
+    """
+    built = build_model_for_mode(config.replace(quiet=True), BuildProfiler(enabled=False), diagnose=True)
+    if built is None:
+        return None
+
+    model = built['model']
+    families = built['families']
+    model.clear_objective()
+    model.add_assumptions([literal for family in families.literals for literal in families.literal(family)])
+
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = config.diagnosis_time
+    # Sufficient assumptions worden alleen betrouwbaar bepaald met 1 worker
+    solver.parameters.num_search_workers = 1
+    status = solver.solve(model)
+    if status != cp_model.INFEASIBLE:
+        return None
+
+    conflict = [families.family_of(literal_index)
+                for literal_index in solver.sufficient_assumptions_for_infeasibility()]
+    conflict = [family for family in conflict if family is not None]
+
+    # De sufficient assumptions zijn niet altijd minimaal: laat families 1 voor 1 weg
+    # zolang het model zonder die familie nog steeds onhaalbaar bewezen wordt
+    solver.parameters.max_time_in_seconds = max(1, config.diagnosis_time / 4)
+    for family in list(conflict):
+        remaining = [other for other in conflict if other != family]
+        model.clear_assumptions()
+        model.add_assumptions([families.literals[other] for other in remaining])
+        if solver.solve(model) == cp_model.INFEASIBLE:
+            conflict = remaining
+
+    return [family for family in families.literals if family in conflict]
+
+
+def create_complete_schedule(config):
+    """Maakt een compleet FLL schema met matches en jury sessies
+
+    Met AUTO_TIMESLOTS wordt gebouwd met een kopie van config met het gevonden aantal
+    tijdsloten. Het gebruikte aantal staat in result['num_timeslots'].
+    """
+    if config.auto_timeslots and config.scheduler_mode in ("rolling", "greedy"):
+        say(config, f"⚠️  AUTO_TIMESLOTS wordt niet gebruikt bij SCHEDULER_MODE = \"{config.scheduler_mode}\" "
+                    "(de probes bouwen het volledige model)\n")
+    elif config.auto_timeslots:
+        num_timeslots = find_minimal_timeslots(config)
+        if num_timeslots is None:
+            return None
+        return solve_complete_schedule(config.replace(num_timeslots=num_timeslots))
+
+    return solve_complete_schedule(config)
+
+
+def solve_complete_schedule(config):
+    """Bouwt en lost het schema op met config.num_timeslots tijdsloten (zie create_complete_schedule)"""
+    rolling = config.scheduler_mode == "rolling"
+    greedy = config.scheduler_mode == "greedy"
+    if config.diagnose_infeasibility:
+        problems = check_necessary_conditions(config)
+        if problems:
+            say(config, "❌ Deze configuratie is onhaalbaar:")
+            for problem in problems:
+                say(config, f"   • {problem}")
+            say(config)
+            return None
+
+    profiler = BuildProfiler(enabled=config.profile_build)
+    if rolling:
+        return solve_rolling_horizon(config, profiler)
+    if greedy:
+        return solve_greedy(config, profiler)
+
+    built = build_model_for_mode(config, profiler)
+    if built is None:
+        return None
+    
+    model = built['model']
+
+    if config.hint_from is not None:
+        add_schedule_hint(config, model, built['index'], load_schedule_hint(config, config.hint_from))
+    elif config.greedy_hint:
+        say(config, "🏗️  Constructief schema als startpunt...")
+        hint = build_greedy_schedule(config)
+        if hint is not None:
+            add_schedule_hint(config, model, built['index'], hint)
+            if not complete_schedule_hint(config, model):
+                say(config, "   ⚠️  Het constructieve schema past niet in dit model (bijv. door symmetry breaking)\n")
+
+    # ===== OPLOSSEN =====
+    
+    levels = None
+    if config.objective_strategy == "hierarchical":
+        say(config, "🔍 Bezig met hiërarchisch optimaliseren...")
+        say(config, f"   (max {sum(config.hierarchical_time_limits.values())} seconden over alle niveaus)\n")
+        solver, status, levels = solve_hierarchical(config, model, built['objective_terms'], profiler)
+        first_solution_time = levels[0]['first_solution_time']
+        num_solutions = sum(level['num_solutions'] for level in levels)
+        solve_time = sum(level['time'] for level in levels)
+    else:
+        solver = new_solver(config, config.max_solve_time)
+        profiler.attach_solver(solver)
+
+        say(config, "🔍 Bezig met zoeken naar optimale oplossing...")
+        say(config, f"   (max {config.max_solve_time} seconden, {solver.parameters.num_search_workers} workers "
+                    f"op {available_cpus()} beschikbare CPUs"
+                    f"{', deterministisch' if config.deterministic_search else ''})\n")
+
+        with ProgressMonitor(config, solver, built['index']) as tracker:
+            status = solver.solve(model, tracker)
+        if tracker.stop_reason is not None:
+            say(config, f"⏹️  Vroegtijdig gestopt: {tracker.stop_reason}\n")
+        first_solution_time = tracker.first_solution_time
+        num_solutions = len(tracker.solutions)
+        solve_time = solver.wall_time
+
+    if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
+        say(config, "✅ Oplossing gevonden!\n")
+        # Gewogen doelwaarde, ook bij hiërarchisch oplossen vergelijkbaar met de gewogen modus
+        objective_value = sum(weight * solver.value(built['objective_terms'][name])
+                              for name, weight in OBJECTIVE_WEIGHTS.items())
+        return {
+            'solver': solver,
+            'matches': built['matches'],
+            'jury_sessions': built['jury_sessions'],
+            'status': status,
+            'tables_used': built['tables_used'],
+            'index': built['index'],
+            'solution': built['index'].solution_matrix(solver),
+            'profiler': profiler,
+            'objective_value': objective_value,
+            'solve_time': solve_time,
+            'levels': levels,
+            'first_solution_time': first_solution_time,
+            'num_solutions': num_solutions,
+            'num_timeslots': config.num_timeslots
+        }
+    else:
+        say(config, "❌ Geen oplossing gevonden!\n")
+        if config.diagnose_infeasibility and (status == cp_model.INFEASIBLE or status == cp_model.UNKNOWN):
+            print_infeasibility_diagnosis(config)
+        return None
+
+
+def print_infeasibility_diagnosis(config):
+    """Zoekt na een mislukte solve welke constraint families elkaar tegenspreken en print ze"""
+    say(config, f"🩺 Haalbaarheids-check (max {config.diagnosis_time} seconden)...")
+    conflict = diagnose_infeasibility(config)
+    if conflict is None:
+        say(config, "   Geen tegenstrijdigheid gevonden (waarschijnlijk te weinig MAX_SOLVE_TIME)\n")
+        return
+    say(config, "❌ Het model is onhaalbaar. Deze constraint families spreken elkaar tegen:")
+    for family in conflict:
+        say(config, f"   • {family} → probeer {FAMILY_SUGGESTIONS.get(family, 'de instellingen aan te passen')}")
+    if not conflict:
+        say(config, "   • (geen familie aan te wijzen: de domeinen zelf zijn te krap, bijv. door END_TIME)")
+    say(config)
+
+
+def build_json_output(config, result):
+    """Bouwt de JSON output"""
+    if result is None:
+        return None
+    
+    solver = result['solver']
+    index = result['index']
+    solution = result.get('solution') or index.solution_matrix(solver)
+    # Met AUTO_TIMESLOTS is met minder tijdsloten opgelost dan config.num_timeslots
+    num_timeslots = result.get('num_timeslots', config.num_timeslots)
+    
+    # Hulp functie: voeg pauze toe aan tijden na BREAK_START_TIME
+    def adjust_time_for_break(time_minutes):
+        """Voegt BREAK_DURATION toe aan tijden die na de pauze vallen"""
+        if config.break_enabled and time_minutes >= config.break_start_time:
+            return time_minutes + config.break_duration
+        return time_minutes
+    
+    output = {
+        "constraintConfiguration": {
+            "constraintWeight": "1hard/0medium/0soft",
+            "minimumBreakDuration": config.minimum_buffer_time,
+            "startTime": config.start_time,
+            "endTime": config.end_time,
+            "breakStartTime": config.break_start_time,
+            "breakDuration": config.break_duration,
+            "matchDuration": config.match_duration,
+            "juryDuration": config.jury_duration
+        },
+        "tableList": [],
+        "tablePairList": [],
+        "juryList": [],
+        "teamList": [],
+        "tableTimeslotList": [],
+        "juryTimeslotList": [],
+        "teamTableAllocationList": [],
+        "teamJuryAllocationList": [],
+        "score": "0hard/0medium/0soft" if result['status'] == cp_model.OPTIMAL else "1hard/0medium/0soft"
+    }
     
     # Table pairs (2 tafels per paar)
-    num_table_pairs = (NUM_TABLES + 1) // 2
+    num_table_pairs = (config.num_tables + 1) // 2
     for pair_id in range(num_table_pairs):
         output["tablePairList"].append({"id": pair_id})
     
     # Tables
-    for table_id in range(NUM_TABLES):
+    for table_id in range(config.num_tables):
         pair_id = table_id // 2
         output["tableList"].append({
             "id": table_id,
@@ -518,26 +2192,26 @@ def build_json_output(result):
         })
     
     # Jury rooms
-    for jury_id in range(NUM_JURY_ROOMS):
+    for jury_id in range(config.num_jury_rooms):
         output["juryList"].append({"id": jury_id})
     
     # Teams
-    for team_id in range(NUM_TEAMS):
+    for team_id in range(config.num_teams):
         output["teamList"].append({"id": team_id})
     
     # Table timeslots
     table_timeslot_id = 0
-    for ts in range(NUM_TIMESLOTS):
-        start_time_minutes = ts * MATCH_DURATION
+    for ts in range(num_timeslots):
+        start_time_minutes = ts * config.match_duration
         adjusted_start = adjust_time_for_break(start_time_minutes)
-        adjusted_end = adjust_time_for_break(start_time_minutes + MATCH_DURATION)
+        adjusted_end = adjust_time_for_break(start_time_minutes + config.match_duration)
         
-        for table_id in range(NUM_TABLES):
+        for table_id in range(config.num_tables):
             pair_id = table_id // 2
             output["tableTimeslotList"].append({
                 "id": table_timeslot_id,
                 "startTime": adjusted_start,
-                "duration": MATCH_DURATION,
+                "duration": config.match_duration,
                 "table": {
                     "id": table_id,
                     "tablePair": {"id": pair_id}
@@ -552,51 +2226,45 @@ def build_json_output(result):
     jury_timeslot_id = 0
     
     # Bereken hoeveel "match tijdsloten" een jury sessie beslaat
-    jury_slots_in_match_units = (JURY_DURATION + MATCH_DURATION - 1) // MATCH_DURATION  # 42/7 = 6
+    jury_slots_in_match_units = (config.jury_duration + config.match_duration - 1) // config.match_duration  # 42/7 = 6
     
     # Maak jury timeslots die gebaseerd zijn op match timing
-    for ts in range(NUM_TIMESLOTS):
-        start_time_minutes = ts * MATCH_DURATION  # Zelfde tijdschaal als matches!
+    for ts in range(num_timeslots):
+        start_time_minutes = ts * config.match_duration  # Zelfde tijdschaal als matches!
         adjusted_start = adjust_time_for_break(start_time_minutes)
-        adjusted_end = adjust_time_for_break(start_time_minutes + JURY_DURATION)
+        adjusted_end = adjust_time_for_break(start_time_minutes + config.jury_duration)
         
-        for jury_id in range(NUM_JURY_ROOMS):
+        for jury_id in range(config.num_jury_rooms):
             output["juryTimeslotList"].append({
                 "id": jury_timeslot_id,
                 "startTime": adjusted_start,
-                "duration": JURY_DURATION,
+                "duration": config.jury_duration,
                 "endTime": adjusted_end,
                 "jury": {"id": jury_id}
             })
             jury_timeslot_id += 1
     
     # Team table allocations (matches)
-    for team in range(NUM_TEAMS):
-        for ts in range(NUM_TIMESLOTS):
-            for table_id in range(NUM_TABLES):
-                if solver.value(matches[(team, ts, table_id)]):
-                    table_timeslot_id = ts * NUM_TABLES + table_id
-                    output["teamTableAllocationList"].append({
-                        "team": {"id": team},
-                        "timeslot": {"id": table_timeslot_id}
-                    })
+    for team, ts, table_id in solution.scheduled_matches():
+        table_timeslot_id = ts * config.num_tables + table_id
+        output["teamTableAllocationList"].append({
+            "team": {"id": team},
+            "timeslot": {"id": table_timeslot_id}
+        })
     
     # Team jury allocations
-    for team in range(NUM_TEAMS):
-        for ts in range(NUM_TIMESLOTS):
-            for jury_id in range(NUM_JURY_ROOMS):
-                if solver.value(jury_sessions[(team, ts, jury_id)]):
-                    jury_timeslot_id = ts * NUM_JURY_ROOMS + jury_id
-                    output["teamJuryAllocationList"].append({
-                        "team": {"id": team},
-                        "timeslot": {"id": jury_timeslot_id}
-                    })
+    for team, ts, jury_id in solution.scheduled_jury_sessions():
+        jury_timeslot_id = ts * config.num_jury_rooms + jury_id
+        output["teamJuryAllocationList"].append({
+            "team": {"id": team},
+            "timeslot": {"id": jury_timeslot_id}
+        })
     
     return output
 
 
-def save_json(output, filename=None):
-    """Sla op als JSON"""
+def save_json(config, output, filename=None, quiet=False):
+    """Sla op als JSON (atomair: een half geschreven bestand wordt nooit zichtbaar)"""
     if output is None:
         return None
     
@@ -604,66 +2272,67 @@ def save_json(output, filename=None):
         timestamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
         filename = f"schedule-complete-{timestamp}.json"
     
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    temp_filename = f"{filename}.tmp"
+    with open(temp_filename, 'w', encoding='utf-8') as f:
+        dump_schedule(output, f, compact=config.output_format == "compact", minify=config.output_minified)
+    os.replace(temp_filename, filename)
     
-    print(f"💾 Schema opgeslagen als: {filename}")
+    if not quiet:
+        say(config, f"💾 Schema opgeslagen als: {filename}")
     return filename
 
 
-def print_summary(output, result):
+def print_summary(config, output, result):
     """Print samenvatting"""
     if output is None or result is None:
-        print("\n❌ GEEN OPLOSSING GEVONDEN!")
-        print("\n💡 Suggesties:")
-        print("   • Verhoog NUM_TIMESLOTS in config.py")
-        print("   • Verlaag MINIMUM_BUFFER_TIME (bijv. van 30 naar 20 min)")
-        print("   • Verhoog MAX_SOLVE_TIME")
+        say(config, "\n❌ GEEN OPLOSSING GEVONDEN!")
+        say(config, "\n💡 Suggesties:")
+        say(config, "   • Verhoog NUM_TIMESLOTS in config.py (of zoek automatisch met --auto-timeslots)")
+        say(config, "   • Verlaag MINIMUM_BUFFER_TIME (bijv. van 30 naar 20 min)")
+        say(config, "   • Verhoog MAX_SOLVE_TIME")
         return
     
     solver = result['solver']
     
-    print("\n" + "=" * 70)
-    print("📊 STATISTIEKEN")
-    print("=" * 70)
-    print(f"Status: {'OPTIMAAL ✅' if result['status'] == cp_model.OPTIMAL else 'HAALBAAR ⚠️'}")
-    print(f"Oplostijd: {solver.wall_time:.2f} seconden")
-    print(f"Conflicten: {solver.num_conflicts:,}")
-    print(f"Branches: {solver.num_branches:,}")
-    
-    print(f"\nTotaal matches: {len(output['teamTableAllocationList'])}")
-    print(f"Totaal jury sessies: {len(output['teamJuryAllocationList'])}")
-    
-    # Analyseer tafel gebruik per team
-    team_tables = {}
-    for allocation in output["teamTableAllocationList"]:
-        team_id = allocation["team"]["id"]
-        timeslot_info = next(ts for ts in output["tableTimeslotList"] 
-                            if ts["id"] == allocation["timeslot"]["id"])
-        table_id = timeslot_info["table"]["id"]
-        
-        if team_id not in team_tables:
-            team_tables[team_id] = set()
-        team_tables[team_id].add(table_id)
+    say(config, "\n" + "=" * 70)
+    say(config, "📊 STATISTIEKEN")
+    say(config, "=" * 70)
+    say(config, f"Status: {'OPTIMAAL ✅' if result['status'] == cp_model.OPTIMAL else 'HAALBAAR ⚠️'}")
+    say(config, f"Oplostijd: {result['solve_time']:.2f} seconden")
+    say(config, f"Conflicten: {solver.num_conflicts:,}")
+    say(config, f"Branches: {solver.num_branches:,}")
+    say(config, f"Symmetry breaking: {'aan' if config.symmetry_breaking else 'uit'}")
+    if result.get('first_solution_time') is not None:
+        say(config, f"Eerste oplossing na: {result['first_solution_time']:.2f} seconden "
+                    f"({result['num_solutions']} verbeteringen)")
+    if result['status'] == cp_model.OPTIMAL:
+        say(config, f"Optimaal bewezen na: {result['solve_time']:.2f} seconden")
+    say(config, f"Doelwaarde (gewogen): {result['objective_value']:,}")
+    if result['levels']:
+        say(config, "\nHiërarchisch doel:")
+        for number, level in enumerate(result['levels'], 1):
+            value = f"{level['value']:,}" if level['value'] is not None else '-'
+            say(config, f"  {number}. {level['name']:<24} {value:>8}  "
+                        f"{level['status']:<9} {level['time']:>7.2f}s  ({level['num_solutions']} verbeteringen)")
     
-    teams_1_table = sum(1 for tables in team_tables.values() if len(tables) == 1)
-    teams_2_tables = sum(1 for tables in team_tables.values() if len(tables) == 2)
-    teams_more = NUM_TEAMS - teams_1_table - teams_2_tables
+    # Snelle controle op de oplossing matrix
+    solution = result['solution']
+    matches_ok = bool((solution.matches_per_team() == config.matches_per_team).all())
+    tables_ok = bool((solution.teams_per_table_slot() <= 1).all())
+    say(config, f"Controle: {config.matches_per_team} matches per team {'✅' if matches_ok else '❌'}, "
+                f"max 1 team per tafel per tijdslot {'✅' if tables_ok else '❌'}")
     
-    print(f"\nTafel verdeling:")
-    print(f"  Teams op 1 tafel: {teams_1_table}")
-    print(f"  Teams op 2 tafels: {teams_2_tables}")
-    if teams_more > 0:
-        print(f"  Teams op 3+ tafels: {teams_more} ⚠️")
+    print_schedule_stats(analyze_schedule(output))
 
 
 if __name__ == "__main__":
-    result = create_complete_schedule()
+    config = SchedulerConfig.from_config()
+    result = create_complete_schedule(config)
     
     if result:
-        output = build_json_output(result)
-        print_summary(output, result)
-        filename = save_json(output)
+        output = build_json_output(config, result)
+        print_summary(config, output, result)
+        filename = save_json(config, output)
         print(f"\n✅ Compleet schema succesvol gegenereerd!")
     else:
         print("\n❌ Geen oplossing gevonden - pas config.py aan")
@@ -50,6 +50,12 @@ TABLE_PAIRS = [
 # Aantal tijdsloten (auto-berekend of handmatig instellen)
 NUM_TIMESLOTS = 50  # Verhoog dit als er geen oplossing gevonden wordt
 
+# Automatisch het kleinste haalbare aantal tijdsloten zoeken (NUM_TIMESLOTS is dan het maximum).
+# Elke stap is een korte haalbaarheids-solve van max AUTO_TIMESLOTS_PROBE_TIME seconden;
+# daarna volgt de volledige optimalisatie met het gevonden aantal tijdsloten.
+AUTO_TIMESLOTS = False
+AUTO_TIMESLOTS_PROBE_TIME = 10
+
 # Aantal jury sessies per team (standaard 1)
 JURY_SESSIONS_PER_TEAM = 1
 
@@ -66,6 +72,132 @@ END_TIME = 252  # Bijvoorbeeld: 300 voor 5 uur (300 minuten vanaf start)
 # Maximale oplostijd in seconden
 MAX_SOLVE_TIME = 120
 
+# Aantal parallelle CP-SAT zoek workers
+# "auto" = alle CPUs die het proces mag gebruiken (affinity mask en cgroup limiet in containers)
+NUM_SEARCH_WORKERS = "auto"
+
+# Zoek log van CP-SAT tonen (voortgang, bounds en gebruikte workers)
+LOG_SEARCH_PROGRESS = False
+
+# Geen voortgang en samenvatting printen (bijv. voor een service of sweep die veel schema's plant)
+QUIET = False
+
+# Deterministisch zoeken: de workers wisselen elkaar af in vaste batches (interleave_search),
+# zodat dezelfde configuratie met hetzelfde aantal workers altijd hetzelfde schema geeft.
+# Langzamer dan gewoon parallel zoeken; vooral handig voor CI en regressie tests.
+DETERMINISTIC_SEARCH = False
+
+# Voortgang tijdens het zoeken als JSON regels (doelwaarde, bound, gap, verstreken tijd)
+# None = uit, "-" = naar stdout, of een pad naar een .jsonl bestand
+PROGRESS_STREAM = None
+
+# Beste schema tot nu toe tussentijds opslaan (atomair), hooguit elke PROGRESS_SAVE_INTERVAL
+# seconden. Zo is er al een bruikbaar schema lang voor MAX_SOLVE_TIME verstreken is.
+# None = niet tussentijds opslaan
+PROGRESS_SAVE_FILE = None
+PROGRESS_SAVE_INTERVAL = 10
+
+# Vroegtijdig stoppen (None = uit):
+# STOP_AT_GAP = relatieve afstand tussen doelwaarde en bound, bijv. 0.01 voor 1%
+# STOP_AFTER_NO_IMPROVEMENT = seconden zonder betere oplossing
+# Geldt voor OBJECTIVE_STRATEGY = "weighted"
+STOP_AT_GAP = None
+STOP_AFTER_NO_IMPROVEMENT = None
+
+# Opslagformaat van het schema:
+# "verbose" = gewone JSON met een entry per tafel/room per tijdslot (ook lege)
+# "compact" = alleen tijden per tijdslot en de toewijzingen als kolommen; schedule_format.py
+#             (en test_schedule.py) zetten dit weer om naar het gewone formaat
+OUTPUT_FORMAT = "verbose"
+
+# JSON zonder inspringing en spaties opslaan (kleiner bestand)
+OUTPUT_MINIFIED = False
+
+# Resultaat cache: schema's op schijf bewaren onder een hash van de instellingen (en de code
+# versie), zodat dezelfde aanvraag direct het bewaarde schema krijgt zonder nieuwe solve.
+# None = geen cache, anders een map, bijv. ".schedule-cache"
+RESULT_CACHE_DIR = None
+# Maximale grootte van de cache; het minst recent gebruikte schema wordt eerst verwijderd
+RESULT_CACHE_MAX_MB = 100
+# True = een niet-optimaal bewaard schema dat met minder oplostijd gemaakt is dan
+# MAX_SOLVE_TIME opnieuw oplossen in plaats van teruggeven
+RESULT_CACHE_RESOLVE_SHORTER = False
+
+# ===== MODEL INSTELLINGEN =====
+
+# Planning methode:
+# "monolithic" = 1 model voor matches en jury sessies samen
+# "decomposed" = fase 1 verdeelt teams over jury rondes/rooms, fase 2 plant alleen de
+#                matches rond die vaste jury blokken (veel sneller voor 40+ teams)
+# "rolling"    = fase 1 zoals "decomposed", daarna de matches per tijdvenster van
+#                ROLLING_WINDOW_SLOTS tijdsloten, elk venster een eigen klein model met de
+#                vorige vensters als randvoorwaarden (voor 80-120+ teams en lange dagen)
+# "greedy"     = geen solver: jury rondes vast en matches tijdslot voor tijdslot zo vroeg
+#                mogelijk geplaatst (geldig schema in milliseconden, als snelle preview)
+SCHEDULER_MODE = "monolithic"
+
+# Tijdsloten per venster bij SCHEDULER_MODE = "rolling"
+# None = de minimale afstand tussen 2 matches van een team (elk team max 1 match per venster)
+ROLLING_WINDOW_SLOTS = None
+
+# Hoe overlap van jury sessies in dezelfde room wordt gemodelleerd:
+# "interval" = optionele interval variabelen per team/room met NoOverlap (lineair in teams)
+# "pairwise" = oude formulering met een clause per paar teams (kwadratisch in teams)
+JURY_OVERLAP_MODEL = "interval"
+
+# Hoe "maximaal 1 keer tegen dezelfde tegenstander" wordt gemodelleerd:
+# "compact"  = 1 bezettings-variabele per team/tijdslot/tafel paar en 1 ontmoetings-variabele
+#              per team paar/tijdslot met een at_most_one per team paar
+# "reified"  = oude formulering met both_play/option1/option2 per team paar/tijdslot/tafel paar
+OPPONENT_MODEL = "compact"
+
+# Hoe het optimalisatie doel wordt opgebouwd:
+# "linear"  = gewogen lineaire som direct over de match variabelen (weinig hulp variabelen)
+# "reified" = oude formulering met een penalty/empty/match_exists variabele per tafel/tijdslot
+#             en reified constraints (zelfde optimale doelwaarde, veel groter model)
+OBJECTIVE_MODEL = "linear"
+
+# Hoe de doel termen (tafel paren, lege slots, laatste match, vroege slots, tafels per team)
+# samen geoptimaliseerd worden:
+# "weighted"     = 1 solve met grote gewichten per prioriteit (100000, 10000, 50, 1, -1)
+# "hierarchical" = per prioriteit een eigen solve; de bereikte waarde wordt vastgelegd en het
+#                  volgende niveau start vanuit de vorige oplossing
+OBJECTIVE_STRATEGY = "weighted"
+
+# Maximale oplostijd per niveau in seconden (alleen bij OBJECTIVE_STRATEGY = "hierarchical")
+HIERARCHICAL_TIME_LIMITS = {
+    'pair_violations': 40,
+    'empty_slots': 10,
+    'latest_match_timeslot': 30,
+    'timeslot_penalty': 30,
+    'tables_used': 10,
+}
+
+# Symmetry breaking: teams, jury rooms (per ronde) en tafels binnen een paar zijn
+# verwisselbaar. Met True voegt de scheduler ordenings-constraints toe zodat de solver
+# geen tijd verspilt aan equivalente permutaties van dezelfde oplossing.
+SYMMETRY_BREAKING = False
+
+# Warm start: pad naar een eerder gegenereerd schema (schedule-complete-*.json) dat als
+# startpunt (solution hint) gebruikt wordt, bijv. na een kleine wijziging in de configuratie.
+# None = zonder hint starten
+HINT_FROM = None
+
+# Zonder HINT_FROM eerst een constructief schema maken (zoals SCHEDULER_MODE = "greedy") en dat
+# als startpunt gebruiken, zodat de solver direct een geldige oplossing heeft
+GREEDY_HINT = False
+
+# Infeasibility diagnose: voor de solve snelle noodzakelijke voorwaarden (capaciteit, span per
+# team, jury rondes). Alleen als de solve onhaalbaar of zonder oplossing eindigt volgt een
+# haalbaarheids-solve van max DIAGNOSIS_TIME seconden die de tegenstrijdige constraint families noemt
+DIAGNOSE_INFEASIBILITY = True
+DIAGNOSIS_TIME = 10
+
+# Profiler: meet per constraint familie en doel term de bouwtijd, het aantal variabelen en
+# constraints, plus de CP-SAT presolve statistieken. Het rapport wordt naast het schema
+# opgeslagen als schedule-complete-<tijd>.profile.json
+PROFILE_BUILD = False
+
 # ===== VOORBEELDEN =====
 
 # Klein toernooi:
@@ -0,0 +1,52 @@
+"""
+CPU detectie voor de FLL Tournament Scheduler
+Bepaalt hoeveel CPUs het proces echt mag gebruiken: os.cpu_count() geeft in containers en
+CI runners het aantal CPUs van de host, terwijl de affinity mask en de cgroup quota
+(docker --cpus, Kubernetes limits) vaak veel minder toestaan.
+"""
+import math
+import os
+
+
+def cgroup_cpu_limit():
+    """CPU quota uit de cgroup (v2 cpu.max of v1 cfs_quota_us), None als er geen limiet is"""
+    # cgroup v2: "max 100000" (geen limiet) of "200000 100000" (2 CPUs)
+    try:
+        with open('/sys/fs/cgroup/cpu.max', encoding='utf-8') as f:
+            quota, period = f.read().split()[:2]
+        if quota != 'max':
+            return max(1, math.ceil(int(quota) / int(period)))
+        return None
+    except (OSError, ValueError):
+        pass
+
+    # cgroup v1: quota -1 = geen limiet
+    try:
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_quota_us', encoding='utf-8') as f:
+            quota = int(f.read())
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_period_us', encoding='utf-8') as f:
+            period = int(f.read())
+        if quota > 0 and period > 0:
+            return max(1, math.ceil(quota / period))
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def available_cpus():
+    """Aantal CPUs dat dit proces mag gebruiken (affinity mask en cgroup quota)"""
+    if hasattr(os, 'sched_getaffinity'):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, limit)
+    return cpus
+
+
+def resolve_num_workers(setting):
+    """NUM_SEARCH_WORKERS -> aantal CP-SAT workers ("auto" = alle beschikbare CPUs)"""
+    if setting in (None, 'auto', 0):
+        return available_cpus()
+    return max(1, int(setting))
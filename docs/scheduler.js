@@ -2,6 +2,10 @@
 const GITHUB_OWNER = 'koenvanwijk';
 const GITHUB_REPO = 'ffl-schedule';
 
+// Lokale schedule service (python service.py), bijv. index.html?service=http://localhost:8765
+// Zonder service parameter wordt een GitHub issue aangemaakt
+const SERVICE_URL = new URLSearchParams(window.location.search).get('service');
+
 document.getElementById('schedulerForm').addEventListener('submit', async (e) => {
     e.preventDefault();
     
@@ -20,9 +24,76 @@ document.getElementById('schedulerForm').addEventListener('submit', async (e) =>
     
     console.log('Form data:', formData);
     
-    createIssue(formData);
+    if (SERVICE_URL) {
+        requestFromService(formData);
+    } else {
+        createIssue(formData);
+    }
 });
 
+async function requestFromService(params) {
+    const statusDiv = document.getElementById('status');
+    statusDiv.className = 'status info';
+    statusDiv.innerHTML = '⏳ Aanvraag verstuurd naar de scheduler service...';
+
+    try {
+        const response = await fetch(`${SERVICE_URL}/schedule`, {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify(params)
+        });
+        const job = await response.json();
+        if (!response.ok) {
+            throw new Error(job.error);
+        }
+
+        // Voortgang volgen met server-sent events tot de job klaar is
+        const events = new EventSource(`${SERVICE_URL}/jobs/${job.id}/events`);
+        events.onmessage = (message) => {
+            const progress = JSON.parse(message.data);
+            if (progress.event === 'solution') {
+                statusDiv.innerHTML = `🔍 Oplossing ${progress.solution} gevonden na ${progress.time.toFixed(1)}s ` +
+                    `(gap ${(progress.gap * 100).toFixed(1)}%)`;
+            }
+        };
+        events.addEventListener('done', (message) => {
+            events.close();
+            showServiceResult(JSON.parse(message.data));
+        });
+        // Zonder close() blijft de browser opnieuw verbinden (bijv. als de service gestopt is)
+        events.onerror = () => {
+            events.close();
+            statusDiv.className = 'status error';
+            statusDiv.innerHTML = `❌ Verbinding met de scheduler service verbroken (job ${job.id}). ` +
+                `Status: <a href="${SERVICE_URL}/jobs/${job.id}">${SERVICE_URL}/jobs/${job.id}</a>`;
+        };
+    } catch (error) {
+        statusDiv.className = 'status error';
+        statusDiv.innerHTML = `❌ Scheduler service niet bereikbaar: ${error.message}`;
+    }
+}
+
+async function showServiceResult(job) {
+    const statusDiv = document.getElementById('status');
+    if (!job.feasible) {
+        statusDiv.className = 'status error';
+        statusDiv.innerHTML = job.error
+            ? `❌ Fout in de scheduler: ${job.error}`
+            : '❌ Geen oplossing gevonden - verhoog het aantal tijdsloten of verlaag het aantal teams';
+        return;
+    }
+
+    const response = await fetch(`${SERVICE_URL}/jobs/${job.id}/schedule`);
+    const blob = new Blob([await response.text()], {type: 'application/json'});
+    statusDiv.className = 'status success';
+    statusDiv.innerHTML = `
+        <strong>✅ Schema gegenereerd! (${job.status}, ${job.totalTime}s)</strong><br><br>
+        <a href="${URL.createObjectURL(blob)}" download="schedule-complete-${job.id}.json" class="download-link">
+            📥 Download Schema
+        </a>
+    `;
+}
+
 function createIssue(params) {
     // Create issue body with parameters - compact format to avoid URL length limits
     const issueTitle = `Schema: ${params.num_teams}T ${params.num_tables}Taf ${params.matches_per_team}W`;
@@ -0,0 +1,165 @@
+"""
+Profiler voor het bouwen en oplossen van het CP-SAT model
+Meet per constraint familie en doel term de bouwtijd, het aantal nieuwe variabelen en
+constraints, en verzamelt de presolve statistieken van CP-SAT in een JSON rapport.
+"""
+import json
+import re
+import time
+
+try:
+    import resource
+except ImportError:  # Windows: geen geheugen metingen
+    resource = None
+
+
+def peak_memory_mb():
+    """Piek geheugengebruik van dit proces in MB (None als dit niet gemeten kan worden)"""
+    if resource is None:
+        return None
+    # ru_maxrss is in KB op Linux
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def parse_model_stats(lines):
+    """Leest een '#Variables: ...' / '#kLinearN: ...' blok uit de CP-SAT log"""
+    stats = {}
+    for line in lines:
+        if line.startswith('  - '):
+            continue  # detail regel, bijv. '  - 10 Booleans in [0,1]'
+        match = re.match(r"#(\w+): ([\d']+)", line)
+        if not match:
+            break
+        # CP-SAT schrijft grote getallen met duizendtal scheiding: 7'705
+        stats[match.group(1)] = int(match.group(2).replace("'", ""))
+    return stats
+
+
+def parse_presolve_log(log_lines):
+    """Haalt de presolve statistieken uit de CP-SAT zoek log"""
+    # Een log bericht kan meerdere regels bevatten
+    log_lines = "\n".join(log_lines).splitlines()
+    stats = {'initialModel': {}, 'presolvedModel': {}, 'presolveTime': None, 'rules': {}}
+    presolve_start = None
+    for i, line in enumerate(log_lines):
+        if line.startswith('Initial optimization model'):
+            stats['initialModel'] = parse_model_stats(log_lines[i + 1:])
+        elif line.startswith('Presolved optimization model'):
+            stats['presolvedModel'] = parse_model_stats(log_lines[i + 1:])
+        elif line.startswith('Starting presolve at'):
+            presolve_start = float(re.search(r'at ([\d.]+)s', line).group(1))
+        elif line.startswith('Starting search at') and presolve_start is not None:
+            search_start = float(re.search(r'at ([\d.]+)s', line).group(1))
+            stats['presolveTime'] = round(search_start - presolve_start, 3)
+        else:
+            rule = re.match(r"\s+- rule '(.+)' was applied ([\d']+) times?", line)
+            if rule:
+                stats['rules'][rule.group(1)] = int(rule.group(2).replace("'", ""))
+    return stats
+
+
+class BuildProfiler:
+    """Verzamelt tijd, variabelen en constraints per onderdeel van het model
+
+    De scheduler roept start(naam) aan het begin van elk onderdeel aan; het vorige
+    onderdeel wordt dan automatisch afgesloten. Uitgeschakeld (enabled=False) doen
+    start() en stop() niets, zodat de profiler altijd aangeroepen kan worden.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.model = None
+        self.sections = []
+        self.log_lines = []
+        self.solver = None
+        self._current = None
+
+    def attach(self, model):
+        """Koppel het model waarvan de grootte per sectie gemeten wordt"""
+        self.model = model
+
+    def _model_size(self):
+        if self.model is None:
+            return 0, 0
+        proto = self.model.proto
+        return len(proto.variables), len(proto.constraints)
+
+    def start(self, name):
+        """Start de meting van een onderdeel (sluit het vorige onderdeel af)"""
+        if not self.enabled:
+            return
+        self.stop()
+        variables, constraints = self._model_size()
+        self._current = (name, time.perf_counter(), variables, constraints)
+
+    def stop(self):
+        """Sluit het lopende onderdeel af"""
+        if not self.enabled or self._current is None:
+            return
+        name, start, variables_before, constraints_before = self._current
+        elapsed = time.perf_counter() - start
+        variables_after, constraints_after = self._model_size()
+        self.sections.append({
+            'name': name,
+            'time': round(elapsed, 4),
+            'variables': variables_after - variables_before,
+            'constraints': constraints_after - constraints_before,
+            'peakMemoryMb': peak_memory_mb(),
+        })
+        self._current = None
+
+    def attach_solver(self, solver):
+        """Vang de zoek log van de solver op voor de presolve statistieken"""
+        if not self.enabled:
+            return
+        self.solver = solver
+        echo = solver.parameters.log_search_progress  # LOG_SEARCH_PROGRESS: log ook blijven tonen
+        solver.parameters.log_search_progress = True
+        solver.parameters.log_to_stdout = False
+        solver.log_callback = self._log_line if echo else self.log_lines.append
+
+    def _log_line(self, line):
+        self.log_lines.append(line)
+        print(line)
+
+    def report(self):
+        """Het volledige rapport als dict (JSON serialiseerbaar)"""
+        num_variables, num_constraints = self._model_size()
+        report = {
+            'buildTime': round(sum(section['time'] for section in self.sections), 4),
+            'variables': num_variables,
+            'constraints': num_constraints,
+            'peakMemoryMb': peak_memory_mb(),
+            'sections': self.sections,
+        }
+        if self.solver is not None:
+            report['solve'] = {
+                'status': self.solver.status_name(self.solver.response_proto.status),
+                'wallTime': round(self.solver.wall_time, 3),
+                'conflicts': self.solver.num_conflicts,
+                'branches': self.solver.num_branches,
+            }
+            report['presolve'] = parse_presolve_log(self.log_lines)
+        return report
+
+    def print_report(self):
+        """Print tijd, variabelen en constraints per onderdeel"""
+        print("\n⏱️  MODEL PROFIEL")
+        print("=" * 76)
+        print(f"{'Onderdeel':<42} {'Tijd':>8} {'Variabelen':>11} {'Constraints':>12}")
+        print("-" * 76)
+        for section in self.sections:
+            print(f"{section['name']:<42} {section['time']:>7.2f}s {section['variables']:>11,} "
+                  f"{section['constraints']:>12,}")
+        print("=" * 76)
+
+    def save(self, schedule_filename):
+        """Schrijf het rapport naast het schema: schedule-x.json -> schedule-x.profile.json"""
+        if schedule_filename.endswith('.json'):
+            filename = schedule_filename[:-len('.json')] + '.profile.json'
+        else:
+            filename = schedule_filename + '.profile.json'
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+        print(f"💾 Profiel opgeslagen als: {filename}")
+        return filename
@@ -0,0 +1,156 @@
+"""
+Resultaat cache voor de FLL Tournament Scheduler
+Bewaart de JSON output van een solve op schijf onder een hash van alle instellingen die het
+schema bepalen plus de versie van de scheduler code. Dezelfde aanvraag (bijv. de standaard
+40 teams, 8 tafels, 7 rooms) geeft dan direct het bewaarde schema terug in plaats van een
+nieuwe solve van minuten. Het minst recent gebruikte schema wordt verwijderd zodra de cache
+groter wordt dan RESULT_CACHE_MAX_MB.
+
+Gebruik:
+    python run_scheduler_with_params.py --cache .schedule-cache
+"""
+import dataclasses
+import hashlib
+import json
+import os
+import time
+
+
+# Instellingen die alleen de uitvoer, het logboek of de rekenkracht bepalen, niet het schema.
+# De oplostijd zit ook niet in de sleutel: die wordt per entry bewaard (zie lookup).
+IGNORED_SETTINGS = {
+    'max_solve_time', 'hierarchical_time_limits', 'num_search_workers', 'log_search_progress',
+    'progress_stream', 'progress_save_file', 'progress_save_interval', 'output_format',
+    'quiet', 'output_minified', 'profile_build', 'result_cache_dir', 'result_cache_max_mb',
+    'result_cache_resolve_shorter',
+}
+
+# Bronbestanden waarvan het schema afhangt; een wijziging hierin maakt de cache ongeldig
+CODE_FILES = ('complete_scheduler.py', 'scheduler.py')
+
+
+def code_version():
+    """Hash van de scheduler code"""
+    digest = hashlib.sha256()
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in CODE_FILES:
+        with open(os.path.join(directory, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def time_budget(scheduler_config):
+    """Totale oplostijd van een configuratie (bij hiërarchisch de som over de niveaus)"""
+    if scheduler_config.objective_strategy == "hierarchical":
+        return sum(scheduler_config.hierarchical_time_limits.values())
+    return scheduler_config.max_solve_time
+
+
+def cache_key(scheduler_config):
+    """Canonieke hash van de instellingen die het schema bepalen, plus de code versie"""
+    settings = {f.name: getattr(scheduler_config, f.name) for f in dataclasses.fields(scheduler_config)
+                if f.name not in IGNORED_SETTINGS}
+    if settings['hint_from'] is not None:
+        # De hint telt mee met zijn inhoud, niet met zijn pad
+        with open(settings['hint_from'], 'rb') as f:
+            settings['hint_from'] = hashlib.sha256(f.read()).hexdigest()
+    # Tuples en lijsten (TABLE_PAIRS) worden beide een JSON lijst
+    canonical = json.dumps({'code': code_version(), 'settings': settings}, sort_keys=True)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Schema's op schijf als <sleutel>.json; de wijzigingstijd is het laatste gebruik (LRU)"""
+
+    def __init__(self, directory, max_mb=100, resolve_shorter=False):
+        self.directory = directory
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.resolve_shorter = resolve_shorter
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, scheduler_config):
+        """Cache van een SchedulerConfig, None als RESULT_CACHE_DIR niet ingesteld is"""
+        if scheduler_config.result_cache_dir is None:
+            return None
+        return cls(scheduler_config.result_cache_dir, scheduler_config.result_cache_max_mb,
+                   scheduler_config.result_cache_resolve_shorter)
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read(self, key):
+        try:
+            with open(self.path(key), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def lookup(self, scheduler_config):
+        """Bewaarde entry ({'status', 'objective', 'maxSolveTime', 'schedule', ...}) of None
+
+        Met resolve_shorter telt een niet-optimale entry die met minder oplostijd gemaakt is
+        dan nu gevraagd als een miss, zodat de langere solve een beter schema kan vinden.
+        """
+        key = cache_key(scheduler_config)
+        entry = self._read(key)
+        if entry is None:
+            return None
+        if (self.resolve_shorter and entry['status'] != 'OPTIMAL'
+                and entry['maxSolveTime'] < time_budget(scheduler_config)):
+            return None
+        try:
+            os.utime(self.path(key))
+        except OSError:
+            pass
+        return entry
+
+    def store(self, scheduler_config, result, output):
+        """Bewaar de output van een gevonden oplossing; geeft de entry terug"""
+        from ortools.sat.python import cp_model
+
+        key = cache_key(scheduler_config)
+        entry = {
+            'key': key,
+            'status': 'OPTIMAL' if result['status'] == cp_model.OPTIMAL else 'FEASIBLE',
+            'objective': result['objective_value'],
+            'solveTime': round(result['solve_time'], 2),
+            'maxSolveTime': time_budget(scheduler_config),
+            'created': time.time(),
+            'schedule': output,
+        }
+        previous = self._read(key)
+        if previous is not None:
+            # Een beter bewaard schema houden, maar wel onthouden dat er langer gezocht is
+            if previous['objective'] < entry['objective']:
+                entry = dict(previous)
+            entry['maxSolveTime'] = max(previous['maxSolveTime'], time_budget(scheduler_config))
+
+        temp_filename = f"{self.path(key)}.{os.getpid()}.tmp"
+        with open(temp_filename, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, separators=(',', ':'))
+        os.replace(temp_filename, self.path(key))
+        self.evict()
+        return entry
+
+    def evict(self):
+        """Verwijder de minst recent gebruikte entries tot de cache binnen max_bytes past"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
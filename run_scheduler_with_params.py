@@ -1,58 +1,170 @@
 """
 Wrapper script to run scheduler with command line parameters
-Dynamically overwrites config values before running
+Combines the config.py values with the given parameters into a SchedulerConfig
 """
 import sys
 import argparse
 
-def main():
-    parser = argparse.ArgumentParser(description='FLL Tournament Scheduler with custom parameters')
-    parser.add_argument('--num-teams', type=int, help='Aantal teams (10-40)')
+
+def add_config_arguments(parser):
+    """Voegt de toernooi parameters toe aan een argparse parser"""
+    parser.add_argument('--num-teams', type=int, help='Aantal teams (10-40, met --mode rolling meer)')
     parser.add_argument('--num-tables', type=int, help='Aantal tafels (4-10)')
     parser.add_argument('--num-jury-rooms', type=int, help='Aantal jury rooms (4-10)')
     parser.add_argument('--matches-per-team', type=int, help='Wedstrijden per team')
     parser.add_argument('--num-timeslots', type=int, help='Aantal tijdsloten')
+    parser.add_argument('--auto-timeslots', action=argparse.BooleanOptionalAction, default=None,
+                        help='Zoek automatisch het kleinste haalbare aantal tijdsloten (max --num-timeslots)')
     parser.add_argument('--start-time', type=str, help='Start tijd toernooi (HH:MM)')
     parser.add_argument('--match-duration', type=int, help='Wedstrijd duur in minuten')
     parser.add_argument('--jury-duration', type=int, help='Jury sessie duur in minuten')
     parser.add_argument('--buffer-time', type=int, help='Buffer tijd tussen activiteiten')
     parser.add_argument('--break-enabled', type=str, help='Pauze inschakelen (Ja/Nee)')
-    
-    args = parser.parse_args()
-    
-    # Import config and override values
-    import config
-    
+    parser.add_argument('--symmetry-breaking', action=argparse.BooleanOptionalAction, default=None,
+                        help='Symmetry breaking constraints toevoegen')
+    parser.add_argument('--mode', choices=['monolithic', 'decomposed', 'rolling', 'greedy'],
+                        help='Planning methode: 1 model, eerst jury rondes dan matches, matches per '
+                             'tijdvenster, of constructief zonder solver')
+    parser.add_argument('--window-slots', type=int,
+                        help='Tijdsloten per venster bij --mode rolling')
+    parser.add_argument('--objective-strategy', choices=['weighted', 'hierarchical'],
+                        help='Doel termen gewogen in 1 solve of hiërarchisch per prioriteit')
+    parser.add_argument('--hint-from', type=str,
+                        help='Eerder schema (JSON) als startpunt voor de solver')
+    parser.add_argument('--greedy-hint', action=argparse.BooleanOptionalAction, default=None,
+                        help='Constructief schema als startpunt voor de solver')
+    parser.add_argument('--workers', type=str,
+                        help='Aantal CP-SAT zoek workers of "auto" (beschikbare CPUs)')
+    parser.add_argument('--log-search', action=argparse.BooleanOptionalAction, default=None,
+                        help='Toon de CP-SAT zoek log')
+    parser.add_argument('--deterministic', action=argparse.BooleanOptionalAction, default=None,
+                        help='Deterministisch zoeken (interleaved workers, reproduceerbaar)')
+    parser.add_argument('--progress', type=str, nargs='?', const='-',
+                        help='Voortgang als JSON regels naar stdout of naar dit bestand')
+    parser.add_argument('--save-best', type=str,
+                        help='Sla het beste schema tot nu toe tussentijds op in dit bestand')
+    parser.add_argument('--save-interval', type=float,
+                        help='Seconden tussen tussentijdse opslag (standaard 10)')
+    parser.add_argument('--stop-gap', type=float,
+                        help='Stop zodra de gap kleiner is dan deze fractie, bijv. 0.01')
+    parser.add_argument('--stop-no-improvement', type=float,
+                        help='Stop na zoveel seconden zonder betere oplossing')
+    parser.add_argument('--output-format', choices=['verbose', 'compact'],
+                        help='Opslagformaat: gewone JSON of compact (alleen toewijzingen)')
+    parser.add_argument('--minify', action=argparse.BooleanOptionalAction, default=None,
+                        help='JSON zonder inspringing opslaan')
+    parser.add_argument('--cache', type=str,
+                        help='Map voor de resultaat cache (zelfde parameters = bewaard schema)')
+    parser.add_argument('--cache-resolve-shorter', action=argparse.BooleanOptionalAction, default=None,
+                        help='Opnieuw oplossen als het bewaarde schema met minder oplostijd gemaakt is')
+    parser.add_argument('--profile', action=argparse.BooleanOptionalAction, default=None,
+                        help='Meet bouwtijd en modelgrootte per constraint familie (JSON rapport)')
+
+
+def config_overrides(args):
+    """De meegegeven parameters als {CONFIG_NAAM: waarde} (alleen opgegeven parameters)"""
+    overrides = {}
     if args.num_teams is not None:
-        config.NUM_TEAMS = args.num_teams
+        overrides['NUM_TEAMS'] = args.num_teams
     if args.num_tables is not None:
-        config.NUM_TABLES = args.num_tables
+        overrides['NUM_TABLES'] = args.num_tables
     if args.num_jury_rooms is not None:
-        config.NUM_JURY_ROOMS = args.num_jury_rooms
+        overrides['NUM_JURY_ROOMS'] = args.num_jury_rooms
     if args.matches_per_team is not None:
-        config.MATCHES_PER_TEAM = args.matches_per_team
+        overrides['MATCHES_PER_TEAM'] = args.matches_per_team
     if args.num_timeslots is not None:
-        config.NUM_TIMESLOTS = args.num_timeslots
+        overrides['NUM_TIMESLOTS'] = args.num_timeslots
+    if args.auto_timeslots is not None:
+        overrides['AUTO_TIMESLOTS'] = args.auto_timeslots
     if args.start_time is not None:
-        config.START_TIME = args.start_time
+        overrides['START_TIME'] = args.start_time
     if args.match_duration is not None:
-        config.MATCH_DURATION = args.match_duration
+        overrides['MATCH_DURATION'] = args.match_duration
     if args.jury_duration is not None:
-        config.JURY_DURATION = args.jury_duration
+        overrides['JURY_DURATION'] = args.jury_duration
     if args.buffer_time is not None:
-        config.MINIMUM_BUFFER_TIME = args.buffer_time
+        overrides['MINIMUM_BUFFER_TIME'] = args.buffer_time
     if args.break_enabled is not None:
-        config.BREAK_ENABLED = args.break_enabled.lower() in ['ja', 'yes', 'true', '1']
-    
-    # Now run the scheduler
-    from complete_scheduler import create_complete_schedule, build_json_output, print_summary, save_json
-    
-    result = create_complete_schedule()
-    
+        overrides['BREAK_ENABLED'] = args.break_enabled.lower() in ['ja', 'yes', 'true', '1']
+    if args.symmetry_breaking is not None:
+        overrides['SYMMETRY_BREAKING'] = args.symmetry_breaking
+    if args.mode is not None:
+        overrides['SCHEDULER_MODE'] = args.mode
+    if args.window_slots is not None:
+        overrides['ROLLING_WINDOW_SLOTS'] = args.window_slots
+    if args.objective_strategy is not None:
+        overrides['OBJECTIVE_STRATEGY'] = args.objective_strategy
+    if args.hint_from is not None:
+        overrides['HINT_FROM'] = args.hint_from
+    if args.greedy_hint is not None:
+        overrides['GREEDY_HINT'] = args.greedy_hint
+    if args.workers is not None:
+        overrides['NUM_SEARCH_WORKERS'] = args.workers if args.workers == 'auto' else int(args.workers)
+    if args.log_search is not None:
+        overrides['LOG_SEARCH_PROGRESS'] = args.log_search
+    if args.deterministic is not None:
+        overrides['DETERMINISTIC_SEARCH'] = args.deterministic
+    if args.progress is not None:
+        overrides['PROGRESS_STREAM'] = args.progress
+    if args.save_best is not None:
+        overrides['PROGRESS_SAVE_FILE'] = args.save_best
+    if args.save_interval is not None:
+        overrides['PROGRESS_SAVE_INTERVAL'] = args.save_interval
+    if args.stop_gap is not None:
+        overrides['STOP_AT_GAP'] = args.stop_gap
+    if args.stop_no_improvement is not None:
+        overrides['STOP_AFTER_NO_IMPROVEMENT'] = args.stop_no_improvement
+    if args.output_format is not None:
+        overrides['OUTPUT_FORMAT'] = args.output_format
+    if args.minify is not None:
+        overrides['OUTPUT_MINIFIED'] = args.minify
+    if args.cache is not None:
+        overrides['RESULT_CACHE_DIR'] = args.cache
+    if args.cache_resolve_shorter is not None:
+        overrides['RESULT_CACHE_RESOLVE_SHORTER'] = args.cache_resolve_shorter
+    if args.profile is not None:
+        overrides['PROFILE_BUILD'] = args.profile
+    return overrides
+
+
+def main():
+    # Subcommando: python run_scheduler_with_params.py sweep --num-tables 6,8 ...
+    if len(sys.argv) > 1 and sys.argv[1] == 'sweep':
+        from sweep import main as sweep_main
+        sweep_main(sys.argv[2:])
+        return
+
+    parser = argparse.ArgumentParser(description='FLL Tournament Scheduler with custom parameters')
+    add_config_arguments(parser)
+
+    args = parser.parse_args()
+
+    # config.py waarden met de parameters als overrides, zonder het config module aan te passen
+    from result_cache import ResultCache
+    from scheduler import Scheduler, SchedulerConfig
+    scheduler = Scheduler(SchedulerConfig.from_config(config_overrides(args)))
+
+    cache = ResultCache.from_config(scheduler.config)
+    entry = cache.lookup(scheduler.config) if cache is not None else None
+    if entry is not None:
+        from schedule_stats import analyze_schedule, print_schedule_stats
+        print(f"♻️  Schema uit de cache ({entry['status']}, doelwaarde {entry['objective']:,}, "
+              f"gemaakt met max {entry['maxSolveTime']:g}s oplostijd)")
+        print_schedule_stats(analyze_schedule(entry['schedule']))
+        scheduler.save(entry['schedule'])
+        print(f"\n✅ Compleet schema succesvol gegenereerd!")
+        return
+
+    result, output = scheduler.run()
+
     if result:
-        output = build_json_output(result)
-        print_summary(output, result)
-        filename = save_json(output)
+        if cache is not None:
+            cache.store(scheduler.config, result, output)
+        scheduler.summary(output, result)
+        filename = scheduler.save(output)
+        if result['profiler'].enabled:
+            result['profiler'].print_report()
+            result['profiler'].save(filename)
         print(f"\n✅ Compleet schema succesvol gegenereerd!")
     else:
         print("\n❌ Geen oplossing gevonden - pas parameters aan")
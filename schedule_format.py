@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Compact opslagformaat voor FLL schema's
+De gewone JSON output bevat een tableTimeslotList en juryTimeslotList entry voor elke
+tafel/room per tijdslot, ook als die leeg blijft. Het compacte formaat slaat alleen de
+tijden per tijdslot en de toewijzingen op, als kolommen (lijsten van getallen).
+expand_schedule() bouwt daar weer exact het gewone schema van, zodat de web frontend en
+test_schedule.py niets hoeven te veranderen.
+
+Gebruik:
+    python schedule_format.py compact schedule-complete-x.json schedule-x.compact.json
+    python schedule_format.py expand schedule-x.compact.json schedule-complete-x.json
+"""
+import json
+import sys
+
+COMPACT_FORMAT = "fll-schedule-compact"
+COMPACT_VERSION = 1
+
+
+def _slot_columns(slots, per_slot, resource_id):
+    """Tijden per tijdslot uit een tableTimeslotList/juryTimeslotList (id = ts * per_slot + resource)"""
+    columns = {'startTime': [], 'endTime': [], 'duration': []}
+    if len(slots) % per_slot != 0:
+        raise ValueError(f"{len(slots)} tijdsloten is geen veelvoud van {per_slot}: compact formaat niet mogelijk")
+    for slot_id, slot in enumerate(slots):
+        ts, resource = divmod(slot_id, per_slot)
+        if slot['id'] != slot_id or resource_id(slot) != resource:
+            raise ValueError(f"Onverwachte tijdslot layout bij id {slot['id']}: compact formaat niet mogelijk")
+        if resource == 0:
+            for name in columns:
+                columns[name].append(slot[name])
+        elif any(slot[name] != columns[name][ts] for name in columns):
+            # Het compacte formaat bewaart 1 set tijden per tijdslot voor alle tafels/rooms
+            raise ValueError(f"Tijdslot id {slot_id} heeft andere tijden dan de rest van tijdslot {ts}: "
+                             "compact formaat niet mogelijk")
+    return columns
+
+
+def _allocation_columns(allocations):
+    return {
+        'team': [allocation['team']['id'] for allocation in allocations],
+        'timeslot': [allocation['timeslot']['id'] for allocation in allocations],
+    }
+
+
+def compact_schedule(output):
+    """Gewoon schema (build_json_output) -> compact schema"""
+    num_tables = len(output['tableList'])
+    num_jury_rooms = len(output['juryList'])
+    for name in ('tableList', 'tablePairList', 'juryList', 'teamList'):
+        if [item['id'] for item in output[name]] != list(range(len(output[name]))):
+            raise ValueError(f"{name} ids zijn niet 0..n-1: compact formaat niet mogelijk")
+
+    return {
+        'format': COMPACT_FORMAT,
+        'version': COMPACT_VERSION,
+        'constraintConfiguration': output['constraintConfiguration'],
+        'tablePairs': [table['tablePair']['id'] for table in output['tableList']],
+        'numTablePairs': len(output['tablePairList']),
+        'numJuryRooms': num_jury_rooms,
+        'numTeams': len(output['teamList']),
+        'tableTimeslots': _slot_columns(output['tableTimeslotList'], num_tables,
+                                        lambda slot: slot['table']['id']),
+        'juryTimeslots': _slot_columns(output['juryTimeslotList'], num_jury_rooms,
+                                       lambda slot: slot['jury']['id']),
+        'teamTableAllocations': _allocation_columns(output['teamTableAllocationList']),
+        'teamJuryAllocations': _allocation_columns(output['teamJuryAllocationList']),
+        'score': output['score'],
+    }
+
+
+def expand_schedule(compact):
+    """Compact schema -> gewoon schema, identiek aan de oorspronkelijke build_json_output"""
+    if compact.get('format') != COMPACT_FORMAT:
+        raise ValueError("Geen compact schema")
+    if compact['version'] > COMPACT_VERSION:
+        raise ValueError(f"Compact schema versie {compact['version']} wordt niet ondersteund")
+
+    table_pairs = compact['tablePairs']
+    num_jury_rooms = compact['numJuryRooms']
+
+    table_timeslots = []
+    slots = compact['tableTimeslots']
+    for ts, (start, end, duration) in enumerate(zip(slots['startTime'], slots['endTime'], slots['duration'])):
+        for table_id, pair_id in enumerate(table_pairs):
+            table_timeslots.append({
+                "id": ts * len(table_pairs) + table_id,
+                "startTime": start,
+                "duration": duration,
+                "table": {
+                    "id": table_id,
+                    "tablePair": {"id": pair_id}
+                },
+                "endTime": end
+            })
+
+    jury_timeslots = []
+    slots = compact['juryTimeslots']
+    for ts, (start, end, duration) in enumerate(zip(slots['startTime'], slots['endTime'], slots['duration'])):
+        for jury_id in range(num_jury_rooms):
+            jury_timeslots.append({
+                "id": ts * num_jury_rooms + jury_id,
+                "startTime": start,
+                "duration": duration,
+                "endTime": end,
+                "jury": {"id": jury_id}
+            })
+
+    def allocations(columns):
+        return [{"team": {"id": team}, "timeslot": {"id": timeslot}}
+                for team, timeslot in zip(columns['team'], columns['timeslot'])]
+
+    return {
+        "constraintConfiguration": compact['constraintConfiguration'],
+        "tableList": [{"id": table_id, "tablePair": {"id": pair_id}} for table_id, pair_id in enumerate(table_pairs)],
+        "tablePairList": [{"id": pair_id} for pair_id in range(compact['numTablePairs'])],
+        "juryList": [{"id": jury_id} for jury_id in range(num_jury_rooms)],
+        "teamList": [{"id": team_id} for team_id in range(compact['numTeams'])],
+        "tableTimeslotList": table_timeslots,
+        "juryTimeslotList": jury_timeslots,
+        "teamTableAllocationList": allocations(compact['teamTableAllocations']),
+        "teamJuryAllocationList": allocations(compact['teamJuryAllocations']),
+        "score": compact['score']
+    }
+
+
+def dump_schedule(output, f, compact=False, minify=False):
+    """Schrijf een schema naar een open bestand (gewoon of compact, ingesprongen of geminificeerd)"""
+    data = compact_schedule(output) if compact else output
+    if minify:
+        json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+    else:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def load_schedule(filename):
+    """Laad een schema in het gewone formaat, ook als het bestand compact is opgeslagen"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict) and data.get('format') == COMPACT_FORMAT:
+        return expand_schedule(data)
+    return data
+
+
+def main():
+    if len(sys.argv) != 4 or sys.argv[1] not in ('compact', 'expand'):
+        print("Usage: python schedule_format.py compact|expand <invoer.json> <uitvoer.json>")
+        sys.exit(1)
+
+    command, source, target = sys.argv[1:]
+    output = load_schedule(source)
+    with open(target, 'w', encoding='utf-8') as f:
+        dump_schedule(output, f, compact=command == 'compact', minify=command == 'compact')
+    print(f"💾 Schema opgeslagen als: {target}")
+
+
+if __name__ == "__main__":
+    main()
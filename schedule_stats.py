@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Analyse van een gegenereerd FLL schema
+Bouwt eenmalig een index over de JSON output (id -> tijdslot) zodat de samenvatting en
+statistieken in lineaire tijd berekend worden, ook voor honderden schema's uit een sweep.
+
+Gebruik:
+    python schedule_stats.py schedule-complete-2025-01-01T10-00-00.json [meer schema's ...]
+"""
+import sys
+from collections import Counter, defaultdict
+
+from schedule_format import load_schedule
+
+
+class ScheduleIndex:
+    """Geïndexeerde weergave van de JSON output van de scheduler
+
+    tableTimeslotList en juryTimeslotList worden 1 keer omgezet naar opzoek tabellen op id;
+    daarna worden de activiteiten per team en de matches per (starttijd, tafel paar)
+    gegroepeerd. Alle analyses werken op deze groepen in plaats van op de lijsten zelf.
+    """
+
+    def __init__(self, output):
+        self.team_ids = [team['id'] for team in output['teamList']]
+        self.table_ids = [table['id'] for table in output['tableList']]
+
+        # id -> (start, eind, tafel, tafel paar) en id -> (start, eind, jury room)
+        table_slots = {slot['id']: (slot['startTime'], slot['endTime'], slot['table']['id'],
+                                    slot['table']['tablePair']['id'])
+                       for slot in output['tableTimeslotList']}
+        jury_slots = {slot['id']: (slot['startTime'], slot['endTime'], slot['jury']['id'])
+                      for slot in output['juryTimeslotList']}
+
+        # Per team: [(start, eind, tafel)] en [(start, eind, jury room)], gesorteerd op start
+        self.team_matches = defaultdict(list)
+        self.team_jury = defaultdict(list)
+        # (start, tafel paar) -> teams: de teams die op dat moment tegen elkaar spelen
+        self.games = defaultdict(list)
+
+        for allocation in output['teamTableAllocationList']:
+            team = allocation['team']['id']
+            start, end, table, pair = table_slots[allocation['timeslot']['id']]
+            self.team_matches[team].append((start, end, table))
+            self.games[(start, pair)].append(team)
+
+        for allocation in output['teamJuryAllocationList']:
+            team = allocation['team']['id']
+            self.team_jury[team].append(jury_slots[allocation['timeslot']['id']])
+
+        for activities in (self.team_matches, self.team_jury):
+            for team_activities in activities.values():
+                team_activities.sort()
+
+        self.num_matches = len(output['teamTableAllocationList'])
+        self.num_jury_sessions = len(output['teamJuryAllocationList'])
+
+    def team_activities(self, team):
+        """Alle activiteiten van een team als (start, eind), gesorteerd op start"""
+        activities = [(start, end) for start, end, _ in self.team_matches[team]]
+        activities += [(start, end) for start, end, _ in self.team_jury[team]]
+        return sorted(activities)
+
+    def opponents(self):
+        """team -> Counter van tegenstanders"""
+        opponents = defaultdict(Counter)
+        for teams in self.games.values():
+            for team in teams:
+                for other in teams:
+                    if other != team:
+                        opponents[team][other] += 1
+        return opponents
+
+
+def analyze_schedule(output):
+    """Statistieken over een schema (JSON output), in lineaire tijd"""
+    index = ScheduleIndex(output)
+
+    # Tafel verdeling: aantal verschillende tafels per team en matches per tafel
+    tables_per_team = Counter(len({table for _, _, table in index.team_matches[team]})
+                              for team in index.team_ids)
+    matches_per_table = Counter(table for matches in index.team_matches.values()
+                                for _, _, table in matches)
+
+    # Wachttijd per team: tijd tussen eerste start en laatste einde die niet bezet is
+    idle_times = {}
+    for team in index.team_ids:
+        activities = index.team_activities(team)
+        if not activities:
+            continue
+        busy = sum(end - start for start, end in activities)
+        idle_times[team] = activities[-1][1] - activities[0][0] - busy
+
+    # Tegenstander variatie: unieke tegenstanders per gespeelde match met tegenstander
+    opponents = index.opponents()
+    diversity = [len(counter) / sum(counter.values()) for counter in opponents.values() if counter]
+    repeated_pairs = sum(1 for team, counter in opponents.items()
+                         for other, count in counter.items() if team < other and count > 1)
+
+    # Tijd tussen jury sessie en de dichtstbijzijnde match van hetzelfde team
+    jury_gaps = []
+    for team in index.team_ids:
+        for jury_start, jury_end, _ in index.team_jury[team]:
+            gaps = [match_start - jury_end if match_start >= jury_end else jury_start - match_end
+                    for match_start, match_end, _ in index.team_matches[team]]
+            if gaps:
+                jury_gaps.append(min(gaps))
+
+    idle = list(idle_times.values())
+    return {
+        'matches': index.num_matches,
+        'jurySessions': index.num_jury_sessions,
+        'tablesPerTeam': dict(sorted(tables_per_team.items())),
+        'matchesPerTable': {table: matches_per_table.get(table, 0) for table in index.table_ids},
+        'idleTime': {
+            'min': min(idle, default=None),
+            'avg': round(sum(idle) / len(idle), 1) if idle else None,
+            'max': max(idle, default=None),
+            'maxTeam': max(idle_times, key=idle_times.get) if idle_times else None,
+        },
+        'opponentDiversity': round(sum(diversity) / len(diversity), 3) if diversity else None,
+        'repeatedOpponentPairs': repeated_pairs,
+        'juryMatchGap': {
+            'min': min(jury_gaps, default=None),
+            'avg': round(sum(jury_gaps) / len(jury_gaps), 1) if jury_gaps else None,
+        },
+    }
+
+
+def print_schedule_stats(stats):
+    """Print de statistieken uit analyze_schedule"""
+    print(f"\nTotaal matches: {stats['matches']}")
+    print(f"Totaal jury sessies: {stats['jurySessions']}")
+
+    print(f"\nTafel verdeling:")
+    for num_tables, num_teams in stats['tablesPerTeam'].items():
+        label = 'tafel' if num_tables == 1 else 'tafels'
+        warning = ' ⚠️' if num_tables > 2 else ''
+        print(f"  Teams op {num_tables} {label}: {num_teams}{warning}")
+    per_table = ", ".join(f"{table + 1}: {count}" for table, count in stats['matchesPerTable'].items())
+    print(f"  Matches per tafel: {per_table}")
+
+    idle = stats['idleTime']
+    if idle['avg'] is not None:
+        print(f"\nWachttijd per team: min {idle['min']} / gem. {idle['avg']} / max {idle['max']} minuten "
+              f"(team {idle['maxTeam']})")
+    if stats['opponentDiversity'] is not None:
+        repeated = stats['repeatedOpponentPairs']
+        warning = f", {repeated} herhaalde paren ⚠️" if repeated else ""
+        print(f"Tegenstander variatie: {stats['opponentDiversity']:.0%} unieke tegenstanders{warning}")
+    gap = stats['juryMatchGap']
+    if gap['min'] is not None:
+        print(f"Tijd tussen jury en dichtstbijzijnde match: min {gap['min']} / gem. {gap['avg']} minuten")
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python schedule_stats.py <schedule.json> [...]")
+        sys.exit(1)
+
+    for filename in sys.argv[1:]:
+        output = load_schedule(filename)
+        print("=" * 70)
+        print(f"📊 {filename}")
+        print("=" * 70)
+        print_schedule_stats(analyze_schedule(output))
+
+
+if __name__ == "__main__":
+    main()
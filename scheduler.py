@@ -0,0 +1,148 @@
+"""
+In-process API voor de FLL Tournament Scheduler
+SchedulerConfig bevat alle instellingen uit config.py als 1 object; Scheduler bouwt, lost op
+en zet om met precies die instellingen. Elke stap krijgt de configuratie expliciet mee, zodat
+meerdere configuraties in hetzelfde (warme) proces kunnen draaien, na elkaar of tegelijk in
+threads, zonder het config module aan te passen of complete_scheduler opnieuw te importeren.
+
+Gebruik:
+    from scheduler import Scheduler, SchedulerConfig
+
+    scheduler = Scheduler(SchedulerConfig(num_teams=24, num_tables=6, max_solve_time=60))
+    result, output = scheduler.run()
+    scheduler.save(output, "schedule-24.json")
+"""
+import copy
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+import config
+
+
+def _from_config(name):
+    """Standaardwaarde uit config.py (lijsten en dicts per instantie gekopieerd)"""
+    value = getattr(config, name)
+    if isinstance(value, (list, dict)):
+        return field(default_factory=lambda: copy.deepcopy(value))
+    return field(default=value)
+
+
+@dataclass
+class SchedulerConfig:
+    """Alle scheduler instellingen; veldnamen zijn de config.py namen in kleine letters"""
+
+    # Toernooi
+    num_tables: int = _from_config('NUM_TABLES')
+    num_jury_rooms: int = _from_config('NUM_JURY_ROOMS')
+    num_teams: int = _from_config('NUM_TEAMS')
+    matches_per_team: int = _from_config('MATCHES_PER_TEAM')
+    match_duration: int = _from_config('MATCH_DURATION')
+    jury_duration: int = _from_config('JURY_DURATION')
+    minimum_buffer_time: int = _from_config('MINIMUM_BUFFER_TIME')
+    break_enabled: bool = _from_config('BREAK_ENABLED')
+    break_start_time: int = _from_config('BREAK_START_TIME')
+    break_duration: int = _from_config('BREAK_DURATION')
+    table_pairs: list = _from_config('TABLE_PAIRS')
+    num_timeslots: int = _from_config('NUM_TIMESLOTS')
+    auto_timeslots: bool = _from_config('AUTO_TIMESLOTS')
+    auto_timeslots_probe_time: float = _from_config('AUTO_TIMESLOTS_PROBE_TIME')
+    jury_sessions_per_team: int = _from_config('JURY_SESSIONS_PER_TEAM')
+
+    # Timing en solver
+    start_time: str = _from_config('START_TIME')
+    end_time: Optional[int] = _from_config('END_TIME')
+    max_solve_time: float = _from_config('MAX_SOLVE_TIME')
+    num_search_workers: Union[int, str] = _from_config('NUM_SEARCH_WORKERS')
+    log_search_progress: bool = _from_config('LOG_SEARCH_PROGRESS')
+    quiet: bool = _from_config('QUIET')
+    deterministic_search: bool = _from_config('DETERMINISTIC_SEARCH')
+    progress_stream: Optional[str] = _from_config('PROGRESS_STREAM')
+    progress_save_file: Optional[str] = _from_config('PROGRESS_SAVE_FILE')
+    progress_save_interval: float = _from_config('PROGRESS_SAVE_INTERVAL')
+    stop_at_gap: Optional[float] = _from_config('STOP_AT_GAP')
+    stop_after_no_improvement: Optional[float] = _from_config('STOP_AFTER_NO_IMPROVEMENT')
+    output_format: str = _from_config('OUTPUT_FORMAT')
+    output_minified: bool = _from_config('OUTPUT_MINIFIED')
+    result_cache_dir: Optional[str] = _from_config('RESULT_CACHE_DIR')
+    result_cache_max_mb: float = _from_config('RESULT_CACHE_MAX_MB')
+    result_cache_resolve_shorter: bool = _from_config('RESULT_CACHE_RESOLVE_SHORTER')
+
+    # Model
+    scheduler_mode: str = _from_config('SCHEDULER_MODE')
+    rolling_window_slots: Optional[int] = _from_config('ROLLING_WINDOW_SLOTS')
+    jury_overlap_model: str = _from_config('JURY_OVERLAP_MODEL')
+    opponent_model: str = _from_config('OPPONENT_MODEL')
+    objective_model: str = _from_config('OBJECTIVE_MODEL')
+    objective_strategy: str = _from_config('OBJECTIVE_STRATEGY')
+    hierarchical_time_limits: dict = _from_config('HIERARCHICAL_TIME_LIMITS')
+    symmetry_breaking: bool = _from_config('SYMMETRY_BREAKING')
+    hint_from: Optional[str] = _from_config('HINT_FROM')
+    greedy_hint: bool = _from_config('GREEDY_HINT')
+    diagnose_infeasibility: bool = _from_config('DIAGNOSE_INFEASIBILITY')
+    diagnosis_time: float = _from_config('DIAGNOSIS_TIME')
+    profile_build: bool = _from_config('PROFILE_BUILD')
+
+    @classmethod
+    def from_config(cls, overrides=None):
+        """De huidige waarden van het config module, eventueel met {CONFIG_NAAM: waarde} overrides"""
+        values = {f.name: copy.deepcopy(getattr(config, f.name.upper())) for f in dataclasses.fields(cls)}
+        for name, value in (overrides or {}).items():
+            values[name.lower()] = value
+        return cls(**values)
+
+    def replace(self, **changes):
+        """Kopie met gewijzigde velden, bijv. config.replace(num_teams=30)"""
+        return dataclasses.replace(self, **changes)
+
+
+class Scheduler:
+    """Bouwt, lost op en zet om met een vaste SchedulerConfig
+
+    Elke stap van complete_scheduler krijgt self.config mee; er worden geen module globals
+    aangepast, dus Schedulers met verschillende configuraties kunnen naast elkaar draaien.
+    Het resultaat van solve() hoort bij die configuratie: extract() en summary() gebruiken
+    daarom dezelfde Scheduler.
+    """
+
+    def __init__(self, scheduler_config=None, quiet=False):
+        scheduler_config = scheduler_config if scheduler_config is not None else SchedulerConfig()
+        # quiet=True: niets printen, alleen voor deze Scheduler (sys.stdout blijft ongemoeid)
+        self.config = scheduler_config.replace(quiet=True) if quiet else scheduler_config
+
+    def build(self, profiler=None):
+        """Bouwt alleen het model (dict uit build_model_for_mode, None als het niet past)"""
+        import complete_scheduler
+
+        if profiler is None:
+            profiler = complete_scheduler.BuildProfiler(enabled=self.config.profile_build)
+        return complete_scheduler.build_model_for_mode(self.config, profiler)
+
+    def solve(self):
+        """Volledige run van create_complete_schedule (None als er geen oplossing is)"""
+        import complete_scheduler
+
+        return complete_scheduler.create_complete_schedule(self.config)
+
+    def extract(self, result):
+        """JSON output (build_json_output) van een resultaat van solve()"""
+        import complete_scheduler
+
+        return complete_scheduler.build_json_output(self.config, result)
+
+    def run(self):
+        """solve() en extract() na elkaar; geeft (result, output) terug"""
+        result = self.solve()
+        return result, self.extract(result)
+
+    def summary(self, output, result):
+        """Print de samenvatting van een resultaat"""
+        import complete_scheduler
+
+        complete_scheduler.print_summary(self.config, output, result)
+
+    def save(self, output, filename=None):
+        """Sla de output op in het formaat van deze configuratie; geeft de bestandsnaam terug"""
+        import complete_scheduler
+
+        return complete_scheduler.save_json(self.config, output, filename)
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Schedule service voor de FLL Tournament Scheduler
+Kleine lokale HTTP service (alleen standaard bibliotheek) die schema aanvragen in een
+wachtrij zet en oplost in een pool van warme worker processen (ortools al geladen).
+Dezelfde aanvraag twee keer indienen geeft dezelfde job terug.
+
+Gebruik:
+    python service.py --port 8765 --jobs 2 --time 60
+
+    curl -X POST localhost:8765/schedule -d '{"num_teams": 24, "num_tables": 6}'
+    curl localhost:8765/jobs/<id>            # status en voortgang (polling)
+    curl -N localhost:8765/jobs/<id>/events  # voortgang als server-sent events
+    curl localhost:8765/jobs/<id>/schedule   # het schema (JSON) zodra de job klaar is
+
+Met --cache DIR krijgen aanvragen die al eens opgelost zijn direct het bewaarde schema.
+
+Parameters zijn die van run_scheduler_with_params.py, met underscores als JSON sleutels
+(--num-teams -> num_teams, --break-enabled -> break_enabled: "Ja"/"Nee", --no-minify -> minify: false).
+
+Alleen de web frontend (DOCS_ORIGIN) mag de service vanuit een browser aanroepen; andere
+origins met --allow-origin.
+"""
+import argparse
+import contextlib
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cpus import available_cpus
+from run_scheduler_with_params import add_config_arguments, config_overrides
+
+
+# Parameters die bestanden op de server lezen of schrijven, of de CPU verdeling van de
+# server (--workers-per-job) omzeilen: niet via de service
+BLOCKED_PARAMETERS = {'hint_from', 'progress', 'save_best', 'save_interval', 'profile', 'cache', 'workers'}
+
+# Origin van de web frontend (GitHub Pages, zie docs/)
+DOCS_ORIGIN = 'https://koenvanwijk.github.io'
+
+
+class ParameterParser(argparse.ArgumentParser):
+    """argparse parser die bij ongeldige parameters een ValueError geeft in plaats van naar stderr te printen en te stoppen"""
+
+    def error(self, message):
+        raise ValueError(message)
+
+
+def parse_parameters(params):
+    """JSON parameters -> {CONFIG_NAAM: waarde}, met dezelfde controles als de command line"""
+    if not isinstance(params, dict):
+        raise ValueError("parameters moeten een JSON object zijn")
+
+    argv = []
+    for name, value in params.items():
+        if name in BLOCKED_PARAMETERS:
+            raise ValueError(f"parameter '{name}' is niet beschikbaar via de service")
+        if value is None:
+            continue
+        flag = name.replace('_', '-')
+        if value is False:
+            # Aan/uit parameters hebben een --no-... variant; bij andere parameters geeft dit een fout
+            argv.append('--no-' + flag)
+            continue
+        argv.append('--' + flag)
+        if value is not True:
+            argv.append(str(value))
+
+    parser = ParameterParser(prog='service', add_help=False)
+    add_config_arguments(parser)
+    args = parser.parse_args(argv)
+    return config_overrides(args)
+
+
+def warm_up():
+    """Initializer van de workers: ortools en het model alvast laden"""
+    import complete_scheduler  # noqa: F401
+
+
+def run_service_job(overrides, progress_file):
+    """Lost 1 aanvraag op in een (warm) worker proces; voortgang gaat als JSON regels naar progress_file"""
+    from ortools.sat.python import cp_model
+    from result_cache import ResultCache
+    from scheduler import Scheduler, SchedulerConfig
+
+    scheduler_config = SchedulerConfig.from_config(dict(overrides, PROGRESS_STREAM=progress_file))
+    start = time.perf_counter()
+    cache = ResultCache.from_config(scheduler_config)
+    entry = cache.lookup(scheduler_config) if cache is not None else None
+    if entry is not None:
+        return {'feasible': True, 'status': entry['status'], 'objective': entry['objective'],
+                'solveTime': entry['solveTime'], 'totalTime': round(time.perf_counter() - start, 2),
+                'cached': True, 'schedule': entry['schedule']}
+
+    result, output = Scheduler(scheduler_config, quiet=True).run()
+    elapsed = time.perf_counter() - start
+
+    if result is None:
+        return {'feasible': False, 'status': 'GEEN OPLOSSING', 'objective': None,
+                'solveTime': None, 'totalTime': round(elapsed, 2), 'cached': False, 'schedule': None}
+    if cache is not None:
+        cache.store(scheduler_config, result, output)
+    return {
+        'feasible': True,
+        'status': 'OPTIMAL' if result['status'] == cp_model.OPTIMAL else 'FEASIBLE',
+        'objective': result['objective_value'],
+        'solveTime': round(result['solve_time'], 2),
+        'totalTime': round(elapsed, 2),
+        'cached': False,
+        'schedule': output,
+    }
+
+
+class Job:
+    """1 schema aanvraag: parameters, future in de pool en het voortgangs bestand"""
+
+    def __init__(self, job_id, key, overrides, progress_file, future):
+        self.id = job_id
+        self.key = key
+        self.overrides = overrides
+        self.progress_file = progress_file
+        self.future = future
+        self.created = time.time()
+
+    @property
+    def state(self):
+        if not self.future.done():
+            return 'running' if self.future.running() else 'queued'
+        if self.future.exception() is not None:
+            return 'failed'
+        return 'done'
+
+    def progress(self, offset=0):
+        """Voortgangs regels vanaf byte offset; geeft (events, nieuwe offset) terug"""
+        try:
+            with open(self.progress_file, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+        except OSError:
+            return [], offset
+        # Alleen volledige regels: de worker kan midden in een regel zitten
+        complete = data[:data.rfind(b'\n') + 1]
+        events = [json.loads(line) for line in complete.decode('utf-8').splitlines() if line]
+        return events, offset + len(complete)
+
+    def describe(self):
+        """Status zonder het schema zelf (dat staat op /jobs/<id>/schedule)"""
+        events, _ = self.progress()
+        info = {
+            'id': self.id,
+            'state': self.state,
+            'parameters': self.overrides,
+            'created': self.created,
+            'progress': events[-1] if events else None,
+            'solutions': sum(1 for event in events if event['event'] == 'solution'),
+        }
+        if info['state'] == 'done':
+            result = self.future.result()
+            info.update({name: value for name, value in result.items() if name != 'schedule'})
+        elif info['state'] == 'failed':
+            info['error'] = str(self.future.exception())
+        return info
+
+
+class JobQueue:
+    """Wachtrij over een pool van warme worker processen; identieke aanvragen delen 1 job
+
+    Van de afgeronde jobs worden alleen de laatste keep_jobs bewaard (met hun schema).
+    """
+
+    def __init__(self, jobs, workers_per_job, max_time, cache_dir=None, keep_jobs=100):
+        self.jobs = jobs
+        self.workers_per_job = workers_per_job
+        self.max_time = max_time
+        self.cache_dir = cache_dir
+        self.keep_jobs = keep_jobs
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._by_key = {}
+        self._ids = itertools.count(1)
+        self._progress_dir = tempfile.TemporaryDirectory(prefix='fll-service-')
+        self._executor = ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context('spawn'),
+                                             initializer=warm_up)
+        # Alle workers direct starten, zodat de eerste aanvraag niet op de import van ortools wacht
+        for _ in range(jobs):
+            self._executor.submit(time.sleep, 0)
+
+    def submit(self, params):
+        """Nieuwe job voor deze parameters, of de bestaande job met dezelfde parameters"""
+        overrides = parse_parameters(params)
+        overrides.setdefault('MAX_SOLVE_TIME', self.max_time)
+        overrides['NUM_SEARCH_WORKERS'] = self.workers_per_job
+        if self.cache_dir is not None:
+            overrides['RESULT_CACHE_DIR'] = self.cache_dir
+        key = json.dumps(overrides, sort_keys=True)
+
+        with self._lock:
+            job = self._by_key.get(key)
+            if job is not None and job.state != 'failed':
+                return job, False
+            job_id = f"{next(self._ids):05d}"
+            progress_file = os.path.join(self._progress_dir.name, f"{job_id}.jsonl")
+            future = self._executor.submit(run_service_job, overrides, progress_file)
+            job = Job(job_id, key, overrides, progress_file, future)
+            self._jobs[job_id] = job
+            self._by_key[key] = job
+            self._evict()
+        return job, True
+
+    def _evict(self):
+        """Vergeet de oudste afgeronde jobs boven keep_jobs (aanroepen met self._lock)"""
+        finished = [job for job in self._jobs.values() if job.future.done()]
+        for job in finished[:max(0, len(finished) - self.keep_jobs)]:
+            del self._jobs[job.id]
+            if self._by_key.get(job.key) is job:
+                del self._by_key[job.key]
+            with contextlib.suppress(OSError):
+                os.remove(job.progress_file)
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def describe(self):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        states = [job.state for job in jobs]
+        return {
+            'workers': self.jobs,
+            'workersPerJob': self.workers_per_job,
+            'maxSolveTime': self.max_time,
+            'cache': self.cache_dir,
+            'keepJobs': self.keep_jobs,
+            'jobs': {state: states.count(state) for state in ('queued', 'running', 'done', 'failed')},
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._progress_dir.cleanup()
+
+
+class ScheduleRequestHandler(BaseHTTPRequestHandler):
+    """HTTP endpoints van de service (JSON, met CORS zodat de web frontend ze kan aanroepen)"""
+
+    queue = None
+    quiet = False
+    allowed_origins = (DOCS_ORIGIN,)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    def send_cors_headers(self):
+        """CORS alleen voor toegestane origins; andere pagina's kunnen de antwoorden niet lezen"""
+        origin = self.headers.get('Origin')
+        if '*' in self.allowed_origins:
+            self.send_header('Access-Control-Allow-Origin', '*')
+        elif origin in self.allowed_origins:
+            self.send_header('Access-Control-Allow-Origin', origin)
+            self.send_header('Vary', 'Origin')
+
+    def send_json(self, data, status=200):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_cors_headers()
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_cors_headers()
+        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.end_headers()
+
+    def do_POST(self):
+        if self.path != '/schedule':
+            return self.send_json({'error': 'onbekend pad'}, 404)
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            params = json.loads(self.rfile.read(length) or b'{}')
+            job, created = self.queue.submit(params)
+        except ValueError as error:
+            return self.send_json({'error': str(error)}, 400)
+        self.send_json(dict(job.describe(), deduplicated=not created), 202 if created else 200)
+
+    def do_GET(self):
+        if self.path == '/status':
+            return self.send_json(self.queue.describe())
+
+        match = re.fullmatch(r'/jobs/(\w+)(/schedule|/events)?', self.path)
+        job = self.queue.get(match.group(1)) if match else None
+        if job is None:
+            return self.send_json({'error': 'onbekende job'}, 404)
+
+        if match.group(2) == '/events':
+            return self.stream_events(job)
+        if match.group(2) == '/schedule':
+            if job.state != 'done':
+                return self.send_json({'error': f"job is {job.state}", 'state': job.state}, 409)
+            schedule = job.future.result()['schedule']
+            if schedule is None:
+                return self.send_json({'error': 'geen oplossing gevonden'}, 404)
+            return self.send_json(schedule)
+        self.send_json(job.describe())
+
+    def stream_events(self, job):
+        """Server-sent events: elke voortgangs regel als 'data:', tot slot een 'done' event"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_cors_headers()
+        self.end_headers()
+
+        offset = 0
+        try:
+            while True:
+                finished = job.future.done()
+                events, offset = job.progress(offset)
+                for event in events:
+                    self.wfile.write(f"data: {json.dumps(event)}\n\n".encode('utf-8'))
+                if finished:
+                    self.wfile.write(f"event: done\ndata: {json.dumps(job.describe())}\n\n".encode('utf-8'))
+                    return
+                self.wfile.flush()
+                time.sleep(0.5)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='HTTP service voor de FLL Tournament Scheduler')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Adres om op te luisteren')
+    parser.add_argument('--port', type=int, default=8765, help='Poort')
+    parser.add_argument('--time', type=float, default=None,
+                        help='Maximale oplostijd per schema (standaard MAX_SOLVE_TIME uit config.py)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Aantal schema\'s tegelijk (standaard: CPUs / --workers-per-job)')
+    parser.add_argument('--workers-per-job', type=int, default=None,
+                        help='CP-SAT workers per schema (standaard: CPUs / --jobs)')
+    parser.add_argument('--cache', type=str, default=None,
+                        help='Map voor de resultaat cache (standaard RESULT_CACHE_DIR uit config.py)')
+    parser.add_argument('--keep-jobs', type=int, default=100,
+                        help='Aantal afgeronde jobs (met schema) dat bewaard blijft (standaard 100)')
+    parser.add_argument('--allow-origin', action='append', default=None,
+                        help='Origin die de service vanuit de browser mag aanroepen, herhaalbaar; '
+                             f'"*" voor alle origins (standaard {DOCS_ORIGIN})')
+    parser.add_argument('--quiet', action='store_true', help='Geen log regel per HTTP aanvraag')
+    args = parser.parse_args(argv)
+
+    import config
+    max_time = args.time if args.time is not None else config.MAX_SOLVE_TIME
+    cache_dir = args.cache if args.cache is not None else config.RESULT_CACHE_DIR
+
+    # CPUs verdelen over gelijktijdige jobs en de CP-SAT workers binnen een job (zoals de sweep)
+    cpus = available_cpus()
+    if args.jobs is None and args.workers_per_job is None:
+        workers_per_job = min(8, cpus)
+        jobs = max(1, cpus // workers_per_job)
+    elif args.jobs is None:
+        workers_per_job = args.workers_per_job
+        jobs = max(1, cpus // workers_per_job)
+    else:
+        jobs = args.jobs
+        workers_per_job = args.workers_per_job or max(1, cpus // jobs)
+
+    ScheduleRequestHandler.queue = JobQueue(jobs, workers_per_job, max_time, cache_dir, args.keep_jobs)
+    ScheduleRequestHandler.quiet = args.quiet
+    ScheduleRequestHandler.allowed_origins = tuple(args.allow_origin or (DOCS_ORIGIN,))
+    server = ThreadingHTTPServer((args.host, args.port), ScheduleRequestHandler)
+    print(f"🌐 Schedule service op http://{args.host}:{args.port} "
+          f"({jobs} tegelijk × {workers_per_job} workers, max {max_time:g}s per schema)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        ScheduleRequestHandler.queue.shutdown()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Parameter sweep voor de FLL Tournament Scheduler
+Probeert alle combinaties van teams, tafels, jury rooms, buffer tijd en eind tijd
+parallel uit en schrijft per combinatie haalbaarheid, doelwaarde en oplostijd weg.
+
+Gebruik:
+    python sweep.py --num-tables 6,8 --num-jury-rooms 5:7 --end-time 252,280 --output sweep.csv
+    python run_scheduler_with_params.py sweep --num-teams 30,40 --buffer-time 14,21
+"""
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from cpus import available_cpus
+from schedule_stats import analyze_schedule
+
+
+# CLI optie -> config naam
+SWEEP_PARAMETERS = {
+    'num_teams': 'NUM_TEAMS',
+    'num_tables': 'NUM_TABLES',
+    'num_jury_rooms': 'NUM_JURY_ROOMS',
+    'buffer_time': 'MINIMUM_BUFFER_TIME',
+    'end_time': 'END_TIME',
+    'num_timeslots': 'NUM_TIMESLOTS',
+}
+
+
+def parse_values(text):
+    """'6,8' -> [6, 8], '5:7' -> [5, 6, 7], '30:40:5' -> [30, 35, 40], 'none' -> [None]"""
+    values = []
+    for part in text.split(','):
+        part = part.strip()
+        if part.lower() == 'none':
+            values.append(None)
+        elif ':' in part:
+            bounds = [int(value) for value in part.split(':')]
+            start, stop = bounds[0], bounds[1]
+            step = bounds[2] if len(bounds) > 2 else 1
+            values.extend(range(start, stop + 1, step))
+        else:
+            values.append(int(part))
+    return values
+
+
+def run_sweep_job(settings, max_time, num_workers, mode):
+    """Lost 1 combinatie op in een worker proces (dat warm blijft voor de volgende combinatie)"""
+    from ortools.sat.python import cp_model
+    from scheduler import Scheduler, SchedulerConfig
+
+    overrides = dict(settings, MAX_SOLVE_TIME=max_time, NUM_SEARCH_WORKERS=num_workers)
+    if mode is not None:
+        overrides['SCHEDULER_MODE'] = mode
+
+    start = time.perf_counter()
+    result, output = Scheduler(SchedulerConfig.from_config(overrides), quiet=True).run()
+    elapsed = time.perf_counter() - start
+    stats = analyze_schedule(output) if result is not None else None
+
+    if result is None:
+        return failed_row(settings, 'GEEN OPLOSSING', round(elapsed, 2))
+
+    row = {name: value for name, value in settings.items()}
+    row.update({
+        'feasible': True,
+        'status': 'OPTIMAL' if result['status'] == cp_model.OPTIMAL else 'FEASIBLE',
+        'objective': result['objective_value'],
+        'solveTime': round(result['solve_time'], 2),
+        'totalTime': round(elapsed, 2),
+        'avgIdleTime': stats['idleTime']['avg'],
+        'maxIdleTime': stats['idleTime']['max'],
+        'opponentDiversity': stats['opponentDiversity'],
+        'minJuryMatchGap': stats['juryMatchGap']['min'],
+    })
+    return row
+
+
+def failed_row(settings, status, total_time):
+    """Rij voor een combinatie zonder schema (geen oplossing, of een fout in de job)"""
+    row = {name: value for name, value in settings.items()}
+    row.update({'feasible': False, 'status': status, 'objective': None,
+                'solveTime': None, 'totalTime': total_time, 'avgIdleTime': None,
+                'maxIdleTime': None, 'opponentDiversity': None, 'minJuryMatchGap': None})
+    return row
+
+
+def write_rows(rows, filename):
+    """Schrijf de resultaten als CSV of JSON (op basis van de extensie)"""
+    if filename.endswith('.json'):
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2)
+    else:
+        with open(filename, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+    print(f"💾 Sweep resultaten opgeslagen als: {filename}")
+
+
+def print_rows(rows, names):
+    """Print de resultaten, haalbare combinaties eerst (laagste doelwaarde bovenaan)"""
+    print("\n📋 SWEEP RESULTATEN")
+    print("=" * 90)
+    header = " ".join(f"{name:>14}" for name in names)
+    print(f"{header} {'Status':>15} {'Doel':>12} {'Tijd':>8}")
+    print("-" * 90)
+    ordered = sorted(rows, key=lambda row: (not row['feasible'], row['objective'] or 0))
+    for row in ordered:
+        values = " ".join(f"{str(row[name]):>14}" for name in names)
+        objective = f"{row['objective']:,}" if row['objective'] is not None else '-'
+        total_time = f"{row['totalTime']:.1f}s" if row['totalTime'] is not None else '-'
+        print(f"{values} {row['status']:>15} {objective:>12} {total_time:>8}")
+    print("=" * 90)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Parameter sweep voor de FLL Tournament Scheduler')
+    parser.add_argument('--num-teams', type=str, help='Aantal teams, bijv. 30,40 of 30:40:5')
+    parser.add_argument('--num-tables', type=str, help='Aantal tafels, bijv. 6,8')
+    parser.add_argument('--num-jury-rooms', type=str, help='Aantal jury rooms, bijv. 5:8')
+    parser.add_argument('--buffer-time', type=str, help='Buffer tijd in minuten, bijv. 14,21')
+    parser.add_argument('--end-time', type=str, help='Eind tijd in minuten vanaf start, bijv. 252,280,none')
+    parser.add_argument('--num-timeslots', type=str, help='Aantal tijdsloten, bijv. 40,50')
+    parser.add_argument('--mode', choices=['monolithic', 'decomposed', 'rolling', 'greedy'], help='Planning methode')
+    parser.add_argument('--time', type=float, default=60, help='Maximale oplostijd per combinatie (seconden)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Aantal combinaties tegelijk (standaard: CPUs / --workers-per-job)')
+    parser.add_argument('--workers-per-job', type=int, default=None,
+                        help='CP-SAT workers per combinatie (standaard: CPUs / --jobs)')
+    parser.add_argument('--output', type=str, default='sweep.csv', help='Resultaten bestand (.csv of .json)')
+    args = parser.parse_args(argv)
+
+    import config
+    swept = {}
+    for option, name in SWEEP_PARAMETERS.items():
+        text = getattr(args, option)
+        swept[name] = parse_values(text) if text is not None else [getattr(config, name)]
+    names = list(swept)
+    combinations = [dict(zip(names, values)) for values in itertools.product(*swept.values())]
+
+    # CPUs verdelen over gelijktijdige jobs en de CP-SAT workers binnen een job
+    cpus = available_cpus()
+    if args.jobs is None and args.workers_per_job is None:
+        workers_per_job = min(8, cpus)
+        jobs = max(1, cpus // workers_per_job)
+    elif args.jobs is None:
+        workers_per_job = args.workers_per_job
+        jobs = max(1, cpus // workers_per_job)
+    else:
+        jobs = args.jobs
+        workers_per_job = args.workers_per_job or max(1, cpus // jobs)
+    jobs = min(jobs, len(combinations))
+
+    print(f"🧪 Sweep: {len(combinations)} combinaties, {jobs} tegelijk × {workers_per_job} workers "
+          f"({cpus} CPUs), max {args.time:g}s per combinatie")
+
+    # Workers blijven warm (ortools al geladen); elke job krijgt zijn eigen SchedulerConfig
+    context = multiprocessing.get_context('spawn')
+    rows = [None] * len(combinations)
+    done = 0
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as executor:
+        futures = {executor.submit(run_sweep_job, settings, args.time, workers_per_job, args.mode): position
+                   for position, settings in enumerate(combinations)}
+        for future in as_completed(futures):
+            position = futures[future]
+            try:
+                row = future.result()
+            except Exception as error:
+                # 1 mislukte combinatie (of gecrashte worker) stopt de rest van de sweep niet
+                print(f"   ⚠️  Fout bij {combinations[position]}: {error!r}")
+                row = failed_row(combinations[position], f"FOUT: {type(error).__name__}", None)
+            # Volgorde van de combinaties aanhouden in het bestand
+            rows[position] = row
+            done += 1
+            label = ", ".join(f"{name}={row[name]}" for name in names if len(swept[name]) > 1)
+            icon = '✅' if row['feasible'] else '❌'
+            print(f"   {icon} [{done}/{len(combinations)}] {label or 'basis configuratie'}: {row['status']}")
+
+    print_rows(rows, [name for name in names if len(swept[name]) > 1] or names)
+    write_rows(rows, args.output)
+    return rows
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -2,69 +2,135 @@
 """
 Test script voor FLL Tournament Scheduler
 Controleert of alle constraints in het gegenereerde schema worden nageleefd.
+
+Het schema wordt 1 keer omgezet naar NumPy arrays (1 rij per match of jury sessie);
+alle tests werken op die arrays: 1 keer sorteren en aangrenzende intervallen vergelijken
+in plaats van geneste loops over alle paren.
+
+Het verwachte aantal matches en jury sessies per team en de minimale buffer komen uit
+config.py, of uit --matches, --jury-sessions en --buffer.
+
+Gebruik:
+    python test_schedule.py schedule-complete-*.json
+    python test_schedule.py --buffer 14 schedule-complete-*.json
+    python test_schedule.py --batch sweep-schemas/ [--jobs 8]   # 1 JSON rapport per schema
 """
 
+import argparse
+import contextlib
+import io
 import json
+import os
 import sys
-from collections import defaultdict
-
-
-def load_schedule(filename):
-    """Laad schedule JSON bestand"""
-    with open(filename, 'r') as f:
-        return json.load(f)
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import config
+from schedule_format import load_schedule
+
+# Tafel paren (0-indexed)
+TABLE_PAIRS = [(0, 1), (2, 3), (4, 5)]
+
+
+def _column(items, value):
+    return np.fromiter((value(item) for item in items), dtype=np.int64, count=len(items))
+
+
+def _allocations(allocations, slots, resource_key):
+    """Toewijzingen -> (team, start, eind, resource) arrays; onbekende tijdslot ids vallen weg"""
+    slot_ids = _column(slots, lambda slot: slot['id'])
+    start = _column(slots, lambda slot: slot['startTime'])
+    end = _column(slots, lambda slot: slot['endTime'])
+    resource = _column(slots, lambda slot: slot[resource_key]['id'])
+
+    # tijdslot id -> rij (-1 = onbekend id)
+    row = np.full(int(slot_ids.max()) + 1 if len(slot_ids) else 0, -1, dtype=np.int64)
+    row[slot_ids] = np.arange(len(slot_ids))
+
+    team = _column(allocations, lambda alloc: alloc['team']['id'])
+    slot = _column(allocations, lambda alloc: alloc['timeslot']['id'])
+    known = (slot >= 0) & (slot < len(row))
+    known[known] = row[slot[known]] >= 0
+    rows = row[slot[known]]
+    return team[known], start[rows], end[rows], resource[rows]
+
+
+class ScheduleArrays:
+    """Een schema als NumPy arrays: 1 rij per match en 1 rij per jury sessie
+
+    Met de eisen waartegen het getest wordt (standaard de waarden uit config.py).
+    """
+
+    def __init__(self, data, matches_per_team=None, jury_sessions_per_team=None, buffer_time=None):
+        self.matches_per_team = matches_per_team if matches_per_team is not None else config.MATCHES_PER_TEAM
+        self.jury_sessions_per_team = (jury_sessions_per_team if jury_sessions_per_team is not None
+                                       else config.JURY_SESSIONS_PER_TEAM)
+        self.buffer_time = buffer_time if buffer_time is not None else config.MINIMUM_BUFFER_TIME
+        self.num_teams = len(data['teamList'])
+        self.match_team, self.match_start, self.match_end, self.match_table = _allocations(
+            data['teamTableAllocationList'], data['tableTimeslotList'], 'table')
+        self.jury_team, self.jury_start, self.jury_end, self.jury_room = _allocations(
+            data['teamJuryAllocationList'], data['juryTimeslotList'], 'jury')
+
+
+def find_overlaps(resource, start, end, owner, max_examples=2):
+    """Overlappende intervallen per resource (tafel of jury room)
+
+    Sorteert 1 keer op (resource, start, eind, eigenaar). Omdat de starttijden dan
+    oplopen, overlapt interval i precies met de volgende intervallen op dezelfde resource
+    die starten voor het einde van i: dat aantal volgt uit 1 searchsorted over alle
+    intervallen. Geeft per resource het aantal overlappende paren en de eerste
+    max_examples paren terug, elk interval als (eigenaar, start, eind).
+    """
+    counts, examples = {}, {}
+    if len(start) < 2:
+        return counts, examples
+    order = np.lexsort((owner, end, start, resource))
+    resource, start, end, owner = resource[order], start[order], end[order], owner[order]
+
+    # Verschuif elke resource naar een eigen tijdsbereik: 1 gesorteerde array voor alle resources
+    offset = (resource - resource.min()) * (int(end.max()) - int(start.min()) + 1)
+    later_overlaps = np.searchsorted(start + offset, end + offset, side='left') - np.arange(1, len(start) + 1)
+
+    for i in np.nonzero(later_overlaps > 0)[0].tolist():
+        resource_id = int(resource[i])
+        counts[resource_id] = counts.get(resource_id, 0) + int(later_overlaps[i])
+        found = examples.setdefault(resource_id, [])
+        for j in range(i + 1, i + 1 + int(later_overlaps[i])):
+            if len(found) >= max_examples:
+                break
+            found.append(((int(owner[i]), int(start[i]), int(end[i])),
+                          (int(owner[j]), int(start[j]), int(end[j]))))
+    return counts, examples
+
+
+def print_resource_overlaps(label, noun, resource, overlaps, show_more):
+    """Print per tafel/jury room het aantal activiteiten en de eerste 2 overlaps"""
+    overlap_counts, examples = overlaps
+    resources, counts = np.unique(resource, return_counts=True)
+    for resource_id, count in zip(resources.tolist(), counts.tolist()):
+        num_overlaps = overlap_counts.get(resource_id, 0)
+        if num_overlaps:
+            print(f'  ❌ {label} {resource_id}: {count} {noun}, {num_overlaps} OVERLAPS')
+            for (team1, s1_start, s1_end), (team2, s2_start, s2_end) in examples[resource_id]:
+                print(f'     Team {team1} ({s1_start}-{s1_end}) ↔ Team {team2} ({s2_start}-{s2_end})')
+            if show_more and num_overlaps > 2:
+                print(f'     ... +{num_overlaps - 2} meer')
+        else:
+            print(f'  ✅ {label} {resource_id}: {count} {noun}')
 
 
-def test_jury_room_overlaps(data):
+def test_jury_room_overlaps(schedule):
     """Test of jury rooms geen overlappende sessies hebben"""
     print("\n🔍 Test: Jury Room Overlaps")
     print("-" * 60)
-    
-    # Build timeslot -> (start, end, jury_room) mapping
-    timeslot_info = {}
-    for ts in data['juryTimeslotList']:
-        ts_id = ts['id']
-        jury_room = ts['jury']['id']
-        start = ts['startTime']
-        end = ts['endTime']
-        timeslot_info[ts_id] = (start, end, jury_room)
-
-    # Build jury_room -> [(start, end, team)] mapping
-    jury_schedule = defaultdict(list)
-    for allocation in data['teamJuryAllocationList']:
-        team = allocation['team']['id']
-        ts_id = allocation['timeslot']['id']
-        if ts_id in timeslot_info:
-            start, end, jury_room = timeslot_info[ts_id]
-            jury_schedule[jury_room].append((start, end, team))
-
-    # Check overlaps
-    overlap_found = False
-    total_overlaps = 0
-    
-    for jury_room, sessions in sorted(jury_schedule.items()):
-        sessions_sorted = sorted(sessions)
-        overlaps = []
-        
-        for i in range(len(sessions_sorted)):
-            for j in range(i+1, len(sessions_sorted)):
-                s1_start, s1_end, team1 = sessions_sorted[i]
-                s2_start, s2_end, team2 = sessions_sorted[j]
-                if s1_end > s2_start:
-                    overlaps.append(f'Team {team1} ({s1_start}-{s1_end}) ↔ Team {team2} ({s2_start}-{s2_end})')
-                    overlap_found = True
-                    total_overlaps += 1
-        
-        if overlaps:
-            print(f'  ❌ Jury Room {jury_room}: {len(sessions_sorted)} teams, {len(overlaps)} OVERLAPS')
-            for overlap in overlaps[:2]:
-                print(f'     {overlap}')
-            if len(overlaps) > 2:
-                print(f'     ... +{len(overlaps) - 2} meer')
-        else:
-            print(f'  ✅ Jury Room {jury_room}: {len(sessions_sorted)} teams')
 
-    if not overlap_found:
+    overlaps = find_overlaps(schedule.jury_room, schedule.jury_start, schedule.jury_end, schedule.jury_team)
+    print_resource_overlaps('Jury Room', 'teams', schedule.jury_room, overlaps, show_more=True)
+
+    total_overlaps = sum(overlaps[0].values())
+    if total_overlaps == 0:
         print(f'\n  ✅ PASSED: Geen jury room overlaps')
         return True
     else:
@@ -72,62 +138,31 @@ def test_jury_room_overlaps(data):
         return False
 
 
-def test_team_constraints(data):
+def test_team_constraints(schedule):
     """Test of teams de juiste aantal activiteiten hebben met goede buffers"""
     print("\n🔍 Test: Team Constraints")
     print("-" * 60)
-    
-    # Build team activities
-    team_activities = {}
-    for team_data in data['teamList']:
-        team_id = team_data['id']
-        team_activities[team_id] = []
-
-    # Add matches
-    for alloc in data['teamTableAllocationList']:
-        team = alloc['team']['id']
-        ts_id = alloc['timeslot']['id']
-        ts_data = next(t for t in data['tableTimeslotList'] if t['id'] == ts_id)
-        start = ts_data['startTime']
-        end = ts_data['endTime']
-        table = ts_data['table']['id']
-        team_activities[team].append(('match', start, end, table))
-
-    # Add jury sessions
-    timeslot_info = {}
-    for ts in data['juryTimeslotList']:
-        timeslot_info[ts['id']] = (ts['startTime'], ts['endTime'], ts['jury']['id'])
-    
-    for alloc in data['teamJuryAllocationList']:
-        team = alloc['team']['id']
-        ts_id = alloc['timeslot']['id']
-        if ts_id in timeslot_info:
-            start, end, jury_room = timeslot_info[ts_id]
-            team_activities[team].append(('jury', start, end, jury_room))
-
-    # Check constraints
+
+    # Check activity count
+    match_counts = np.bincount(schedule.match_team, minlength=schedule.num_teams)
+    jury_counts = np.bincount(schedule.jury_team, minlength=schedule.num_teams)
+    matches, jury_sessions = schedule.matches_per_team, schedule.jury_sessions_per_team
     violations = []
-    buffer_violations = []
-    
-    for team, activities in sorted(team_activities.items()):
-        activities.sort(key=lambda x: x[1])
-        
-        # Check activity count
-        matches = [a for a in activities if a[0] == 'match']
-        jury_sessions = [a for a in activities if a[0] == 'jury']
-        
-        if len(matches) != 4:
-            violations.append(f'Team {team}: {len(matches)} matches (verwacht: 4)')
-        if len(jury_sessions) != 1:
-            violations.append(f'Team {team}: {len(jury_sessions)} jury sessies (verwacht: 1)')
-        
-        # Check buffers
-        for i in range(len(activities) - 1):
-            _, _, end1, _ = activities[i]
-            _, start2, _, _ = activities[i + 1]
-            gap = start2 - end1
-            if gap < 30:
-                buffer_violations.append(f'Team {team}: buffer van {gap} min tussen activiteiten')
+    for team in range(schedule.num_teams):
+        if match_counts[team] != matches:
+            violations.append(f'Team {team}: {match_counts[team]} matches (verwacht: {matches})')
+        if jury_counts[team] != jury_sessions:
+            violations.append(f'Team {team}: {jury_counts[team]} jury sessies (verwacht: {jury_sessions})')
+
+    # Check buffers: alle activiteiten per team op volgorde, start volgende - einde vorige
+    team = np.concatenate([schedule.match_team, schedule.jury_team])
+    start = np.concatenate([schedule.match_start, schedule.jury_start])
+    end = np.concatenate([schedule.match_end, schedule.jury_end])
+    order = np.lexsort((start, team))
+    team, start, end = team[order], start[order], end[order]
+    gaps = start[1:] - end[:-1]
+    too_short = np.nonzero((team[1:] == team[:-1]) & (gaps < schedule.buffer_time))[0]
+    buffer_violations = [f'Team {team[k]}: buffer van {gaps[k]} min tussen activiteiten' for k in too_short]
 
     # Print results
     if violations:
@@ -137,8 +172,8 @@ def test_team_constraints(data):
         if len(violations) > 5:
             print(f'     ... +{len(violations) - 5} meer')
     else:
-        print(f'  ✅ Alle teams: 4 matches + 1 jury sessie')
-    
+        print(f'  ✅ Alle teams: {matches} matches + {jury_sessions} jury sessie(s)')
+
     if buffer_violations:
         print(f'  ❌ Buffer violations:')
         for v in buffer_violations[:5]:
@@ -146,59 +181,27 @@ def test_team_constraints(data):
         if len(buffer_violations) > 5:
             print(f'     ... +{len(buffer_violations) - 5} meer')
     else:
-        print(f'  ✅ Alle buffers: minimaal 30 minuten')
-    
+        print(f'  ✅ Alle buffers: minimaal {schedule.buffer_time} minuten')
+
     passed = len(violations) == 0 and len(buffer_violations) == 0
     if passed:
         print(f'\n  ✅ PASSED: Alle team constraints OK')
     else:
         print(f'\n  ❌ FAILED: {len(violations) + len(buffer_violations)} violations')
-    
+
     return passed
 
 
-def test_table_overlaps(data):
+def test_table_overlaps(schedule):
     """Test of tafels geen overlappende matches hebben"""
     print("\n🔍 Test: Table Overlaps")
     print("-" * 60)
-    
-    # Build table -> [(start, end, team)] mapping
-    table_schedule = defaultdict(list)
-    
-    for alloc in data['teamTableAllocationList']:
-        team = alloc['team']['id']
-        ts_id = alloc['timeslot']['id']
-        ts_data = next(t for t in data['tableTimeslotList'] if t['id'] == ts_id)
-        start = ts_data['startTime']
-        end = ts_data['endTime']
-        table = ts_data['table']['id']
-        table_schedule[table].append((start, end, team))
-
-    # Check overlaps
-    overlap_found = False
-    total_overlaps = 0
-    
-    for table, matches in sorted(table_schedule.items()):
-        matches_sorted = sorted(matches)
-        overlaps = []
-        
-        for i in range(len(matches_sorted)):
-            for j in range(i+1, len(matches_sorted)):
-                m1_start, m1_end, team1 = matches_sorted[i]
-                m2_start, m2_end, team2 = matches_sorted[j]
-                if m1_end > m2_start:
-                    overlaps.append(f'Team {team1} ({m1_start}-{m1_end}) ↔ Team {team2} ({m2_start}-{m2_end})')
-                    overlap_found = True
-                    total_overlaps += 1
-        
-        if overlaps:
-            print(f'  ❌ Tafel {table}: {len(matches_sorted)} matches, {len(overlaps)} OVERLAPS')
-            for overlap in overlaps[:2]:
-                print(f'     {overlap}')
-        else:
-            print(f'  ✅ Tafel {table}: {len(matches_sorted)} matches')
 
-    if not overlap_found:
+    overlaps = find_overlaps(schedule.match_table, schedule.match_start, schedule.match_end, schedule.match_team)
+    print_resource_overlaps('Tafel', 'matches', schedule.match_table, overlaps, show_more=False)
+
+    total_overlaps = sum(overlaps[0].values())
+    if total_overlaps == 0:
         print(f'\n  ✅ PASSED: Geen tafel overlaps')
         return True
     else:
@@ -206,68 +209,46 @@ def test_table_overlaps(data):
         return False
 
 
-def test_team_table_preference(data):
+def test_team_table_preference(schedule):
     """Test hoeveel teams op 1 of 2 tafels spelen (soft constraint)"""
     print("\n🔍 Test: Team Table Preference (soft)")
     print("-" * 60)
-    
-    team_tables = defaultdict(set)
-    
-    for alloc in data['teamTableAllocationList']:
-        team = alloc['team']['id']
-        ts_id = alloc['timeslot']['id']
-        ts_data = next(t for t in data['tableTimeslotList'] if t['id'] == ts_id)
-        table = ts_data['table']['id']
-        team_tables[team].add(table)
-    
-    teams_1_table = sum(1 for tables in team_tables.values() if len(tables) == 1)
-    teams_2_tables = sum(1 for tables in team_tables.values() if len(tables) == 2)
-    teams_more = sum(1 for tables in team_tables.values() if len(tables) > 2)
-    
+
+    # Unieke (team, tafel) combinaties -> aantal tafels per team
+    team_tables = np.unique(np.stack([schedule.match_team, schedule.match_table]), axis=1)
+    _, tables_per_team = np.unique(team_tables[0], return_counts=True)
+
+    teams_1_table = int(np.sum(tables_per_team == 1))
+    teams_2_tables = int(np.sum(tables_per_team == 2))
+    teams_more = int(np.sum(tables_per_team > 2))
+
     print(f'  Teams op 1 tafel: {teams_1_table}')
     print(f'  Teams op 2 tafels: {teams_2_tables}')
     if teams_more > 0:
         print(f'  Teams op 3+ tafels: {teams_more}')
-    
+
     print(f'\n  ✅ INFO: Soft constraint (geen pass/fail)')
     return True
 
 
-def test_jury_synchronized_rounds(data):
+def test_jury_synchronized_rounds(schedule):
     """Test of jury sessies in gesynchroniseerde rondes beginnen"""
     print("\n🔍 Test: Jury Synchronized Rounds")
     print("-" * 60)
-    
-    # Build timeslot -> (start, end, jury_room) mapping
-    timeslot_info = {}
-    for ts in data['juryTimeslotList']:
-        ts_id = ts['id']
-        jury_room = ts['jury']['id']
-        start = ts['startTime']
-        end = ts['endTime']
-        timeslot_info[ts_id] = (start, end, jury_room)
-
-    # Build start_time -> [teams] mapping
-    jury_start_times = defaultdict(list)
-    for allocation in data['teamJuryAllocationList']:
-        team = allocation['team']['id']
-        ts_id = allocation['timeslot']['id']
-        if ts_id in timeslot_info:
-            start, end, jury_room = timeslot_info[ts_id]
-            jury_start_times[start].append((team, jury_room))
+
+    round_starts, teams_per_round = np.unique(schedule.jury_start, return_counts=True)
 
     # Print jury rondes
-    num_rounds = len(jury_start_times)
+    num_rounds = len(round_starts)
     print(f'  Aantal jury rondes: {num_rounds}')
-    
-    for start_time in sorted(jury_start_times.keys()):
-        teams_in_round = jury_start_times[start_time]
-        print(f'  Ronde @ {start_time} min: {len(teams_in_round)} teams')
-    
+
+    for start_time, teams_in_round in zip(round_starts.tolist(), teams_per_round.tolist()):
+        print(f'  Ronde @ {start_time} min: {teams_in_round} teams')
+
     # Check: alle teams moeten in een ronde zitten
-    total_teams_in_rounds = sum(len(teams) for teams in jury_start_times.values())
-    num_teams = len(data['teamList'])
-    
+    total_teams_in_rounds = int(teams_per_round.sum())
+    num_teams = schedule.num_teams
+
     if total_teams_in_rounds == num_teams:
         print(f'\n  ✅ PASSED: Alle {num_teams} teams in {num_rounds} gesynchroniseerde rondes')
         return True
@@ -276,90 +257,65 @@ def test_jury_synchronized_rounds(data):
         return False
 
 
-def test_table_pairs(data):
+def test_table_pairs(schedule):
     """Test of tafel paren (soft constraint) goed worden gebruikt"""
     print("\n🔍 Test: Table Pairs (soft)")
     print("-" * 60)
-    
-    # Tafel paren (0-indexed)
-    TABLE_PAIRS = [(0, 1), (2, 3), (4, 5)]
-    
-    # Build tijdslot -> tafels in gebruik
-    timeslot_tables = defaultdict(set)
-    
-    for alloc in data['teamTableAllocationList']:
-        ts_id = alloc['timeslot']['id']
-        ts_data = next(t for t in data['tableTimeslotList'] if t['id'] == ts_id)
-        table = ts_data['table']['id']
-        start = ts_data['startTime']
-        timeslot_tables[start].add(table)
-    
-    # Check voor elk tijdslot de paren
-    matched = 0
-    mismatched = 0
-    
-    for start_time in sorted(timeslot_tables.keys()):
-        tables = timeslot_tables[start_time]
-        
-        for t1, t2 in TABLE_PAIRS:
-            t1_used = t1 in tables
-            t2_used = t2 in tables
-            
-            if (t1_used and t2_used) or (not t1_used and not t2_used):
-                matched += 1
-            else:
-                mismatched += 1
-    
+
+    # Bezetting per (tijdslot met matches, tafel)
+    starts, start_index = np.unique(schedule.match_start, return_inverse=True)
+    num_tables = max(max(pair) for pair in TABLE_PAIRS) + 1
+    in_range = schedule.match_table < num_tables
+    used = np.zeros((len(starts), num_tables), dtype=bool)
+    used[start_index[in_range], schedule.match_table[in_range]] = True
+
+    # Check voor elk tijdslot de paren: beide bezet of beide leeg
+    first, second = np.array(TABLE_PAIRS).T
+    same = used[:, first] == used[:, second]
+    matched = int(same.sum())
+    mismatched = int(same.size) - matched
+
     total = matched + mismatched
     percentage = (matched / total * 100) if total > 0 else 0
-    
+
     print(f'  Tafel paren: (1,2), (3,4), (5,6)')
     print(f'  Beide bezet OF beide leeg: {matched}/{total} ({percentage:.1f}%)')
     print(f'  Slechts 1 van paar bezet: {mismatched}/{total} ({100-percentage:.1f}%)')
-    
+
     print(f'\n  ✅ INFO: Soft constraint (geen pass/fail)')
     return True
 
 
-def test_unique_opponents(data):
+def test_unique_opponents(schedule):
     """Test of teams maximaal 1 keer tegen elkaar spelen"""
     print("\n🔍 Test: Unique Opponents")
     print("-" * 60)
-    
-    # Build tafel paren
-    TABLE_PAIRS = [(0, 1), (2, 3), (4, 5)]
-    
-    # Voor elk tijdslot, groepeer teams per tafel paar
-    timeslot_pairs = defaultdict(lambda: defaultdict(list))
-    
-    for alloc in data['teamTableAllocationList']:
-        team = alloc['team']['id']
-        ts_id = alloc['timeslot']['id']
-        ts_data = next(t for t in data['tableTimeslotList'] if t['id'] == ts_id)
-        table = ts_data['table']['id']
-        start_time = ts_data['startTime']
-        
-        # Check welk tafel paar deze tafel bij hoort
-        for pair_idx, (t1, t2) in enumerate(TABLE_PAIRS):
-            if table in (t1, t2):
-                timeslot_pairs[start_time][pair_idx].append((team, table))
-                break
-    
+
+    # Tafel -> tafel paar (-1 = tafel hoort bij geen paar)
+    num_tables = max(int(schedule.match_table.max(initial=0)), max(max(pair) for pair in TABLE_PAIRS)) + 1
+    table_pair = np.full(num_tables, -1, dtype=np.int64)
+    for pair_idx, (t1, t2) in enumerate(TABLE_PAIRS):
+        table_pair[[t1, t2]] = pair_idx
+    pair = table_pair[schedule.match_table]
+    on_pair = pair >= 0
+
+    # Groepeer matches per (starttijd, tafel paar); een groep van precies 2 teams is een matchup
+    team, start, pair = schedule.match_team[on_pair], schedule.match_start[on_pair], pair[on_pair]
+    order = np.lexsort((team, pair, start))
+    team, start, pair = team[order], start[order], pair[order]
+    _, group_first, group_size = np.unique(np.stack([start, pair]), axis=1,
+                                           return_index=True, return_counts=True)
+    games = group_first[group_size == 2]
+
     # Count matchups
-    matchups = defaultdict(int)
-    
-    for start_time, pairs in timeslot_pairs.items():
-        for pair_idx, teams_on_pair in pairs.items():
-            if len(teams_on_pair) == 2:
-                (team1, table1), (team2, table2) = teams_on_pair
-                team_pair = tuple(sorted([team1, team2]))
-                matchups[team_pair] += 1
-    
+    matchups, counts = np.unique(np.stack([team[games], team[games + 1]], axis=1), axis=0,
+                                 return_counts=True)
+
     # Check violations
-    violations = [(pair, count) for pair, count in matchups.items() if count > 1]
-    
+    violations = [(tuple(matchup), int(count)) for matchup, count in zip(matchups.tolist(), counts) if count > 1]
+
     print(f'  Totaal unieke matchups: {len(matchups)}')
-    
+
     if violations:
         print(f'  ❌ {len(violations)} team paren spelen meer dan 1x tegen elkaar:')
         for (t1, t2), count in sorted(violations, key=lambda x: -x[1])[:5]:
@@ -374,18 +330,127 @@ def test_unique_opponents(data):
         return True
 
 
+TESTS = [
+    ("Table Overlaps", test_table_overlaps),
+    ("Jury Room Overlaps", test_jury_room_overlaps),
+    ("Team Constraints", test_team_constraints),
+    ("Jury Synchronized Rounds", test_jury_synchronized_rounds),
+    ("Unique Opponents", test_unique_opponents),
+    ("Table Preference", test_team_table_preference),
+    ("Table Pairs", test_table_pairs),
+]
+
+
+def run_tests(data, **requirements):
+    """Voer alle tests uit op een schema; geeft [(naam, geslaagd)] terug
+
+    requirements: matches_per_team, jury_sessions_per_team en buffer_time (zie ScheduleArrays)
+    """
+    schedule = ScheduleArrays(data, **requirements)
+    return [(name, test(schedule)) for name, test in TESTS]
+
+
+def report_filename(filename, report_dir=None):
+    """schema.json -> schema.validation.json (naast het schema of in report_dir)"""
+    base = os.path.basename(filename)
+    if base.endswith('.json'):
+        base = base[:-len('.json')]
+    directory = report_dir if report_dir is not None else os.path.dirname(filename)
+    return os.path.join(directory, f"{base}.validation.json")
+
+
+def validate_file(filename, report_dir=None, requirements=None):
+    """Valideer 1 schema zonder console output en schrijf het JSON rapport"""
+    requirements = requirements or {}
+    report = {'file': filename, 'passed': False, 'requirements': requirements, 'tests': {}, 'error': None}
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = run_tests(load_schedule(filename), **requirements)
+        report['tests'] = {name: bool(result) for name, result in results}
+        report['passed'] = all(report['tests'].values())
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        report['error'] = f"{type(e).__name__}: {e}"
+
+    with open(report_filename(filename, report_dir), 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def schedule_files(directory):
+    """Alle schema's in een map (rapporten en profielen worden overgeslagen)"""
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.endswith('.json') and not name.endswith(('.validation.json', '.profile.json')))
+
+
+def main_batch(directory, jobs=None, report_dir=None, requirements=None):
+    """Valideer alle schema's in een map parallel, met 1 JSON rapport per schema"""
+    files = schedule_files(directory)
+    if not files:
+        print(f"\n❌ ERROR: Geen schema's gevonden in '{directory}'")
+        sys.exit(1)
+    if report_dir is not None:
+        os.makedirs(report_dir, exist_ok=True)
+
+    print("=" * 60)
+    print("🧪 FLL SCHEDULE TESTER (batch)")
+    print("=" * 60)
+    print(f"Map: {directory} ({len(files)} schema's)\n")
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        reports = list(executor.map(validate_file, files, [report_dir] * len(files),
+                                    [requirements] * len(files)))
+
+    for report in reports:
+        if report['error'] is not None:
+            print(f"❌ {report['file']}: {report['error']}")
+        elif report['passed']:
+            print(f"✅ {report['file']}")
+        else:
+            failed_tests = ", ".join(name for name, result in report['tests'].items() if not result)
+            print(f"❌ {report['file']}: {failed_tests}")
+
+    failed = sum(1 for report in reports if not report['passed'])
+    print("=" * 60)
+    if failed == 0:
+        print(f"🎉 ALLE {len(reports)} SCHEMA'S GESLAAGD!")
+        sys.exit(0)
+    else:
+        print(f"⚠️  {failed} van {len(reports)} schema's gefaald")
+        sys.exit(1)
+
+
 def main():
-    if len(sys.argv) < 2:
+    parser = argparse.ArgumentParser(description='Test een gegenereerd FLL schema')
+    parser.add_argument('schedule', nargs='?', help='Schema bestand (JSON)')
+    parser.add_argument('--batch', type=str, help="Valideer alle schema's in deze map")
+    parser.add_argument('--jobs', type=int, help='Aantal parallelle processen bij --batch')
+    parser.add_argument('--report-dir', type=str, help='Map voor de JSON rapporten (standaard: naast elk schema)')
+    parser.add_argument('--matches', type=int, default=config.MATCHES_PER_TEAM,
+                        help=f'Verwacht aantal matches per team (standaard {config.MATCHES_PER_TEAM} uit config.py)')
+    parser.add_argument('--jury-sessions', type=int, default=config.JURY_SESSIONS_PER_TEAM,
+                        help=f'Verwacht aantal jury sessies per team (standaard {config.JURY_SESSIONS_PER_TEAM})')
+    parser.add_argument('--buffer', type=int, default=config.MINIMUM_BUFFER_TIME,
+                        help='Minimale buffer tussen activiteiten in minuten '
+                             f'(standaard {config.MINIMUM_BUFFER_TIME} uit config.py)')
+    args = parser.parse_args()
+    requirements = {'matches_per_team': args.matches, 'jury_sessions_per_team': args.jury_sessions,
+                    'buffer_time': args.buffer}
+
+    if args.batch is not None:
+        main_batch(args.batch, args.jobs, args.report_dir, requirements)
+        return
+
+    if args.schedule is None:
         print("Usage: python test_schedule.py <schedule.json>")
         sys.exit(1)
-    
-    filename = sys.argv[1]
-    
+
+    filename = args.schedule
+
     print("=" * 60)
     print("🧪 FLL SCHEDULE TESTER")
     print("=" * 60)
     print(f"Bestand: {filename}")
-    
+
     try:
         data = load_schedule(filename)
     except FileNotFoundError:
@@ -394,31 +459,24 @@ def main():
     except json.JSONDecodeError as e:
         print(f"\n❌ ERROR: Ongeldig JSON bestand: {e}")
         sys.exit(1)
-    
+
     # Run all tests
-    results = []
-    results.append(("Table Overlaps", test_table_overlaps(data)))
-    results.append(("Jury Room Overlaps", test_jury_room_overlaps(data)))
-    results.append(("Team Constraints", test_team_constraints(data)))
-    results.append(("Jury Synchronized Rounds", test_jury_synchronized_rounds(data)))
-    results.append(("Unique Opponents", test_unique_opponents(data)))
-    results.append(("Table Preference", test_team_table_preference(data)))
-    results.append(("Table Pairs", test_table_pairs(data)))
-    
+    results = run_tests(data, **requirements)
+
     # Summary
     print("\n" + "=" * 60)
     print("📊 SAMENVATTING")
     print("=" * 60)
-    
+
     passed = sum(1 for _, result in results if result)
     total = len(results)
-    
+
     for name, result in results:
         status = "✅ PASSED" if result else "❌ FAILED"
         print(f"{status}: {name}")
-    
+
     print("=" * 60)
-    
+
     if passed == total:
         print("🎉 ALLE TESTS GESLAAGD!")
         sys.exit(0)